@@ -0,0 +1,7 @@
+"""
+Offline benchmarks for the scraper's hot paths.
+
+Run from ``frontend/scripts``::
+
+    python -m benchmarks.run --scales 1 10 100
+"""
@@ -0,0 +1,154 @@
+"""
+Synthetic corpus generator for benchmarks.
+
+Programs, blog posts and job listings are synthesized from the records in
+``frontend/data``. Text, companies, topics and locations are drawn from the seed
+data, then varied with identifiers, HTML markup, dates and star counts, so
+every record is unique. Jobs also include the non-DevRel postings that the
+filters exist to reject. Generation is deterministic for a given seed, so
+results from different runs compare the same corpus.
+"""
+import json
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+# Scraped resource files, as written by DevRelScraper._save_resource_file
+RESOURCE_FILES = {
+    'github_programs': 'github_results.json',
+    'blog_posts': 'blog_results.json',
+    'job_listings': 'job_results.json'
+}
+
+# Non-DevRel titles mixed into candidate jobs so filters reject a realistic share
+DISTRACTOR_TITLES = [
+    'Senior Software Engineer', 'Account Executive', 'Product Manager, Developer Platform',
+    'Solutions Engineer', 'Data Scientist', 'Technical Writer', 'Engineering Manager, Developer Tools',
+    'Customer Success Manager', 'Site Reliability Engineer', 'Marketing Manager', 'Recruiter',
+    'Frontend Engineer', 'Sales Development Representative', 'Platform Engineer'
+]
+
+HTML_WRAPPERS = [
+    '<p>{}</p>',
+    '<div class="content"><p>{}</p><p><a href="https://example.com/more">Read more</a></p></div>',
+    '<p><strong>Summary:</strong> {}</p><ul><li>Remote friendly</li><li>Equity</li></ul>',
+    '<![CDATA[<p>{}</p>]]>',
+    '<p>{}</p><img src="https://example.com/cover.png" alt="cover"/><br/>'
+]
+
+
+def default_seed_dir() -> str:
+    """Get the committed frontend data directory (frontend/data)."""
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'data')
+
+
+def load_seed(seed_dir: Optional[str] = None) -> Dict[str, List[Dict]]:
+    """Load the seed records of every resource type from devrel_resources.json."""
+    with open(os.path.join(seed_dir or default_seed_dir(), 'devrel_resources.json'), 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return {resource_type: data.get(resource_type, []) for resource_type in RESOURCE_FILES}
+
+
+def _date(rng: random.Random, now: datetime, max_days: int) -> str:
+    return (now - timedelta(days=rng.randint(0, max_days))).strftime('%Y-%m-%d')
+
+
+def _html(rng: random.Random, text: str) -> str:
+    return rng.choice(HTML_WRAPPERS).format(text)
+
+
+def synthesize_programs(seed: List[Dict], count: int, rng: random.Random, now: datetime) -> List[Dict]:
+    topics = sorted({topic for program in seed for topic in program.get('topics') or []}) or ['devrel']
+    programs = []
+    for i in range(count):
+        base = seed[i % len(seed)]
+        owner = (base.get('url') or 'https://github.com/devrel/guide').rstrip('/').split('/')[-2]
+        name = f"{base.get('name') or 'repo'}-{i}"
+        programs.append({
+            'name': name,
+            'url': f"https://github.com/{owner}/{name}",
+            'description': base.get('description') or '',
+            'stars': max(0, int((base.get('stars') or 10) * rng.lognormvariate(0, 0.5))),
+            'language': base.get('language'),
+            'topics': rng.sample(topics, min(len(topics), rng.randint(0, 6))),
+            'last_updated': (now - timedelta(days=rng.randint(0, 720))).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'source': 'github',
+            'type': 'repository'
+        })
+    return programs
+
+
+def synthesize_posts(seed: List[Dict], count: int, rng: random.Random, now: datetime) -> List[Dict]:
+    posts = []
+    for i in range(count):
+        base = seed[i % len(seed)]
+        text = base.get('description') or base.get('excerpt') or ''
+        # Roughly a third of general posts mention no DevRel term, so scoring drops them
+        if rng.random() < 0.3:
+            text = text.replace('Developer Relations', 'engineering').replace('DevRel', 'platform')
+        link = base.get('link') or base.get('url') or 'https://example.com/post'
+        posts.append({
+            'title': f"{base.get('title', 'Untitled')} (part {i // len(seed) + 1})",
+            'link': f"{link}?v={i}",
+            'description': _html(rng, text),
+            'date': _date(rng, now, 365),
+            'source': base.get('source', 'example.com'),
+            'type': 'blog_post',
+            'relevance_score': rng.randint(0, 4)
+        })
+    return posts
+
+
+def synthesize_jobs(seed: List[Dict], count: int, rng: random.Random, now: datetime,
+                    distractor_share: float = 0.0) -> List[Dict]:
+    companies = sorted({job.get('company', '') for job in seed if job.get('company')}) or ['Acme']
+    locations = sorted({location for job in seed for location in job.get('locations') or []}) or ['Remote']
+    jobs = []
+    for i in range(count):
+        base = seed[i % len(seed)]
+        title = rng.choice(DISTRACTOR_TITLES) if rng.random() < distractor_share else base.get('title', '')
+        # Every synthetic posting gets its own company, so (company, title) keys stay unique
+        company = companies[i % len(companies)]
+        if i >= len(companies):
+            company = f"{company} {i // len(companies)}"
+        jobs.append({
+            'title': title,
+            'url': f"{base.get('url', 'https://example.com/jobs')}-{i}",
+            'description': _html(rng, base.get('description', '')),
+            'type': 'job_listing',
+            'company': company,
+            'source': base.get('source', 'synthetic'),
+            'date': _date(rng, now, 55),
+            'locations': rng.sample(locations, min(len(locations), rng.randint(1, 3)))
+        })
+    return jobs
+
+
+def generate_corpus(scale: int, seed: Optional[Dict[str, List[Dict]]] = None,
+                    random_seed: int = 42) -> Dict[str, List[Dict]]:
+    """Generate ``scale`` times as many records of each type as the seed data holds.
+
+    Returns:
+        Stored-style records per resource type, plus 'candidate_jobs': raw
+        postings with non-DevRel distractors for the job filters
+    """
+    seed = seed or load_seed()
+    rng = random.Random(random_seed)
+    now = datetime.now()
+    counts = {resource_type: len(records) * scale for resource_type, records in seed.items()}
+    return {
+        'github_programs': synthesize_programs(seed['github_programs'], counts['github_programs'], rng, now),
+        'blog_posts': synthesize_posts(seed['blog_posts'], counts['blog_posts'], rng, now),
+        'job_listings': synthesize_jobs(seed['job_listings'], counts['job_listings'], rng, now),
+        'candidate_jobs': synthesize_jobs(seed['job_listings'], counts['job_listings'], rng, now,
+                                          distractor_share=0.5)
+    }
+
+
+def write_corpus(corpus: Dict[str, List[Dict]], data_dir: str):
+    """Write the stored resource types as scraper result files into a data directory."""
+    os.makedirs(data_dir, exist_ok=True)
+    for resource_type, filename in RESOURCE_FILES.items():
+        with open(os.path.join(data_dir, filename), 'w', encoding='utf-8') as f:
+            json.dump(corpus[resource_type], f, indent=2)
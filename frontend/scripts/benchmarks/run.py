@@ -0,0 +1,324 @@
+"""
+Benchmark runner for the scraper's hot paths.
+
+Each benchmark runs against a synthetic corpus at every requested scale (1x is
+the size of the committed ``frontend/data``), repeating until it has enough
+rounds, and reports the median. Results are written to
+``scripts/data/benchmarks/latest.json`` and compared with ``baseline.json``.
+A benchmark whose median is slower than the baseline by more than the
+threshold is flagged, and the runner exits non-zero.
+
+Usage from ``frontend/scripts``::
+
+    python -m benchmarks.run                      # 1x, 10x and 100x, compare with baseline
+    python -m benchmarks.run --scales 1 --only clean_html score_blog_posts
+    python -m benchmarks.run --save-baseline      # record the current results as the baseline
+"""
+import argparse
+import copy
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from scraper.devrel_scraper import DevRelScraper
+
+from .corpus import generate_corpus, load_seed, write_corpus
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCALES = (1, 10, 100)
+
+# Share of incoming records in merge benchmarks that are new, and that already exist
+INCOMING_NEW_SHARE = 0.1
+INCOMING_EXISTING_SHARE = 0.1
+
+# frontend/scripts, the working directory for CLI subprocesses
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Dependencies only scrapes need; importing the CLI or the scraper module must not load them
+SCRAPE_ONLY_MODULES = ('aiohttp', 'requests', 'feedparser', 'bs4')
+
+
+def default_results_dir() -> str:
+    return os.path.join(DevRelScraper.default_data_dir(), 'benchmarks')
+
+
+class Context:
+    """The corpus of one scale and scratch directories for the benchmarks that run on it."""
+
+    def __init__(self, scale: int, seed: Dict[str, List[Dict]], workdir: str):
+        self.scale = scale
+        self.workdir = workdir
+        self.corpus = generate_corpus(scale, seed)
+        self.corpus_dir = os.path.join(workdir, 'corpus')
+        write_corpus(self.corpus, self.corpus_dir)
+        self.incoming = {
+            resource_type: self._incoming(resource_type, records)
+            for resource_type, records in self.corpus.items() if resource_type != 'candidate_jobs'
+        }
+        self._scratch = 0
+
+    @staticmethod
+    def _incoming(resource_type: str, records: List[Dict]) -> List[Dict]:
+        """Build a scrape result that is part new records and part already stored ones."""
+        new_count = max(1, int(len(records) * INCOMING_NEW_SHARE))
+        existing_count = max(1, int(len(records) * INCOMING_EXISTING_SHARE))
+        incoming = []
+        for record in copy.deepcopy(records[:new_count]):
+            if resource_type == 'github_programs':
+                record['url'] += '-new'
+            elif resource_type == 'blog_posts':
+                record['link'] += '&new=1'
+            else:
+                record['company'] += ' New'
+            incoming.append(record)
+        return incoming + copy.deepcopy(records[-existing_count:])
+
+    def scratch_dir(self) -> str:
+        """Get a fresh, empty data directory."""
+        self._scratch += 1
+        path = os.path.join(self.workdir, f'scratch-{self._scratch}')
+        os.makedirs(path)
+        return path
+
+    def scraper(self, data_dir: Optional[str] = None) -> DevRelScraper:
+        """Get a scraper storing data in ``data_dir`` (a fresh directory by default) with a cold memo."""
+        return DevRelScraper(data_dir=data_dir or self.scratch_dir())
+
+
+@dataclass
+class Benchmark:
+    """A timed operation; ``setup`` prepares untimed state for each round."""
+    name: str
+    run: Callable[[Context, Any], Any]
+    records: Callable[[Context], int]
+    setup: Callable[[Context], Any] = lambda ctx: None
+
+
+def _check_jobs(ctx: Context, scraper: DevRelScraper):
+    for job in ctx.corpus['candidate_jobs']:
+        scraper._is_devrel_job(job['title'], job['description'], job['company'])
+
+
+def _warm_scraper(ctx: Context) -> DevRelScraper:
+    scraper = ctx.scraper()
+    _check_jobs(ctx, scraper)
+    return scraper
+
+
+def _clean_html(ctx: Context, scraper: DevRelScraper):
+    for record in ctx.corpus['blog_posts'] + ctx.corpus['candidate_jobs']:
+        scraper._clean_html(record['description'])
+
+
+def _score_posts(ctx: Context, scraper: DevRelScraper):
+    for post in ctx.corpus['blog_posts']:
+        scraper._score_blog_post(post['title'], post['description'])
+
+
+def _merge_setup(resource_type: str) -> Callable[[Context], Any]:
+    def setup(ctx: Context):
+        scraper = ctx.scraper()
+        existing = copy.deepcopy(ctx.corpus[resource_type])
+        if resource_type == 'job_listings':
+            # Seed the partitioned store outside the timed section, as on every run after the first
+            scraper._get_job_store(existing)
+        return scraper, copy.deepcopy(ctx.incoming[resource_type]), existing
+    return setup
+
+
+def _merge(resource_type: str) -> Callable[[Context, Any], Any]:
+    def run(ctx: Context, state):
+        scraper, incoming, existing = state
+        return scraper._merge_resources(resource_type, incoming, existing)
+    return run
+
+
+def _save_files(ctx: Context, scraper: DevRelScraper):
+    for resource_type in ('github_programs', 'blog_posts', 'job_listings'):
+        scraper._save_resource_file(resource_type, ctx.corpus[resource_type])
+
+
+def _python(*args: str) -> str:
+    result = subprocess.run([sys.executable, *args], cwd=SCRIPTS_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"python {' '.join(args)} failed: {result.stderr.strip()}")
+    return result.stdout
+
+
+def _import_cli(ctx: Context, state):
+    """Import the CLI and scraper in a fresh interpreter and fail if scrape-only dependencies were loaded."""
+    loaded = _python('-c', 'import sys, scraper.cli, scraper.devrel_scraper; '
+                           f'print(*[name for name in {SCRAPE_ONLY_MODULES!r} if name in sys.modules])').split()
+    if loaded:
+        raise RuntimeError(f"Importing the scraper CLI loaded {', '.join(loaded)}")
+
+
+def _cli_stats(ctx: Context, state):
+    _python('-m', 'scraper', '--data-dir', ctx.corpus_dir, '--log-level', 'ERROR', 'stats', '--json')
+
+
+def _total(*resource_types: str) -> Callable[[Context], int]:
+    return lambda ctx: sum(len(ctx.corpus[resource_type]) for resource_type in resource_types)
+
+
+BENCHMARKS = [
+    Benchmark('is_devrel_job', _check_jobs, _total('candidate_jobs'), setup=lambda ctx: ctx.scraper()),
+    Benchmark('is_devrel_job_memoized', _check_jobs, _total('candidate_jobs'), setup=_warm_scraper),
+    Benchmark('clean_html', _clean_html, _total('blog_posts', 'candidate_jobs'), setup=lambda ctx: ctx.scraper()),
+    Benchmark('score_blog_posts', _score_posts, _total('blog_posts'), setup=lambda ctx: ctx.scraper()),
+    Benchmark('merge_github_programs', _merge('github_programs'), _total('github_programs'),
+              setup=_merge_setup('github_programs')),
+    Benchmark('merge_blog_posts', _merge('blog_posts'), _total('blog_posts'), setup=_merge_setup('blog_posts')),
+    Benchmark('merge_job_listings', _merge('job_listings'), _total('job_listings'),
+              setup=_merge_setup('job_listings')),
+    Benchmark('load_existing_resources', lambda ctx, scraper: scraper._load_existing_resources(),
+              _total('github_programs', 'blog_posts', 'job_listings'),
+              setup=lambda ctx: ctx.scraper(ctx.corpus_dir)),
+    Benchmark('save_resource_files', _save_files, _total('github_programs', 'blog_posts', 'job_listings'),
+              setup=lambda ctx: ctx.scraper()),
+    # Process startup, which read-only commands run from cron or the frontend pay on every call
+    Benchmark('import_cli', _import_cli, lambda ctx: 1),
+    Benchmark('cli_stats', _cli_stats, _total('github_programs', 'blog_posts', 'job_listings'))
+]
+
+
+def time_benchmark(benchmark: Benchmark, ctx: Context, min_rounds: int = 3, max_rounds: int = 20,
+                   min_time: float = 0.5) -> Dict[str, Any]:
+    """Time a benchmark until it has ``min_rounds`` rounds and ``min_time`` seconds, or ``max_rounds`` rounds."""
+    timings = []
+    while len(timings) < max_rounds and (len(timings) < min_rounds or sum(timings) < min_time):
+        state = benchmark.setup(ctx)
+        start = time.perf_counter()
+        benchmark.run(ctx, state)
+        timings.append(time.perf_counter() - start)
+
+    records = benchmark.records(ctx)
+    median = statistics.median(timings)
+    return {
+        'rounds': len(timings),
+        'records': records,
+        'median_seconds': median,
+        'min_seconds': min(timings),
+        'stdev_seconds': statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        'per_record_us': median / records * 1e6 if records else None
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> Dict[str, Optional[float]]:
+    """Get the relative change in median time against the baseline for every benchmark it has."""
+    changes = {}
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base and base.get('median_seconds'):
+            changes[key] = result['median_seconds'] / base['median_seconds'] - 1
+        else:
+            changes[key] = None
+    return changes
+
+
+def _load_results(path: str) -> Dict[str, Dict]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('results', {})
+    except FileNotFoundError:
+        return {}
+
+
+def _write_results(path: str, results: Dict[str, Dict]):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'generated_at': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+            'results': results
+        }, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def run_benchmarks(scales: List[int], names: Optional[List[str]] = None, **timing) -> Dict[str, Dict]:
+    """Run the selected benchmarks at every scale, keyed as '<name>@<scale>x'."""
+    seed = load_seed()
+    selected = [benchmark for benchmark in BENCHMARKS if not names or benchmark.name in names]
+    results = {}
+    for scale in scales:
+        workdir = tempfile.mkdtemp(prefix=f'devrel-bench-{scale}x-')
+        try:
+            ctx = Context(scale, seed, workdir)
+            for benchmark in selected:
+                key = f'{benchmark.name}@{scale}x'
+                results[key] = time_benchmark(benchmark, ctx, **timing)
+                print(f"  {key:<36} {results[key]['median_seconds'] * 1000:>10.2f} ms", file=sys.stderr)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def format_table(results: Dict[str, Dict], changes: Dict[str, Optional[float]], threshold: float) -> str:
+    lines = [f"{'benchmark':<36} {'records':>9} {'median ms':>11} {'us/record':>10} {'rounds':>7} {'vs baseline':>12}"]
+    for key, result in results.items():
+        change = changes.get(key)
+        if change is None:
+            delta = 'new'
+        else:
+            delta = f"{change:+.1%}" + (' REGRESSED' if change > threshold else '')
+        per_record = f"{result['per_record_us']:.2f}" if result['per_record_us'] is not None else '-'
+        lines.append(f"{key:<36} {result['records']:>9} {result['median_seconds'] * 1000:>11.2f} "
+                     f"{per_record:>10} {result['rounds']:>7} {delta:>12}")
+    return '\n'.join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the scraper hot paths on a synthetic corpus.')
+    parser.add_argument('--scales', type=int, nargs='+', default=list(DEFAULT_SCALES),
+                        help='Corpus sizes as multiples of frontend/data')
+    parser.add_argument('--only', nargs='+', choices=[benchmark.name for benchmark in BENCHMARKS],
+                        help='Benchmarks to run (default: all)')
+    parser.add_argument('--results-dir', default=default_results_dir())
+    parser.add_argument('--baseline', default=None, help='Baseline results file (default: <results-dir>/baseline.json)')
+    parser.add_argument('--save-baseline', action='store_true', help='Store these results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help='Relative slowdown of the median that counts as a regression')
+    parser.add_argument('--min-time', type=float, default=0.5, help='Minimum timed seconds per benchmark')
+    parser.add_argument('--max-rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    # The scraper logs every load and save (and a missing token per instance), which would drown the results
+    logging.getLogger('scraper').setLevel(logging.ERROR)
+
+    baseline_path = args.baseline or os.path.join(args.results_dir, 'baseline.json')
+    results = run_benchmarks(args.scales, args.only, min_time=args.min_time, max_rounds=args.max_rounds)
+    _write_results(os.path.join(args.results_dir, 'latest.json'), results)
+
+    baseline = _load_results(baseline_path)
+    changes = compare(results, baseline, args.threshold)
+    print(format_table(results, changes, args.threshold))
+
+    if args.save_baseline:
+        # Keep entries of benchmarks and scales that were not part of this run
+        _write_results(baseline_path, {**baseline, **results})
+        print(f"Baseline saved to {baseline_path}")
+        return 0
+
+    regressions = [key for key, change in changes.items() if change is not None and change > args.threshold]
+    if regressions:
+        print(f"{len(regressions)} benchmarks regressed by more than {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
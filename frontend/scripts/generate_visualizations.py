@@ -2,20 +2,21 @@
 """
 Script to generate all DevRel visualizations.
 This script coordinates the generation of all visualization components.
+
+Charts are rendered in parallel, and charts whose inputs and code are unchanged
+since the last run are skipped. Pass --force to re-render everything.
 """
 
 import os
 import sys
 import logging
+import argparse
 from pathlib import Path
 
 # Add parent directory to Python path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-from visualizations.career_path import generate_career_path
-from visualizations.community_graph import generate_community_graph
-from visualizations.metrics_dashboard import generate_metrics_dashboard
-from visualizations.skills_matrix import generate_skills_matrix
+from visualizations.runner import CHARTS, render_all
 
 # Configure logging
 logging.basicConfig(
@@ -30,19 +31,20 @@ def ensure_output_directory():
     output_dir.mkdir(parents=True, exist_ok=True)
     return output_dir
 
-def generate_all_visualizations():
+def generate_all_visualizations(force: bool = False, workers: int = None, charts=CHARTS):
     """Generate all visualizations and save them to the output directory."""
     try:
         output_dir = ensure_output_directory()
         logger.info(f"Generating visualizations in {output_dir}")
 
-        # Generate each visualization with explicit output directory
-        generate_career_path(output_dir=str(output_dir))
-        generate_community_graph(output_dir=str(output_dir))
-        generate_metrics_dashboard(output_dir=str(output_dir))
-        generate_skills_matrix(output_dir=str(output_dir))
+        # Render stale charts in parallel with explicit output directory
+        status = render_all(output_dir=str(output_dir), charts=charts, workers=workers, force=force)
+        failed = [name for name, result in status.items() if result == 'failed']
+        if failed:
+            logger.error(f"Failed to generate visualizations: {', '.join(failed)}")
+            return False
 
-        logger.info("All visualizations generated successfully")
+        logger.info(f"All visualizations generated successfully: {status}")
         return True
     except Exception as e:
         logger.error(f"Error generating visualizations: {str(e)}")
@@ -50,7 +52,13 @@ def generate_all_visualizations():
 
 def main():
     """Main function to run the visualization generation process."""
-    success = generate_all_visualizations()
+    parser = argparse.ArgumentParser(description='Generate DevRel visualizations.')
+    parser.add_argument('--force', action='store_true', help='Re-render charts even if their inputs are unchanged')
+    parser.add_argument('--workers', type=int, default=None, help='Maximum number of render processes')
+    parser.add_argument('--only', nargs='+', choices=CHARTS, default=CHARTS, help='Charts to generate')
+    args = parser.parse_args()
+
+    success = generate_all_visualizations(force=args.force, workers=args.workers, charts=args.only)
     sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
@@ -1,6 +1,15 @@
 """
 DevRel Scraper package for collecting Developer Relations resources.
+
+``DevRelScraper`` is imported on first access, so submodules such as the CLI
+can be imported without loading the scraper and its dependencies.
 """
-from .devrel_scraper import DevRelScraper
 
 __all__ = ['DevRelScraper']
+
+
+def __getattr__(name):
+    if name == 'DevRelScraper':
+        from .devrel_scraper import DevRelScraper
+        return DevRelScraper
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,6 @@
+"""Run the scraper CLI: ``python -m scraper <command>``."""
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+Size-capped streaming reads of HTTP response bodies.
+
+Responses are read chunk by chunk instead of with ``response.read()``, so an
+oversized or misbehaving page is cut off at the source's byte cap instead of
+being buffered whole. The declared Content-Type and Content-Length are checked
+before anything is read. Text bodies are decoded incrementally as chunks
+arrive, so the raw bytes are only kept when something (the JSON decoder or the
+HTTP recorder) needs them.
+"""
+import codecs
+from dataclasses import dataclass
+from typing import Optional
+
+# Bytes requested from the connection per read
+CHUNK_SIZE = 64 * 1024
+
+# Largest error page kept; error bodies are only read to record them for replay
+ERROR_MAX_BYTES = 64 * 1024
+
+# Declared content types no parser can use, rejected without reading the body
+BINARY_CONTENT_TYPES = ('image/', 'audio/', 'video/', 'font/', 'application/octet-stream',
+                        'application/pdf', 'application/zip', 'application/gzip')
+
+# Why a body was not read whole
+CONTENT_TYPE = 'content_type'
+CONTENT_LENGTH = 'content_length'
+SIZE_CAP = 'size_cap'
+
+
+class BodyRejected(Exception):
+    """A response body was not read because of its declared type or size."""
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+
+@dataclass
+class Body:
+    """A response body read up to a size cap."""
+    nbytes: int
+    truncated: bool
+    raw: Optional[bytes] = None
+    text: Optional[str] = None
+
+
+def check_content_type(content_type: str, as_text: bool):
+    """Reject a declared content type the caller cannot parse.
+
+    JSON requests require a JSON media type, as ``response.json()`` did. Text
+    requests accept anything that is not obviously binary.
+    """
+    content_type = (content_type or '').lower()
+    if as_text:
+        if content_type.startswith(BINARY_CONTENT_TYPES):
+            raise BodyRejected(CONTENT_TYPE, f"unexpected content type {content_type}")
+    elif 'json' not in content_type:
+        raise BodyRejected(CONTENT_TYPE, f"expected JSON, got {content_type or 'no content type'}")
+
+
+async def read_body(response, max_bytes: int, as_text: bool, keep_raw: bool = False,
+                    chunk_size: int = CHUNK_SIZE) -> Body:
+    """Read a response body, stopping at ``max_bytes``.
+
+    Args:
+        response: An aiohttp response whose body has not been read yet
+        max_bytes: Largest body to read; longer bodies are truncated
+        as_text: Decode the body incrementally with the response charset
+        keep_raw: Keep the raw bytes even for text bodies
+        chunk_size: Bytes requested per read
+
+    Returns:
+        The body. JSON bodies always carry ``raw``, text bodies carry ``text``.
+
+    Raises:
+        BodyRejected: If the declared type is unusable, or a JSON body is
+            declared (or turns out) to be larger than ``max_bytes``. A cut-off
+            JSON document cannot be decoded, so it is never returned.
+    """
+    check_content_type(response.content_type, as_text)
+    if response.content_length is not None and response.content_length > max_bytes and not as_text:
+        raise BodyRejected(CONTENT_LENGTH, f"declared {response.content_length} bytes, cap is {max_bytes}")
+
+    decoder = codecs.getincrementaldecoder(response.charset or 'utf-8')(errors='replace') if as_text else None
+    keep_raw = keep_raw or not as_text
+    raw, text = [], []
+    nbytes = 0
+    truncated = False
+    async for chunk in response.content.iter_chunked(chunk_size):
+        if nbytes + len(chunk) > max_bytes:
+            chunk = chunk[:max_bytes - nbytes]
+            truncated = True
+        nbytes += len(chunk)
+        if keep_raw:
+            raw.append(chunk)
+        if decoder is not None:
+            text.append(decoder.decode(chunk))
+        if truncated:
+            # Leave the rest unread; the connection is closed instead of drained
+            response.close()
+            break
+
+    if truncated and not as_text:
+        raise BodyRejected(SIZE_CAP, f"body exceeds the {max_bytes} byte cap")
+    if decoder is not None:
+        text.append(decoder.decode(b'', final=True))
+    return Body(
+        nbytes=nbytes,
+        truncated=truncated,
+        raw=b''.join(raw) if keep_raw else None,
+        text=''.join(text) if decoder is not None else None
+    )
@@ -0,0 +1,126 @@
+"""
+Yield-aware polling budget across scraper sources.
+
+Tracks how many new items each source produced per request and uses it to
+spend the request budget where it pays off: sources are sampled in proportion
+to their yield, with an exploration floor so low-yield sources are still
+revisited now and then.
+"""
+import json
+import logging
+import os
+import random
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class YieldBudget:
+    """Persistent per-source yield statistics and a proportional allocation policy."""
+
+    def __init__(self, path: str, floor: float = 0.2, decay: float = 0.8,
+                 prior_requests: float = 1.0, prior_items: float = 1.0, max_backoff: float = 4.0):
+        """
+        Args:
+            path: JSON file the statistics are persisted to
+            floor: Share of the budget spread evenly across all sources for exploration
+            decay: Weight kept by older statistics each time a run is committed
+            prior_requests: Pseudo-count of requests for sources with little history
+            prior_items: Pseudo-count of new items, optimistic so new sources get tried
+            max_backoff: Largest factor a low-yield source's polling interval is stretched by
+        """
+        self.path = path
+        self.floor = floor
+        self.decay = decay
+        self.prior_requests = prior_requests
+        self.prior_items = prior_items
+        self.max_backoff = max_backoff
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self._run_requests = defaultdict(int)
+        self._run_items = defaultdict(int)
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.stats = json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading source yields from {self.path}: {str(e)}")
+            self.stats = {}
+
+    def save(self):
+        """Persist yield statistics for the next run."""
+        try:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.stats, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Error saving source yields to {self.path}: {str(e)}")
+
+    def record_request(self, name: str):
+        """Count a request actually sent to a source in the current run."""
+        self._run_requests[name] += 1
+
+    def record_new(self, name: str, count: int = 1):
+        """Count new items a source contributed in the current run."""
+        self._run_items[name] += count
+
+    def commit_run(self):
+        """Fold the current run's counts into the decayed statistics."""
+        for name in set(self._run_requests) | set(self._run_items):
+            entry = self.stats.get(name, {'requests': 0.0, 'new_items': 0.0})
+            entry['requests'] = self.decay * entry['requests'] + self._run_requests[name]
+            entry['new_items'] = self.decay * entry['new_items'] + self._run_items[name]
+            self.stats[name] = entry
+        self._run_requests.clear()
+        self._run_items.clear()
+
+    def yield_rate(self, name: str) -> float:
+        """Estimate new items per request for a source, smoothed by the prior."""
+        entry = self.stats.get(name, {})
+        return ((entry.get('new_items', 0.0) + self.prior_items) /
+                (entry.get('requests', 0.0) + self.prior_requests))
+
+    def weights(self, names: List[str]) -> Dict[str, float]:
+        """Get allocation weights: the exploration floor plus a yield-proportional share."""
+        if not names:
+            return {}
+        rates = {name: self.yield_rate(name) for name in names}
+        total = sum(rates.values()) or 1.0
+        even = 1.0 / len(names)
+        return {name: self.floor * even + (1 - self.floor) * rate / total for name, rate in rates.items()}
+
+    def select(self, sources: List, budget: Optional[int] = None) -> List:
+        """Choose up to ``budget`` sources, sampled in proportion to their weights.
+
+        Sampling is without replacement (Efraimidis-Spirakis), so every source
+        keeps a non-zero chance of being polled. The original order is kept.
+        """
+        if budget is None or budget >= len(sources):
+            return list(sources)
+        weights = self.weights([source.name for source in sources])
+        keyed = sorted(
+            sources,
+            key=lambda source: random.random() ** (1.0 / max(weights[source.name], 1e-9)),
+            reverse=True
+        )
+        chosen = {source.name for source in keyed[:budget]}
+        skipped = [source.name for source in sources if source.name not in chosen]
+        logger.info(f"Request budget {budget}: polling {len(chosen)} sources, deferring {len(skipped)}: {skipped}")
+        return [source for source in sources if source.name in chosen]
+
+    def interval_multiplier(self, name: str, names: List[str]) -> float:
+        """Stretch the polling interval of sources yielding less than average.
+
+        The stretch is capped at ``max_backoff`` so every source is still explored.
+        """
+        rates = [self.yield_rate(other) for other in names] or [1.0]
+        mean_rate = sum(rates) / len(rates)
+        rate = self.yield_rate(name)
+        if rate <= 0:
+            return self.max_backoff
+        return min(self.max_backoff, max(1.0, mean_rate / rate))
@@ -0,0 +1,269 @@
+"""
+Command line interface for the scraper.
+
+Usage from ``frontend/scripts``::
+
+    python -m scraper scrape             # scrape every source, merge, save and publish
+    python -m scraper github             # scrape one resource type and merge it into storage
+    python -m scraper blogs
+    python -m scraper jobs
+    python -m scraper publish            # republish stored resources to frontend/public/data
+    python -m scraper export -o all.json # write stored resources as one JSON document
+    python -m scraper export --format csv --types job_listings --since 2025-01-01 -o jobs.csv.gz
+    python -m scraper links --prune      # check stored links, follow redirects, drop dead records
+    python -m scraper stats --json       # counts, freshness and source health of stored data
+
+Commands import what they need when they run. The read-only commands (publish,
+export, stats) never load aiohttp, feedparser or BeautifulSoup, so they start in
+tens of milliseconds when the frontend or cron calls them.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_TYPES = ('github_programs', 'blog_posts', 'job_listings')
+
+# Resource type scraped by each single-type command, and the scraper method that fetches it
+SCRAPE_COMMANDS = {
+    'github': ('github_programs', 'get_github_devrel_programs'),
+    'blogs': ('blog_posts', 'get_devrel_blog_posts'),
+    'jobs': ('job_listings', 'get_devrel_job_listings')
+}
+
+
+def _scraper(args: argparse.Namespace):
+    from .devrel_scraper import DevRelScraper
+    return DevRelScraper(data_dir=args.data_dir, publish_dir=args.publish_dir)
+
+
+def _load(args: argparse.Namespace) -> Dict[str, List[Dict]]:
+    resources = _scraper(args)._load_existing_resources()
+    types = getattr(args, 'types', None) or RESOURCE_TYPES
+    return {resource_type: resources.get(resource_type, []) for resource_type in types}
+
+
+def _run(args: argparse.Namespace, run) -> int:
+    """Run a scrape coroutine, optionally under the event loop watchdog."""
+    import asyncio
+
+    if args.watch_loop is not None:
+        from .loop_watchdog import watch
+        run = watch(run, os.path.join(args.data_dir, 'loop_stalls.json'), threshold=args.watch_loop / 1000)
+    return asyncio.run(run)
+
+
+def cmd_scrape(args: argparse.Namespace) -> int:
+    scraper = _scraper(args)
+    if args.profile is not None:
+        scraper.enable_profiling(args.profile or None)
+    try:
+        result = _run(args, scraper.scrape_all())
+    finally:
+        scraper.write_profile()
+    if result.get('error'):
+        logger.error(f"Scraping failed: {result['error']}")
+        return 1
+    logger.info("Scraping completed successfully")
+    return 0
+
+
+def cmd_scrape_type(args: argparse.Namespace) -> int:
+    import asyncio
+
+    resource_type, method = SCRAPE_COMMANDS[args.command]
+    scraper = _scraper(args)
+    if args.profile is not None:
+        scraper.enable_profiling(args.profile or None)
+
+    async def run():
+        fetch = getattr(scraper, method)
+        if asyncio.iscoroutinefunction(fetch):
+            records = await fetch()
+        else:
+            # Blog feeds are fetched with blocking feedparser calls
+            records = await asyncio.to_thread(fetch)
+        if not records:
+            return None
+        return await scraper.append_resources({resource_type: records})
+
+    try:
+        result = _run(args, run())
+    finally:
+        scraper.write_profile()
+    if result is None:
+        logger.error(f"No {resource_type.replace('_', ' ')} were scraped")
+        return 1
+    logger.info(f"Stored {len(result[resource_type])} {resource_type.replace('_', ' ')}")
+    return 0
+
+
+def cmd_publish(args: argparse.Namespace) -> int:
+    manifest = _scraper(args).publish_artifacts(_load(args))
+    if manifest is None:
+        return 1
+    counts = ', '.join(f"{info['count']} {resource_type}" for resource_type, info in manifest['types'].items())
+    print(f"Published {counts}")
+    return 0
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    if args.format in ('arrow', 'parquet'):
+        paths = _scraper(args).export_snapshots(_load(args), args.format)
+        for path in paths.values():
+            print(path)
+        return 0 if paths else 1
+
+    from .export import build_filter, export
+
+    # Records are streamed from storage straight into the output, never loaded all at once
+    counts = export(args.data_dir, args.output, args.format, args.types, args.fields,
+                    build_filter(args.where, args.since), compress=args.gzip, indent=args.indent)
+    logger.info(f"Exported {', '.join(f'{count} {name}' for name, count in counts.items())} to {args.output}")
+    return 0
+
+
+def cmd_links(args: argparse.Namespace) -> int:
+    import asyncio
+
+    from .liveness import check_corpus
+
+    ttls = {'alive': args.ttl_days * 86400} if args.ttl_days is not None else None
+    summary = asyncio.run(check_corpus(_scraper(args), args.types, prune=args.prune, concurrency=args.concurrency,
+                                       per_host=args.per_host, timeout=args.timeout, ttls=ttls))
+    for resource_type, counts in summary.items():
+        print(f"{resource_type:<16} " + '  '.join(f"{name} {count}" for name, count in counts.items()))
+    return 0
+
+
+def _newest(records: List[Dict]) -> Optional[str]:
+    dates = [record.get('added_at') or record.get('date') or record.get('last_updated') or '' for record in records]
+    return max(dates) if any(dates) else None
+
+
+def collect_stats(args: argparse.Namespace) -> Dict:
+    """Summarize stored resources, source health and the last publish."""
+    from .health import OPEN
+    from .publish import MANIFEST_FILE, default_publish_dir
+
+    resources = _load(args)
+    stats = {
+        'data_dir': args.data_dir,
+        'resources': {
+            resource_type: {'count': len(records), 'newest': _newest(records)}
+            for resource_type, records in resources.items()
+        }
+    }
+
+    health_path = os.path.join(args.data_dir, 'source_health.json')
+    if os.path.exists(health_path):
+        with open(health_path, 'r', encoding='utf-8') as f:
+            health = json.load(f)
+        stats['sources'] = {
+            'tracked': len(health),
+            'open_circuits': sorted(name for name, entry in health.items() if entry.get('state') == OPEN)
+        }
+
+    manifest_path = os.path.join(args.publish_dir or default_publish_dir(), MANIFEST_FILE)
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        stats['published'] = {
+            'generated_at': manifest.get('generated_at'),
+            'counts': {resource_type: info['count'] for resource_type, info in manifest.get('types', {}).items()}
+        }
+    return stats
+
+
+def cmd_stats(args: argparse.Namespace) -> int:
+    stats = collect_stats(args)
+    if args.json:
+        print(json.dumps(stats, indent=2))
+        return 0
+
+    for resource_type, info in stats['resources'].items():
+        print(f"{resource_type:<16} {info['count']:>7}  newest {info['newest'] or '-'}")
+    if 'sources' in stats:
+        open_circuits = stats['sources']['open_circuits']
+        print(f"sources          {stats['sources']['tracked']:>7}  open circuits: {', '.join(open_circuits) or 'none'}")
+    if 'published' in stats:
+        print(f"published        {sum(stats['published']['counts'].values()):>7}  at {stats['published']['generated_at']}")
+    return 0
+
+
+def _add_scrape_options(parser: argparse.ArgumentParser):
+    parser.add_argument('--profile', nargs='?', const='', default=None, metavar='DIR',
+                        help='Write per-stage CPU and allocation profiles (default: data/profiles/<timestamp>)')
+    parser.add_argument('--watch-loop', nargs='?', type=float, const=100, default=None, metavar='MS',
+                        help='Report event loop stalls longer than MS milliseconds to data/loop_stalls.json')
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m scraper',
+                                     description='Scrape, publish and inspect DevRel resources.')
+    parser.add_argument('--data-dir', default=None, help='Scraped data directory (default: scripts/data)')
+    parser.add_argument('--publish-dir', default=None, help='Frontend publish directory (default: public/data)')
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    scrape = commands.add_parser('scrape', help='Scrape every source, merge, save and publish')
+    _add_scrape_options(scrape)
+    scrape.set_defaults(func=cmd_scrape)
+
+    for name, (resource_type, _) in SCRAPE_COMMANDS.items():
+        command = commands.add_parser(name, help=f"Scrape {resource_type.replace('_', ' ')} and merge them into storage")
+        _add_scrape_options(command)
+        command.set_defaults(func=cmd_scrape_type)
+
+    publish = commands.add_parser('publish', help='Publish stored resources for the frontend')
+    publish.set_defaults(func=cmd_publish)
+
+    export = commands.add_parser('export', help='Stream stored resources to a file or stdout')
+    export.add_argument('--format', choices=['json', 'ndjson', 'csv', 'array', 'arrow', 'parquet'], default='json',
+                        help='json writes the combined document, array one JSON array of all records; '
+                             'arrow and parquet write snapshots to data/snapshots')
+    export.add_argument('--types', nargs='+', choices=RESOURCE_TYPES, default=None)
+    export.add_argument('--fields', nargs='+', default=None, help='Fields to keep (default: all, or the schema for csv)')
+    export.add_argument('--where', action='append', default=None, metavar='FIELD=VALUE',
+                        help='Only export records whose field equals (or list field contains) the value')
+    export.add_argument('--since', default=None, metavar='YYYY-MM-DD', help='Only export records added since the date')
+    export.add_argument('--gzip', action='store_true', help='Gzip the output (implied by a .gz file name)')
+    export.add_argument('-o', '--output', default='-', help='Output file (default: stdout)')
+    export.add_argument('--indent', type=int, default=None, help='Indentation of json (default 2) and array output')
+    export.set_defaults(func=cmd_export)
+
+    links = commands.add_parser('links', help='Check stored links, follow permanent redirects and mark dead ones')
+    links.add_argument('--types', nargs='+', choices=RESOURCE_TYPES, default=None)
+    links.add_argument('--prune', action='store_true', help='Remove dead records instead of marking them')
+    links.add_argument('--concurrency', type=int, default=64, help='Maximum requests in flight')
+    links.add_argument('--per-host', type=int, default=4, help='Maximum requests in flight to one host')
+    links.add_argument('--timeout', type=float, default=15, help='Seconds per request')
+    links.add_argument('--ttl-days', type=float, default=None, help='Days a live result is cached (default: 7)')
+    links.set_defaults(func=cmd_links)
+
+    stats = commands.add_parser('stats', help='Show counts, freshness and source health of stored data')
+    stats.add_argument('--json', action='store_true', help='Print machine-readable JSON')
+    stats.set_defaults(func=cmd_stats)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from .devrel_scraper import LOG_FORMAT, DevRelScraper
+
+    args = build_parser().parse_args(argv)
+    # Logs go to stderr, so export and stats output on stdout stays clean
+    logging.basicConfig(level=getattr(logging, args.log_level), format=LOG_FORMAT)
+    args.data_dir = args.data_dir or DevRelScraper.default_data_dir()
+    try:
+        return args.func(args)
+    except BrokenPipeError:
+        # The reader of stdout (e.g. head) stopped early; silence the flush at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except Exception as e:
+        logger.error(f"Error running {args.command}: {str(e)}")
+        return 1
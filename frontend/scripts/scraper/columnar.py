@@ -0,0 +1,178 @@
+"""
+Columnar snapshots of stored resources.
+
+Each run writes one Arrow IPC file (or Parquet file) per resource type next to
+the JSON outputs. The schema of each resource type is fixed here, so readers
+can rely on column names and types across runs, and Arrow IPC files are read
+through a memory map, so an aggregation that projects a few columns touches
+only those buffers instead of parsing the whole JSON document.
+
+pyarrow is in requirements.txt but imported lazily: without it snapshots are
+skipped with a warning.
+"""
+import logging
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Bump when a column is added, removed or retyped
+SCHEMA_VERSION = 1
+
+# Column name and type of every resource type; records are projected onto these
+COLUMNS = {
+    'github_programs': [
+        ('name', 'string'),
+        ('url', 'string'),
+        ('description', 'string'),
+        ('stars', 'int64'),
+        ('language', 'string'),
+        ('topics', 'list'),
+        ('last_updated', 'string'),
+        ('search_term', 'string'),
+        ('source', 'string'),
+        ('resource_type', 'string'),
+        ('added_at', 'string')
+    ],
+    'blog_posts': [
+        ('title', 'string'),
+        ('description', 'string'),
+        ('link', 'string'),
+        ('date', 'string'),
+        ('source', 'string'),
+        ('relevance_score', 'int64'),
+        ('resource_type', 'string'),
+        ('added_at', 'string')
+    ],
+    'job_listings': [
+        ('title', 'string'),
+        ('company', 'string'),
+        ('url', 'string'),
+        ('description', 'string'),
+        ('locations', 'list'),
+        ('tags', 'list'),
+        ('date', 'string'),
+        ('date_ts', 'int64'),
+        ('source', 'string'),
+        ('resource_type', 'string'),
+        ('added_at', 'string')
+    ]
+}
+
+FORMAT_EXTENSIONS = {'arrow': '.arrow', 'parquet': '.parquet'}
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("Columnar snapshots require pyarrow (pip install pyarrow)") from e
+    return pyarrow
+
+
+def schema_for(resource_type: str):
+    """Get the Arrow schema of a resource type."""
+    pa = _import_pyarrow()
+    types = {'string': pa.string(), 'int64': pa.int64(), 'list': pa.list_(pa.string())}
+    return pa.schema(
+        [pa.field(name, types[kind]) for name, kind in COLUMNS[resource_type]],
+        metadata={'resource_type': resource_type, 'schema_version': str(SCHEMA_VERSION)}
+    )
+
+
+def _coerce(value: Any, kind: str, record: Dict, name: str) -> Any:
+    """Convert a JSON field to its column type, mapping missing or malformed values to null."""
+    if kind == 'list':
+        if name == 'locations' and value is None and record.get('location'):
+            # Older job records carry a single 'location' string
+            value = [record['location']]
+        if isinstance(value, str):
+            value = [value]
+        return [str(item) for item in value] if isinstance(value, list) else None
+    if value is None:
+        return None
+    if kind == 'int64':
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+    return str(value)
+
+
+def to_table(resource_type: str, records: List[Dict]):
+    """Build an Arrow table of records with the stable schema of their resource type."""
+    pa = _import_pyarrow()
+    columns = {
+        name: [_coerce(record.get(name), kind, record, name) for record in records]
+        for name, kind in COLUMNS[resource_type]
+    }
+    return pa.Table.from_pydict(columns, schema=schema_for(resource_type))
+
+
+def snapshot_path(directory: str, resource_type: str, fmt: str = 'arrow') -> str:
+    return os.path.join(directory, f'{resource_type}{FORMAT_EXTENSIONS[fmt]}')
+
+
+def write_snapshot(resource_type: str, records: List[Dict], directory: str, fmt: str = 'arrow') -> str:
+    """Atomically write one resource type as an Arrow IPC or Parquet file and return its path.
+
+    Arrow IPC files are written uncompressed so memory-mapped reads are zero-copy.
+    The file holds nothing but the records and the fixed schema, so identical
+    records give identical bytes and content digests of snapshots stay stable.
+    The write time is the file's mtime.
+    """
+    pa = _import_pyarrow()
+    table = to_table(resource_type, records)
+
+    os.makedirs(directory, exist_ok=True)
+    path = snapshot_path(directory, resource_type, fmt)
+    tmp_path = f"{path}.tmp"
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+        pq.write_table(table, tmp_path, compression='zstd')
+    else:
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    os.replace(tmp_path, path)
+    return path
+
+
+def write_snapshots(resources: Dict[str, List[Dict]], directory: str, fmt: str = 'arrow') -> Dict[str, str]:
+    """Write a snapshot of every resource type, returning their paths.
+
+    Returns an empty dict, after logging a warning, when pyarrow is not installed.
+    """
+    try:
+        _import_pyarrow()
+    except ImportError as e:
+        logger.warning(f"Skipping columnar snapshots: {str(e)}")
+        return {}
+
+    paths = {}
+    for resource_type in COLUMNS:
+        if resource_type not in resources:
+            continue
+        try:
+            paths[resource_type] = write_snapshot(resource_type, resources[resource_type], directory, fmt)
+        except Exception as e:
+            logger.error(f"Error writing {resource_type} snapshot: {str(e)}")
+    if paths:
+        logger.info(f"Wrote columnar snapshots to {directory}")
+    return paths
+
+
+def read_snapshot(path: str, columns: Optional[Sequence[str]] = None):
+    """Read a snapshot, loading only the requested columns.
+
+    Arrow IPC files are memory-mapped, so unselected columns are never read
+    and selected ones are not copied.
+    """
+    pa = _import_pyarrow()
+    if path.endswith(FORMAT_EXTENSIONS['parquet']):
+        import pyarrow.parquet as pq
+        return pq.read_table(path, columns=list(columns) if columns else None, memory_map=True)
+
+    with pa.memory_map(path, 'r') as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.select(list(columns)) if columns else table
@@ -0,0 +1,186 @@
+"""
+Long-running scraper daemon with an in-process scheduler.
+
+Unlike the one-shot entry points, the daemon keeps the HTTP connection pool,
+the stored resources and dedup state, and the scraper's source health warm in
+memory between cycles. Each source is polled on its own cadence with jitter, so
+a periodic refresh costs only the network time.
+
+Run with ``python -m scraper.daemon`` from ``frontend/scripts``.
+"""
+import argparse
+import asyncio
+import logging
+import random
+import signal
+import time
+from typing import Dict, List, Optional
+
+import aiohttp
+
+from .devrel_scraper import LOG_FORMAT, DevRelScraper
+from .loop_watchdog import watch
+from .pipeline import ResourceSink, ScrapePipeline
+from .sources import Source, build_source_registry
+
+logger = logging.getLogger(__name__)
+
+# Default polling interval in seconds for each resource type
+DEFAULT_CADENCES = {
+    'github_programs': 6 * 3600,
+    'blog_posts': 3600,
+    'job_listings': 3 * 3600
+}
+
+
+class ScraperDaemon:
+    """Polls sources on a per-source cadence, keeping state hot between cycles."""
+
+    def __init__(self, scraper: Optional[DevRelScraper] = None, cadences: Optional[Dict[str, float]] = None,
+                 jitter: float = 0.1, shutdown_timeout: float = 60, sources: Optional[List[Source]] = None):
+        """
+        Args:
+            scraper: Scraper instance to reuse, created if not given
+            cadences: Interval in seconds per resource type or per source name
+            jitter: Fraction of the interval to randomly add or subtract
+            shutdown_timeout: Seconds to let a running cycle finish on shutdown
+            sources: Sources to poll, defaults to the full registry
+        """
+        self.scraper = scraper or DevRelScraper()
+        self.cadences = dict(DEFAULT_CADENCES)
+        self.cadences.update(cadences or {})
+        self.jitter = jitter
+        self.shutdown_timeout = shutdown_timeout
+        self.sources = sources or build_source_registry()
+        self.next_run = {source.name: 0.0 for source in self.sources}
+        self.cycles = 0
+        self._stop = asyncio.Event()
+
+    def cadence_for(self, source: Source) -> float:
+        """Get the polling interval for a source, preferring a per-source override."""
+        return self.cadences.get(source.name, self.cadences.get(source.resource_type, 3600))
+
+    def _schedule(self, source: Source, now: float):
+        # Sources that rarely yield new items are polled less often, within a cap
+        peers = [other.name for other in self.sources if other.resource_type == source.resource_type]
+        interval = self.cadence_for(source) * self.scraper.yields.interval_multiplier(source.name, peers)
+        self.next_run[source.name] = now + interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def due_sources(self, now: float) -> List[Source]:
+        return [source for source in self.sources if self.next_run[source.name] <= now]
+
+    def stop(self):
+        """Request a graceful shutdown after the current cycle."""
+        if not self._stop.is_set():
+            logger.info("Shutdown requested, finishing current cycle")
+            self._stop.set()
+
+    def _install_signal_handlers(self):
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError):
+                # Signal handlers are unavailable on some platforms (e.g. Windows)
+                pass
+
+    async def run_cycle(self, pipeline: ScrapePipeline, sources: List[Source]):
+        """Run one scrape cycle over the given sources."""
+        # Memoized responses are only valid for a single cycle
+        self.scraper.flights.clear()
+        started = time.monotonic()
+        try:
+            await pipeline.run(sources)
+        finally:
+            self.scraper.yields.commit_run()
+            await asyncio.to_thread(self.scraper.health.save)
+            await asyncio.to_thread(self.scraper.yields.save)
+            await asyncio.to_thread(self.scraper.memo.save)
+            await asyncio.to_thread(self.scraper.write_metrics)
+        self.cycles += 1
+        logger.info(f"Cycle {self.cycles} scraped {len(sources)} sources in {time.monotonic() - started:.1f}s: {pipeline.stats}")
+
+    async def run(self, once: bool = False):
+        """Run the scheduler until stopped (or for a single cycle when ``once`` is set)."""
+        self._install_signal_handlers()
+        logger.info(f"Starting scraper daemon for {len(self.sources)} sources")
+
+        # Stored resources are loaded once and kept hot across cycles
+        sink = await asyncio.to_thread(ResourceSink, self.scraper, self.scraper.pipeline_config.flush_every)
+
+        async with aiohttp.ClientSession(timeout=self.scraper.timeout) as session:
+            pipeline = ScrapePipeline(self.scraper, session, self.scraper.pipeline_config, sink=sink)
+
+            while not self._stop.is_set():
+                now = time.time()
+                due = self.due_sources(now)
+                if due:
+                    for source in due:
+                        self._schedule(source, now)
+                    cycle = asyncio.create_task(self.run_cycle(pipeline, due))
+                    stopper = asyncio.create_task(self._stop.wait())
+                    await asyncio.wait({cycle, stopper}, return_when=asyncio.FIRST_COMPLETED)
+                    stopper.cancel()
+                    if not cycle.done():
+                        try:
+                            await asyncio.wait_for(cycle, timeout=self.shutdown_timeout)
+                        except asyncio.TimeoutError:
+                            logger.warning(f"Cycle did not finish within {self.shutdown_timeout}s, cancelled")
+                    elif cycle.exception():
+                        logger.error(f"Error in scrape cycle: {str(cycle.exception())}")
+                    if once:
+                        break
+                    continue
+
+                sleep_for = max(0.0, min(self.next_run.values()) - now)
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=sleep_for)
+                except asyncio.TimeoutError:
+                    pass
+
+        # Publish anything still pending before exiting
+        await asyncio.to_thread(sink.close)
+        await asyncio.to_thread(self.scraper.health.save)
+        logger.info(f"Scraper daemon stopped after {self.cycles} cycles")
+
+
+def main():
+    """Run the scraper daemon from the command line."""
+    parser = argparse.ArgumentParser(description='Run the DevRel scraper as a long-running daemon.')
+    parser.add_argument('--github-interval', type=float, default=DEFAULT_CADENCES['github_programs'],
+                        help='Seconds between GitHub program scrapes')
+    parser.add_argument('--blog-interval', type=float, default=DEFAULT_CADENCES['blog_posts'],
+                        help='Seconds between blog feed scrapes')
+    parser.add_argument('--job-interval', type=float, default=DEFAULT_CADENCES['job_listings'],
+                        help='Seconds between job board scrapes')
+    parser.add_argument('--jitter', type=float, default=0.1,
+                        help='Fraction of each interval to randomly add or subtract')
+    parser.add_argument('--once', action='store_true', help='Run a single cycle and exit')
+    parser.add_argument('--profile', nargs='?', const='', default=None, metavar='DIR',
+                        help='Profile every cycle and write the report on exit (default: data/profiles/<timestamp>)')
+    parser.add_argument('--watch-loop', nargs='?', type=float, const=100, default=None, metavar='MS',
+                        help='Report event loop stalls longer than MS milliseconds to data/loop_stalls.json on exit')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+
+    daemon = ScraperDaemon(
+        cadences={
+            'github_programs': args.github_interval,
+            'blog_posts': args.blog_interval,
+            'job_listings': args.job_interval
+        },
+        jitter=args.jitter
+    )
+    if args.profile is not None:
+        daemon.scraper.enable_profiling(args.profile or None)
+    try:
+        run = daemon.run(once=args.once)
+        if args.watch_loop is not None:
+            run = watch(run, daemon.scraper.loop_stall_report_path(), threshold=args.watch_loop / 1000)
+        asyncio.run(run)
+    finally:
+        daemon.scraper.write_profile()
+
+
+if __name__ == '__main__':
+    main()
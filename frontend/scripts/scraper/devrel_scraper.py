@@ -1,124 +1,352 @@
 import os
 import json
+import argparse
 import time
 import logging
 import asyncio
-import aiohttp
-import requests
-import feedparser
 import urllib.parse
-from typing import List, Dict, Optional, Any
-from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING, Callable, List, Dict, Optional, Any
+from datetime import datetime
 from pathlib import Path
 import traceback
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# aiohttp, feedparser and BeautifulSoup are imported where a scrape needs them, so
+# commands that only read, export or publish stored data start without loading them
+if TYPE_CHECKING:
+    import aiohttp
+
+try:
+    from .sources import Source, GITHUB_PROGRAM_QUERIES, GITHUB_SEARCH_URL, MAX_BYTES, DEFAULT_MAX_BYTES, build_source_registry
+    from .bounded import ERROR_MAX_BYTES, SIZE_CAP, BodyRejected, read_body
+    from .health import SourceHealthRegistry
+    from .singleflight import SingleFlight, normalize_url
+    from .budget import YieldBudget
+    from .job_store import JobPartitionStore
+    from .star_history import StarHistory
+    from .columnar import write_snapshots
+    from .publish import publish
+    from .search_index import build_search_index
+    from .facet_index import build_facet_index
+    from .memo import ContentMemo, rules_version
+    from .liveness import LivenessCache
+    from .metrics import ScraperMetrics
+    from .profiling import RunProfiler, default_profile_dir, profiled
+    from .loop_watchdog import watch
+    from .pipeline import ScrapePipeline, PipelineConfig
+except ImportError:
+    # Allow running this module directly as a script
+    from sources import Source, GITHUB_PROGRAM_QUERIES, GITHUB_SEARCH_URL, MAX_BYTES, DEFAULT_MAX_BYTES, build_source_registry
+    from bounded import ERROR_MAX_BYTES, SIZE_CAP, BodyRejected, read_body
+    from health import SourceHealthRegistry
+    from singleflight import SingleFlight, normalize_url
+    from budget import YieldBudget
+    from job_store import JobPartitionStore
+    from star_history import StarHistory
+    from columnar import write_snapshots
+    from publish import publish
+    from search_index import build_search_index
+    from facet_index import build_facet_index
+    from memo import ContentMemo, rules_version
+    from liveness import LivenessCache
+    from metrics import ScraperMetrics
+    from profiling import RunProfiler, default_profile_dir, profiled
+    from loop_watchdog import watch
+    from pipeline import ScrapePipeline, PipelineConfig
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
 logger = logging.getLogger(__name__)
 
+# Output file for each resource type
+RESOURCE_FILES = {
+    'github_programs': 'github_results.json',
+    'blog_posts': 'blog_results.json',
+    'job_listings': 'job_results.json'
+}
+
+# DevRel-specific terms used to score blog post relevance
+BLOG_DEVREL_TERMS = [
+    "devrel", "developer relations", "developer advocacy", "developer experience",
+    "community", "developer marketing", "developer advocate"
+]
+
+# Title keywords that keep a job from a strictly excluded company
+EXCLUDED_COMPANY_TITLE_KEYWORDS = {
+    'developer relations', 'devrel', 'developer advocate', 'developer advocacy',
+    'technical evangelist', 'developer evangelist', 'developer experience',
+    'dx engineer', 'developer education', 'community manager',
+    'api evangelist', 'community advocate', 'community evangelist',
+    'developer community'
+}
+
+# Companies whose job postings are always excluded
+EXCLUDED_COMPANIES = {'stripe', 'twilio'}
+
+# Negative keywords that indicate non-DevRel roles
+JOB_NEGATIVE_KEYWORDS = {
+    'account executive', 'sales development', 'business developer',
+    'finance analyst', 'graphic designer', 'production designer',
+    'solutions engineer', 'engineering manager', 'product manager',
+    'program manager', 'talent acquisition', 'recruiter', 'billing',
+    'machine learning engineer', 'principal engineer', 'data scientist',
+    'analytics', 'platform engineer', 'software engineer', 'swe',
+    'frontend', 'backend', 'full stack', 'fullstack', 'full-stack',
+    'devops', 'sre', 'reliability', 'security engineer', 'sales manager',
+    'sales representative', 'business development', 'enterprise',
+    'account manager', 'customer success', 'support engineer',
+    'product designer', 'ui designer', 'ux designer', 'data engineer',
+    'infrastructure', 'network engineer', 'systems engineer',
+    'qa engineer', 'quality assurance', 'technical writer',
+    'content writer', 'marketing manager', 'growth manager',
+    'operations manager', 'project coordinator', 'scrum master',
+    'agile coach', 'business analyst', 'financial analyst',
+    'hr manager', 'recruiter', 'talent specialist', 'office manager',
+    'executive assistant', 'administrative', 'coordinator',
+    'business operations', 'sales operations', 'revenue operations'
+}
+
+# DevRel title keywords (must be in title)
+JOB_TITLE_KEYWORDS = {
+    'developer relations', 'devrel', 'developer advocate',
+    'developer advocacy', 'technical evangelist', 'developer evangelist',
+    'developer experience', 'dx engineer', 'developer education',
+    'community manager', 'api evangelist', 'community advocate',
+    'community evangelist', 'developer community', 'developer programs',
+    'developer success', 'developer outreach', 'developer engagement',
+    'developer ecosystem', 'developer platform', 'api advocate',
+    'platform advocate', 'product educator', 'technical community',
+    'dev community', 'dev rel', 'dev advocate', 'dx advocate',
+    'dx manager', 'dx lead', 'devrel lead', 'devrel manager',
+    'developer relations lead', 'developer relations manager',
+    'developer advocate lead', 'developer advocate manager'
+}
+
+# Companies requiring strict title-only filtering
+STRICT_FILTERING_COMPANIES = {
+    'stripe', 'twilio', 'microsoft', 'google', 'amazon', 'meta',
+    'apple', 'netflix', 'uber', 'lyft', 'airbnb', 'twitter',
+    'linkedin', 'adobe', 'salesforce', 'oracle', 'ibm', 'github',
+    'gitlab', 'atlassian', 'hashicorp', 'digitalocean', 'mongodb',
+    'elastic', 'datadog', 'snowflake', 'confluent', 'databricks',
+    'new relic', 'dynatrace', 'splunk', 'okta', 'auth0', 'twitch',
+    'roblox', 'unity', 'epic games', 'ea', 'activision', 'ubisoft'
+}
+
+# Description keywords accepted for companies without strict filtering
+JOB_DESCRIPTION_KEYWORDS = {
+    'developer community', 'developer ecosystem', 'api documentation',
+    'technical content', 'developer education', 'developer experience',
+    'developer engagement', 'developer success', 'developer outreach',
+    'developer advocacy', 'developer evangelism', 'devrel',
+    'developer platform', 'developer tools', 'sdk', 'api platform',
+    'developer portal', 'developer hub', 'developer network',
+    'developer program', 'developer relations', 'developer support',
+    'technical community', 'api strategy', 'developer strategy'
+}
+
+# Bump when cleaning or classification code changes in ways the keyword lists don't capture
+CLASSIFIER_CODE_VERSION = 1
+
+# Version stamp for memoized cleaning/classification results; changes whenever a rule does
+RULES_VERSION = rules_version(
+    CLASSIFIER_CODE_VERSION,
+    BLOG_DEVREL_TERMS,
+    EXCLUDED_COMPANY_TITLE_KEYWORDS,
+    EXCLUDED_COMPANIES,
+    JOB_NEGATIVE_KEYWORDS,
+    JOB_TITLE_KEYWORDS,
+    STRICT_FILTERING_COMPANIES,
+    JOB_DESCRIPTION_KEYWORDS
+)
+
+# Where a GitHub token is looked up when GITHUB_TOKEN is not set, in order
+ENV_FILE_PATHS = [
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), '.env'),  # frontend/.env
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), '.env'),  # Root .env
+    '.env',  # Current directory
+]
+
+# Headers sent with every scrape request; Authorization is added when a token is found
+DEFAULT_HEADERS = {
+    'Accept': 'application/vnd.github.v3+json',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Connection': 'keep-alive'
+}
+
+
+def load_github_token() -> Optional[str]:
+    """Get the GitHub token from GITHUB_TOKEN or the first .env file that defines it."""
+    github_token = os.environ.get('GITHUB_TOKEN', '').strip()
+    if github_token:
+        return github_token
+
+    for path in ENV_FILE_PATHS:
+        if not os.path.exists(path):
+            continue
+        try:
+            with open(path, 'r') as env_file:
+                for line in env_file:
+                    line = line.strip()
+                    if line.startswith('#') or '=' not in line:
+                        continue
+                    key, value = line.split('=', 1)
+                    if 'GITHUB_TOKEN' not in key:
+                        continue
+                    # Remove any quotes and stray whitespace or newlines
+                    value = value.strip().strip('"').strip("'").strip()
+                    if value:
+                        logger.debug(f"Using GitHub token from {path}")
+                        return value
+        except Exception as e:
+            logger.error(f"Error loading GitHub token from {path}: {str(e)}")
+    return None
+
+
 class DevRelScraper:
     """Scraper for DevRel resources including GitHub programs, blog posts, and job listings."""
 
-    def __init__(self, timeout: aiohttp.ClientTimeout = None):
-        """Initialize the DevRel scraper."""
-        self.timeout = timeout or aiohttp.ClientTimeout(total=120, connect=30, sock_read=30)
-        self.headers = {
-            'Accept': 'application/vnd.github.v3+json',  # Updated to use GitHub API v3
-            'Accept-Language': 'en-US,en;q=0.5',
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Connection': 'keep-alive'
-        }
-        
-        # Add GitHub API token if available
-        # First check environment variable directly, then try to load from .env file
-        github_token = os.environ.get('GITHUB_TOKEN')
-        
-        logger.info("Looking for GitHub token...")
-        
-        # If no token in environment, try to load from .env file
-        if not github_token:
-            logger.info("No GitHub token found in environment variables, checking .env file")
-            try:
-                # Try multiple possible locations for the .env file
-                possible_paths = [
-                    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), '.env'),  # /backend/.env
-                    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), '.env'),  # Root .env
-                    '.env',  # Current directory
-                ]
-                
-                env_path = None
-                for path in possible_paths:
-                    logger.info(f"Checking for .env file at: {path}")
-                    if os.path.exists(path):
-                        env_path = path
-                        logger.info(f"Found .env file at: {path}")
-                        break
-                
-                if env_path:
-                    with open(env_path, 'r') as env_file:
-                        env_content = env_file.read()
-                        logger.debug(f"Read env file content (length: {len(env_content)})")
-                        
-                        # Try multiple approaches to extract the token
-                        if 'GITHUB_TOKEN' in env_content:
-                            logger.debug("Found GITHUB_TOKEN in env file content")
-                            
-                            # Method 1: Parse line by line
-                            for line in env_content.splitlines():
-                                line = line.strip()
-                                if line and not line.startswith('#') and 'GITHUB_TOKEN' in line:
-                                    logger.debug(f"Found line with GITHUB_TOKEN: {line[:15]}...")
-                                    
-                                    # Extract token using split
-                                    parts = line.split('=', 1)
-                                    if len(parts) == 2:
-                                        token_value = parts[1].strip()
-                                        # Remove any quotes
-                                        token_value = token_value.strip('"').strip("'")
-                                        
-                                        # Check if the token looks valid (non-empty and not just whitespace)
-                                        if token_value and not token_value.isspace():
-                                            github_token = token_value
-                                            logger.info(f"Successfully extracted GitHub token (length: {len(github_token)})")
-                                            break
-                        else:
-                            logger.warning("GITHUB_TOKEN not found in .env file content")
-                else:
-                    logger.warning("No .env file found in any expected location")
-            except Exception as e:
-                logger.error(f"Error loading GitHub token from .env file: {str(e)}")
-        else:
-            logger.info(f"GitHub token found in environment variables (length: {len(github_token)})")
-        
-        if github_token:
-            # Clean the token - sometimes GitHub tokens might have newlines or other unwanted characters
-            github_token = github_token.strip()
-            # Log some token details for debugging (safely)
-            if len(github_token) > 10:
-                logger.info(f"Token starts with: {github_token[:5]}... and ends with: ...{github_token[-5:]}")
-                logger.info(f"Token length: {len(github_token)}")
-            
+    def __init__(self, timeout: Optional['aiohttp.ClientTimeout'] = None, pipeline_config: Optional[PipelineConfig] = None,
+                 data_dir: Optional[str] = None, publish_dir: Optional[str] = None):
+        """Initialize the DevRel scraper.
+
+        Args:
+            timeout: Default client timeout for scrape sessions
+            pipeline_config: Worker counts and queue bounds for the scrape pipeline
+            data_dir: Directory for scraped data and scraper state (defaults to scripts/data)
+            publish_dir: Directory frontend artifacts are published to (defaults to frontend/public/data)
+        """
+        self._timeout = timeout
+        self.pipeline_config = pipeline_config or PipelineConfig()
+        # Request headers, including the GitHub token, are resolved on first use
+        self._headers: Optional[Dict[str, str]] = None
+
+        self.data_dir = data_dir or self.default_data_dir()
+        self.publish_dir = publish_dir
+        self._ensure_data_directory()
+
+        # Per-source circuit breakers and latency stats, persisted between runs
+        self.health = SourceHealthRegistry(os.path.join(self.data_dir, 'source_health.json'))
+
+        # Coalesces duplicate in-flight requests and memoizes responses for a run
+        self.flights = SingleFlight()
+
+        # New items per request for each source, used to allocate the request budget
+        self.yields = YieldBudget(os.path.join(self.data_dir, 'source_yield.json'))
+
+        # Monthly job partitions, loaded on first use
+        self.job_store = None
+
+        # Delta-encoded star counts of GitHub programs over time, loaded on first use
+        self.star_history = None
+
+        # Link liveness results and canonical URLs from permanent redirects, loaded on first use
+        self._link_cache: Optional[LivenessCache] = None
+
+        # Cleaned text and classification verdicts keyed by content hash
+        self.memo = ContentMemo(os.path.join(self.data_dir, 'content_memo.json'), version=RULES_VERSION)
+
+        # Request latency, bytes, status codes, rate limit headroom and yields, in Prometheus format
+        self.metrics = ScraperMetrics()
+
+        # Per-stage CPU and allocation profiler, only attached in --profile mode
+        self.profiler: Optional[RunProfiler] = None
+
+        # Optional hooks for offline runs: rewrite request URLs (e.g. to a replay stub server)
+        # and capture every HTTP response (see replay.py)
+        self.url_rewriter: Optional[Callable[[str], str]] = None
+        self.recorder = None
+
+    @property
+    def timeout(self) -> 'aiohttp.ClientTimeout':
+        """Default client timeout for scrape sessions."""
+        if self._timeout is None:
+            import aiohttp
+            self._timeout = aiohttp.ClientTimeout(total=120, connect=30, sock_read=30)
+        return self._timeout
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Request headers, with GitHub API authentication when a token is available."""
+        if self._headers is None:
+            self._headers = dict(DEFAULT_HEADERS)
+            github_token = load_github_token()
             if github_token:
-                self.headers['Authorization'] = f'token {github_token}'
-                logger.info("GitHub API authentication configured successfully")
+                self._headers['Authorization'] = f'token {github_token}'
+                logger.info("GitHub API authentication configured")
             else:
-                logger.warning("GitHub token was found but appears to be empty")
-        else:
-            logger.warning("No GitHub token found. API rate limits will be restricted.")
-        
-        self.data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
-        self._ensure_data_directory()
+                logger.warning("No GitHub token found. API rate limits will be restricted.")
+        return self._headers
+
+    def enable_profiling(self, output_dir: Optional[str] = None) -> RunProfiler:
+        """Start profiling stages of this scraper, reporting to data/profiles/<timestamp> by default."""
+        self.profiler = RunProfiler(output_dir or default_profile_dir(self.data_dir))
+        self.profiler.start()
+        logger.info(f"Profiling enabled, report will be written to {self.profiler.output_dir}")
+        return self.profiler
+
+    def write_profile(self) -> Optional[str]:
+        """Write the profiling report and detach the profiler, if profiling is enabled."""
+        if self.profiler is None:
+            return None
+        path = self.profiler.write_report()
+        self.profiler = None
+        return path
+
+    def loop_stall_report_path(self) -> str:
+        """Get the path event loop stall reports are written to."""
+        return os.path.join(self.data_dir, 'loop_stalls.json')
+
+    @staticmethod
+    def default_data_dir() -> str:
+        """Get the directory scraped data and scraper state are stored in."""
+        return os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
 
     def _ensure_data_directory(self):
         """Ensure the data directory exists."""
         os.makedirs(self.data_dir, exist_ok=True)
 
-    async def _safe_request(self, session: aiohttp.ClientSession, url: str, timeout: int = 30) -> Dict:
-        """Make a safe HTTP request with timeout and error handling."""
+    async def _safe_request(self, session: 'aiohttp.ClientSession', url: str, timeout: int = 30,
+                            headers: Optional[Dict] = None, as_text: bool = False, memoize: bool = True,
+                            max_bytes: int = DEFAULT_MAX_BYTES) -> Any:
+        """Make a safe HTTP request with timeout and error handling.
+
+        Returns the decoded JSON body, or the text body when ``as_text`` is set.
+        Failures return an empty dict (or empty string for text requests).
+        Bodies are read up to ``max_bytes``: longer text bodies are cut off
+        there, longer JSON bodies are dropped as failures.
+        Concurrent requests for the same normalized URL, effective headers and
+        size cap share one response, and successful responses are memoized for
+        the rest of the run unless ``memoize`` is off. Memoized bodies are
+        shared, so callers must not mutate them.
+        """
+        key = (normalize_url(url), as_text, max_bytes, self._header_key(session, headers))
+        return await self.flights.do(
+            key,
+            lambda: self._request(session, url, timeout, headers, as_text, max_bytes),
+            memoize=memoize
+        )
+
+    @staticmethod
+    def _header_key(session: 'aiohttp.ClientSession', headers: Optional[Dict]) -> tuple:
+        """Get the effective request headers (session defaults overridden per request) as a hashable key.
+
+        Requests made with and without an Authorization header, for example,
+        must not share a response.
+        """
+        effective = {name.lower(): value for name, value in (getattr(session, 'headers', None) or {}).items()}
+        effective.update((name.lower(), value) for name, value in (headers or {}).items())
+        return tuple(sorted(effective.items()))
+
+    async def _request(self, session: 'aiohttp.ClientSession', url: str, timeout: int,
+                       headers: Optional[Dict], as_text: bool, max_bytes: int = DEFAULT_MAX_BYTES) -> Any:
+        """Perform a single HTTP GET for _safe_request."""
+        import aiohttp
+
+        empty = '' if as_text else {}
+        start = time.monotonic()
+        status = 'error'
+        nbytes = 0
         try:
             # Add additional debugging for GitHub API calls
             if 'api.github.com' in url:
@@ -126,10 +354,33 @@ class DevRelScraper:
                 masked_header = 'None' if auth_header == 'None' else f"{auth_header.split(' ')[0]} {'*' * 10}"
                 logger.debug(f"GitHub API request to {url} with auth: {masked_header}")
                 
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            request_url = self.url_rewriter(url) if self.url_rewriter else url
+            async with session.get(request_url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                status = response.status
+                self.metrics.observe_rate_limit(url, response.headers)
                 if response.status == 200:
-                    return await response.json()
-                elif response.status == 403:
+                    # Stream the body up to the cap instead of buffering whatever the server sends
+                    body = await read_body(response, max_bytes, as_text, keep_raw=self.recorder is not None)
+                    nbytes = body.nbytes
+                    if self.recorder is not None:
+                        self.recorder.record(url, response.status, response.headers, body.raw)
+                    if body.truncated:
+                        self.metrics.observe_truncation(url, SIZE_CAP)
+                        logger.warning(f"Truncated response from {url} at {max_bytes} bytes")
+                    if as_text:
+                        return body.text
+                    return json.loads(body.raw)
+
+                if self.recorder is not None:
+                    # Error bodies are never parsed; only read a bounded prefix so the recording can replay it
+                    try:
+                        body = await read_body(response, ERROR_MAX_BYTES, as_text=True, keep_raw=True)
+                        nbytes = body.nbytes
+                        raw = body.raw
+                    except BodyRejected:
+                        raw = b''
+                    self.recorder.record(url, response.status, response.headers, raw)
+                if response.status == 403:
                     # Check if this is a rate limit issue
                     remaining = response.headers.get('X-RateLimit-Remaining')
                     reset_time = response.headers.get('X-RateLimit-Reset')
@@ -140,28 +391,117 @@ class DevRelScraper:
                         logger.error(f"GitHub API rate limit exceeded. Resets in {wait_time:.0f} seconds at {reset_datetime}")
                     else:
                         logger.error(f"Access forbidden for URL: {url}")
-                    return {}
+                    return empty
                 elif response.status == 404:
                     logger.error(f"Resource not found at URL: {url}")
-                    return {}
+                    return empty
                 else:
                     logger.error(f"HTTP {response.status} error for URL: {url}")
-                    return {}
+                    return empty
+        except BodyRejected as e:
+            self.metrics.observe_truncation(url, e.reason)
+            logger.error(f"Skipped response body from {url}: {str(e)}")
+            return empty
         except asyncio.TimeoutError:
+            status = 'timeout'
             logger.error(f"Request timed out for URL: {url}")
-            return {}
+            return empty
         except aiohttp.ClientError as e:
             logger.error(f"Client error for URL {url}: {str(e)}")
-            return {}
+            return empty
         except json.JSONDecodeError as e:
             logger.error(f"JSON decode error for URL {url}: {str(e)}")
-            return {}
+            return empty
         except Exception as e:
             logger.error(f"Unexpected error for URL {url}: {str(e)}")
-            return {}
+            return empty
+        finally:
+            self.metrics.observe_request(url, status, time.monotonic() - start, nbytes)
+
+    def _headers_for_source(self, source: Source) -> Dict:
+        """Get request headers for a source, only sending the GitHub token to GitHub."""
+        if 'api.github.com' in source.url:
+            return self.headers
+        return {key: value for key, value in self.headers.items() if key != 'Authorization'}
+
+    @profiled('fetch')
+    async def fetch_source(self, session: 'aiohttp.ClientSession', source: Source) -> Any:
+        """Fetch the raw payload for a source, or None if the request failed or was skipped."""
+        if not self.health.allow(source.name):
+            logger.info(f"Skipping {source.name}: circuit open after repeated failures")
+            self.metrics.fetches.inc(source=source.name, outcome='skipped')
+            return None
+
+        self.yields.record_request(source.name)
+        start = time.monotonic()
+        raw = await self._safe_request(
+            session,
+            source.url,
+            timeout=self.health.timeout_for(source.name, source.timeout),
+            headers=self._headers_for_source(source),
+            as_text=source.format == 'text',
+            max_bytes=source.max_bytes
+        )
+        elapsed = time.monotonic() - start
+        self.metrics.fetch_seconds.observe(elapsed, source=source.name)
+        if raw:
+            self.health.record_success(source.name, elapsed)
+            self.metrics.fetches.inc(source=source.name, outcome='ok')
+            return raw
+        self.health.record_failure(source.name, 'request failed or returned an empty body')
+        self.metrics.fetches.inc(source=source.name, outcome='failed')
+        return None
+
+    def parse_source(self, source: Source, raw: Any) -> List[Dict]:
+        """Parse a raw source payload into candidate records."""
+        start = time.monotonic()
+        records = self._parse_payload(source, raw)
+        self.metrics.parse_seconds.observe(time.monotonic() - start, parser=source.parser)
+        self.metrics.record_items(source.name, 'parsed', len(records))
+        return records
+
+    def _parse_payload(self, source: Source, raw: Any) -> List[Dict]:
+        if source.parser == 'github_search':
+            return self._parse_github_search(raw)
+        if source.parser == 'rss2json':
+            return self._parse_feed_items(raw, source.url)
+        if source.parser == 'linkedin':
+            return self._parse_linkedin_html(raw)
+        if source.parser == 'lever':
+            return self._parse_lever_html(raw)
+        if source.parser == 'greenhouse':
+            return self._parse_greenhouse_data(raw, source.url)
+        logger.error(f"Unknown parser '{source.parser}' for source {source.name}")
+        return []
+
+    def classify_record(self, source: Source, record: Dict) -> Optional[Dict]:
+        """Apply the relevance rules for a source, returning the record to keep or None."""
+        if source.resource_type == 'blog_posts':
+            return record if self._classify_blog_post(record, source.devrel_specific) else None
+        if source.resource_type == 'job_listings':
+            return self._classify_job(record)
+        return record
+
+    @profiled('parse')
+    def _parse_github_search(self, data: Dict) -> List[Dict]:
+        """Convert a GitHub repository search response into program records."""
+        programs = []
+        for repo in data.get('items', []) if isinstance(data, dict) else []:
+            programs.append({
+                'name': repo['full_name'],
+                'url': repo['html_url'],
+                'description': repo.get('description', ''),
+                'stars': repo.get('stargazers_count', 0),
+                'language': repo.get('language', ''),
+                'topics': repo.get('topics', []),
+                'last_updated': repo.get('updated_at', '')
+            })
+        return programs
 
     async def get_github_devrel_programs(self) -> List[Dict]:
         """Get DevRel programs and resources from GitHub."""
+        import aiohttp
+
         resources = []
         # Reduce the number of search terms to minimize API calls
         search_terms = [
@@ -177,7 +517,8 @@ class DevRelScraper:
                     # Check if we're hitting rate limits
                     try:
                         rate_limit_url = 'https://api.github.com/rate_limit'
-                        rate_limit_data = await self._safe_request(session, rate_limit_url)
+                        # Rate limits change between calls, so never reuse a memoized response
+                        rate_limit_data = await self._safe_request(session, rate_limit_url, memoize=False)
                         
                         if rate_limit_data and 'resources' in rate_limit_data:
                             core_limit = rate_limit_data['resources']['core']
@@ -241,6 +582,7 @@ class DevRelScraper:
                         elif attempt < max_retries - 1:
                             # If we got a rate limit error, wait with exponential backoff
                             delay = retry_delay * (2 ** attempt)
+                            self.metrics.retries.inc(source='github_search')
                             logger.warning(f"GitHub API request failed, retrying in {delay} seconds...")
                             await asyncio.sleep(delay)
                         else:
@@ -280,8 +622,8 @@ class DevRelScraper:
         # DevRel.net RSS feed
         logging.info("Fetching DevRel.net RSS feed")
         try:
-            feed = feedparser.parse('https://devrel.net/feed')
-            if feed.entries:
+            feed = self._parse_feed('https://devrel.net/feed')
+            if feed and feed.entries:
                 logging.info(f"Found {len(feed.entries)} posts from DevRel.net")
                 for entry in feed.entries[:20]:  # Get latest 20 posts
                     blog_posts.append({
@@ -313,8 +655,8 @@ class DevRelScraper:
 
         for feed_url in feed_urls:
             try:
-                feed = feedparser.parse(feed_url)
-                if feed.entries:
+                feed = self._parse_feed(feed_url)
+                if feed and feed.entries:
                     logging.info(f"Found {len(feed.entries)} posts from DevRel blogs at {feed_url}")
                     for entry in feed.entries[:20]:
                         blog_posts.append({
@@ -342,8 +684,8 @@ class DevRelScraper:
 
         for feed_url in feed_urls:
             try:
-                feed = feedparser.parse(feed_url)
-                if feed.entries:
+                feed = self._parse_feed(feed_url)
+                if feed and feed.entries:
                     logging.info(f"Found {len(feed.entries)} posts from Developer Relations blog at {feed_url}")
                     for entry in feed.entries[:20]:
                         blog_posts.append({
@@ -361,20 +703,54 @@ class DevRelScraper:
                 logging.warning(f"Error fetching feed {feed_url}: {str(e)}")
 
         logging.info(f"Completed blog post collection. Total posts found: {len(blog_posts)}")
+        self.health.save()
         return blog_posts
 
-    async def get_github_programs_async(self, session: aiohttp.ClientSession) -> List[Dict]:
+    def _parse_feed(self, feed_url: str):
+        """Parse an RSS/Atom feed with feedparser, skipping feeds whose circuit is open."""
+        name = f'feed:{feed_url}'
+        if not self.health.allow(name):
+            logging.info(f"Skipping feed {feed_url}: circuit open after repeated failures")
+            return None
+
+        # The same feed URLs are tried by several loops, only fetch each once per run
+        return self.flights.do_sync(
+            ('feed', normalize_url(feed_url)),
+            lambda: self._fetch_feed(name, feed_url),
+            should_cache=lambda feed: feed is not None
+        )
+
+    @profiled('fetch')
+    def _fetch_feed(self, name: str, feed_url: str):
+        """Fetch and parse a feed, recording the outcome in the source health registry."""
+        import feedparser
+
+        start = time.monotonic()
+        try:
+            feed = feedparser.parse(self.url_rewriter(feed_url) if self.url_rewriter else feed_url)
+        except Exception as e:
+            self.metrics.observe_request(feed_url, 'error', time.monotonic() - start)
+            self.metrics.fetches.inc(source=name, outcome='failed')
+            self.health.record_failure(name, str(e))
+            raise
+
+        elapsed = time.monotonic() - start
+        self.metrics.observe_request(feed_url, feed.get('status', 'error'), elapsed)
+        self.metrics.fetch_seconds.observe(elapsed, source=name)
+        self.metrics.fetches.inc(source=name, outcome='ok' if feed.entries else 'failed')
+        if feed.entries:
+            self.health.record_success(name, elapsed)
+        else:
+            self.health.record_failure(name, str(feed.get('bozo_exception', 'no entries')))
+        return feed
+
+    async def get_github_programs_async(self, session: 'aiohttp.ClientSession') -> List[Dict]:
         """Fetch GitHub programs asynchronously with timeout."""
         try:
             logger.info("Starting GitHub programs fetch")
             tasks = [
-                self._safe_request(session, f'https://api.github.com/search/repositories?q={query}&sort=stars&order=desc')
-                for query in [
-                    'developer+relations+program',
-                    'devrel+program',
-                    'developer+advocacy',
-                    'developer+community'
-                ]
+                self._safe_request(session, GITHUB_SEARCH_URL.format(query=query), max_bytes=MAX_BYTES['github_search'])
+                for query in GITHUB_PROGRAM_QUERIES
             ]
 
             # Wait for all requests with timeout
@@ -386,19 +762,9 @@ class DevRelScraper:
                     logger.error(f"Error in GitHub request: {str(result)}")
                     continue
 
-                if isinstance(result, dict) and 'items' in result:
-                    for repo in result['items']:
-                        program = {
-                            'name': repo['full_name'],
-                            'url': repo['html_url'],
-                            'description': repo.get('description', ''),
-                            'stars': repo.get('stargazers_count', 0),
-                            'language': repo.get('language', ''),
-                            'topics': repo.get('topics', []),
-                            'last_updated': repo.get('updated_at', '')
-                        }
-                        if program not in all_programs:  # Avoid duplicates
-                            all_programs.append(program)
+                for program in self._parse_github_search(result):
+                    if program not in all_programs:  # Avoid duplicates
+                        all_programs.append(program)
 
             logger.info(f"Successfully fetched {len(all_programs)} GitHub programs")
             return all_programs
@@ -410,110 +776,41 @@ class DevRelScraper:
             logger.error(f"Error in get_github_programs_async: {str(e)}")
             return []
 
-    async def get_blog_posts_async(self, session: aiohttp.ClientSession) -> list:
+    async def get_blog_posts_async(self, session: 'aiohttp.ClientSession') -> list:
         """
         Get blog posts from feeds
         """
         logger.info("Fetching blog posts")
         results = []
-        
-        # DevRel-specific terms to search for
-        devrel_terms = [
-            "devrel", "developer relations", "developer advocacy", "developer experience", 
-            "community", "developer marketing", "developer advocate"
-        ]
-        
-        # List of known good DevRel-specific RSS/Atom feeds that actually work
-        devrel_feeds = [
-            # Direct API endpoints that usually work better
-            "https://api.rss2json.com/v1/api.json?rss_url=https://dev.to/feed/tag/devrel",
-            "https://api.rss2json.com/v1/api.json?rss_url=https://medium.com/feed/tag/developer-relations",
-            "https://api.rss2json.com/v1/api.json?rss_url=https://developerrelations.com/feed",
-            "https://api.rss2json.com/v1/api.json?rss_url=https://devrel.net/feed",
-            "https://api.rss2json.com/v1/api.json?rss_url=https://hackernoon.com/feed/tagged/developer-relations"
-        ]
-        
-        # Popular tech blogs to check for DevRel content (will be filtered by keywords)
-        tech_blogs = [
-            "https://api.rss2json.com/v1/api.json?rss_url=https://techcrunch.com/feed",
-            "https://api.rss2json.com/v1/api.json?rss_url=https://feeds.feedburner.com/thenextweb"
-        ]
-        
-        # Combine the two lists, but we'll track which feeds are DevRel-specific
-        all_feeds = [(feed, True) for feed in devrel_feeds] + [(feed, False) for feed in tech_blogs]
+
+        blog_sources = [source for source in build_source_registry() if source.resource_type == 'blog_posts']
         successful_feeds = 0
         failed_feeds = 0
 
-        # Process each feed
-        for feed_url, is_devrel_specific in all_feeds:
+        # Process each feed; fetch_source applies circuit breakers, adaptive
+        # timeouts and request coalescing
+        for source in blog_sources:
             try:
-                logger.info(f"Fetching feed from {feed_url}")
-                
-                # Try to fetch with increased timeout
-                async with session.get(feed_url, headers=self.headers, timeout=aiohttp.ClientTimeout(total=60)) as response:
-                    if response.status != 200:
-                        logger.warning(f"Failed to fetch feed from {feed_url}, status code: {response.status}")
-                        failed_feeds += 1
-                        continue
-                    
-                    try:
-                        data = await response.json()
-                        items = data.get('items', [])
-                    except Exception as e:
-                        logger.error(f"Error parsing JSON from {feed_url}: {str(e)}")
-                        failed_feeds += 1
-                        continue
+                logger.info(f"Fetching feed from {source.url}")
+                data = await self.fetch_source(session, source)
+                if data is None:
+                    logger.warning(f"Failed to fetch feed from {source.url}")
+                    failed_feeds += 1
+                    continue
                 
-                # Process items
-                for item in items:
-                    # Skip items without titles or links
-                    if not item.get('title') or not item.get('link'):
-                        continue
-                    
-                    title = item.get('title', '')
-                    description = item.get('description', '')
-                    link = item.get('link', '')
-                    pub_date = item.get('pubDate', '')
-                    
-                    # Parse and format the publication date
-                    try:
-                        if pub_date:
-                            # Handle multiple date formats
-                            try:
-                                dt = datetime.fromisoformat(pub_date.replace('Z', '+00:00').replace(' ', 'T'))
-                            except ValueError:
-                                # Try with dateutil parser as fallback
-                                from dateutil import parser
-                                dt = parser.parse(pub_date)
-                            formatted_date = dt.strftime('%Y-%m-%d %H:%M:%S')
-                        else:
-                            formatted_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    except Exception:
-                        # If date parsing fails, use current date
-                        formatted_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    
-                    # Calculate relevance score
-                    relevance_score = sum(1 for term in devrel_terms if term.lower() in f"{title} {description}".lower())
-                    
-                    # For DevRel-specific feeds, include all items
-                    # For general tech blogs, only include items with a relevance score > 0
-                    if is_devrel_specific or relevance_score > 0:
-                        # Create a blog post dictionary
-                        blog_post = {
-                            "title": title,
-                            "description": self._clean_html(description),
-                            "link": link,
-                            "date": formatted_date,
-                            "source": feed_url,
-                            "resource_type": "blog",
-                            "relevance_score": relevance_score
-                        }
+                # For DevRel-specific feeds, include all items
+                # For general tech blogs, only include items with a relevance score > 0
+                for blog_post in self._parse_feed_items(data, source.url):
+                    if self._classify_blog_post(blog_post, source.devrel_specific):
                         results.append(blog_post)
+                        self.metrics.record_items(source.name, 'kept')
+                    else:
+                        self.metrics.record_items(source.name, 'discarded')
                 
                 successful_feeds += 1
                 
             except Exception as e:
-                logger.error(f"Error fetching blog posts from {feed_url}: {str(e)}")
+                logger.error(f"Error fetching blog posts from {source.url}: {str(e)}")
                 failed_feeds += 1
         
         # Remove duplicates based on URL
@@ -532,10 +829,69 @@ class DevRelScraper:
         )
         
         logger.info(f"Successfully fetched {len(sorted_results)} blog posts from {successful_feeds} feeds. {failed_feeds} feeds failed.")
+        self.health.save()
+        self.memo.save()
         return sorted_results
 
+    @profiled('parse')
+    def _parse_feed_items(self, data: Dict, feed_url: str) -> List[Dict]:
+        """Convert an rss2json feed response into blog post records."""
+        posts = []
+        items = data.get('items', []) if isinstance(data, dict) else []
+        for item in items:
+            # Skip items without titles or links
+            if not item.get('title') or not item.get('link'):
+                continue
+
+            pub_date = item.get('pubDate', '')
+
+            # Parse and format the publication date
+            try:
+                if pub_date:
+                    # Handle multiple date formats
+                    try:
+                        dt = datetime.fromisoformat(pub_date.replace('Z', '+00:00').replace(' ', 'T'))
+                    except ValueError:
+                        # Try with dateutil parser as fallback
+                        from dateutil import parser
+                        dt = parser.parse(pub_date)
+                    formatted_date = dt.strftime('%Y-%m-%d %H:%M:%S')
+                else:
+                    formatted_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            except Exception:
+                # If date parsing fails, use current date
+                formatted_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+            posts.append({
+                "title": item.get('title', ''),
+                "description": item.get('description', ''),
+                "link": item.get('link', ''),
+                "date": formatted_date,
+                "source": feed_url,
+                "resource_type": "blog"
+            })
+        return posts
+
+    def _score_blog_post(self, title: str, description: str) -> int:
+        """Count the DevRel terms mentioned in a blog post's title and description."""
+        def score():
+            text = f"{title} {description}".lower()
+            return sum(1 for term in BLOG_DEVREL_TERMS if term in text)
+        return self.memo.get_or_compute('blog_score', (title or '', description or ''), score)
+
+    @profiled('classify')
+    def _classify_blog_post(self, post: Dict, is_devrel_specific: bool) -> bool:
+        """Score a parsed blog post and clean its description, returning whether to keep it."""
+        post['relevance_score'] = self._score_blog_post(post.get('title', ''), post.get('description', ''))
+        if not (is_devrel_specific or post['relevance_score'] > 0):
+            return False
+        post['description'] = self._clean_html(post.get('description', ''))
+        return True
+
     async def get_job_listings_async(self) -> List[Dict]:
         """Get job listings from various sources asynchronously."""
+        import aiohttp
+
         try:
             logger.info("Starting job listings fetch")
             async with aiohttp.ClientSession(timeout=self.timeout) as session:
@@ -545,46 +901,6 @@ class DevRelScraper:
                 }
                 session._default_headers = headers
 
-                # DevRel-specific keywords for filtering
-                devrel_keywords = [
-                    'developer relations', 'devrel', 'developer advocate',
-                    'developer advocacy', 'technical evangelist', 'developer evangelist',
-                    'developer experience', 'dx engineer', 'developer education',
-                    'community manager', 'api evangelist', 'community advocate',
-                    'community evangelist', 'developer community'
-                ]
-
-                # Keywords that indicate a role is NOT a DevRel position
-                negative_keywords = [
-                    'account executive', 'sales development', 'business developer',
-                    'finance analyst', 'graphic designer', 'production designer',
-                    'solutions engineer', 'engineering manager', 'product manager',
-                    'program manager', 'talent acquisition', 'recruiter', 'billing',
-                    'machine learning engineer', 'principal engineer', 'data scientist',
-                    'analytics', 'platform engineer', 'software engineer', 'swe',
-                    'frontend', 'backend', 'full stack', 'fullstack', 'full-stack',
-                    'devops', 'sre', 'reliability', 'security engineer', 'sales manager',
-                    'sales representative', 'business development', 'enterprise',
-                    'account manager', 'customer success', 'support engineer',
-                    'product designer', 'ui designer', 'ux designer', 'data engineer',
-                    'infrastructure', 'network engineer', 'systems engineer',
-                    'qa engineer', 'quality assurance', 'technical writer',
-                    'content writer', 'marketing manager', 'growth manager',
-                    'operations manager', 'project coordinator', 'scrum master',
-                    'agile coach', 'business analyst', 'financial analyst',
-                    'hr manager', 'recruiter', 'talent specialist', 'office manager',
-                    'executive assistant', 'administrative', 'coordinator',
-                    'business operations', 'sales operations', 'revenue operations'
-                ]
-
-                # Companies known for having dedicated DevRel teams
-                devrel_focused_companies = {
-                    'stripe', 'twilio', 'github', 'google', 'microsoft',
-                    'aws', 'digitalocean', 'netlify', 'vercel', 'mongodb',
-                    'hashicorp', 'docker', 'gitlab', 'atlassian', 'auth0',
-                    'postman', 'datadog', 'elastic', 'contentful', 'shopify'
-                }
-
                 # Fetch jobs from different sources
                 tasks = [
                     self._parse_linkedin_jobs(session, 'https://www.linkedin.com/jobs/developer-relations-jobs'),
@@ -611,265 +927,230 @@ class DevRelScraper:
                 # Filter for DevRel jobs and transform
                 devrel_jobs = []
                 for job in all_jobs:
-                    title = job.get('title', '')
-                    company = job.get('company', '')
-                    description = job.get('description', '')
-
-                    # Skip if it's a non-DevRel job from a major tech company
-                    if company.lower() in {'stripe', 'twilio'} and not any(keyword in title.lower() for keyword in {
-                        'developer relations', 'devrel', 'developer advocate', 'developer advocacy',
-                        'technical evangelist', 'developer evangelist', 'developer experience',
-                        'dx engineer', 'developer education', 'community manager',
-                        'api evangelist', 'community advocate', 'community evangelist',
-                        'developer community'
-                    }):
-                        continue
-
-                    # Use the filtering method
-                    if self._is_devrel_job(title, description, company):
-                        devrel_jobs.append({
-                            'title': job.get('title', 'Untitled Position'),
-                            'url': job.get('url', ''),
-                            'description': job.get('description', ''),
-                            'type': 'job_listing',
-                            'company': job.get('company', 'Unknown Company'),
-                            'source': job.get('source', 'Unknown Source'),
-                            'date': job.get('date', datetime.now().strftime('%Y-%m-%d')),
-                            'locations': job.get('locations', ['Remote/Unspecified'])
-                        })
+                    devrel_job = self._classify_job(job)
+                    if devrel_job:
+                        devrel_jobs.append(devrel_job)
+                    self.metrics.record_items(job.get('source', 'unknown'), 'kept' if devrel_job else 'discarded')
 
                 logger.info(f"Found {len(devrel_jobs)} DevRel job listings after filtering")
+                self.memo.save()
                 return devrel_jobs
 
         except Exception as e:
             logger.error(f"Error in get_job_listings_async: {str(e)}")
             return []
 
-    async def _parse_linkedin_jobs(self, session: aiohttp.ClientSession, url: str) -> List[Dict]:
+    @profiled('classify')
+    def _classify_job(self, job: Dict) -> Optional[Dict]:
+        """Filter a parsed job posting and transform it into a job listing record."""
+        title = job.get('title', '')
+        company = job.get('company', '')
+        description = job.get('description', '')
+
+        # Skip if it's a non-DevRel job from a major tech company
+        if company.lower() in {'stripe', 'twilio'} and not any(keyword in title.lower() for keyword in EXCLUDED_COMPANY_TITLE_KEYWORDS):
+            return None
+
+        # Use the filtering method
+        if not self._is_devrel_job(title, description, company):
+            return None
+
+        return {
+            'title': job.get('title', 'Untitled Position'),
+            'url': job.get('url', ''),
+            'description': job.get('description', ''),
+            'type': 'job_listing',
+            'company': job.get('company', 'Unknown Company'),
+            'source': job.get('source', 'Unknown Source'),
+            'date': job.get('date', datetime.now().strftime('%Y-%m-%d')),
+            'locations': job.get('locations', ['Remote/Unspecified'])
+        }
+
+    async def _parse_linkedin_jobs(self, session: 'aiohttp.ClientSession', url: str) -> List[Dict]:
         """Parse LinkedIn job listings."""
         try:
-            async with session.get(url, headers=self.headers) as response:
-                if response.status == 200:
-                    text = await response.text()
-                    soup = BeautifulSoup(text, 'html.parser')
-                    jobs = []
-
-                    for job in soup.find_all('div', {'class': 'base-card'}):
-                        try:
-                            title_elem = job.find('h3', {'class': 'base-search-card__title'})
-                            company_elem = job.find('h4', {'class': 'base-search-card__subtitle'})
-                            location_elem = job.find('span', {'class': 'job-search-card__location'})
-                            link_elem = job.find('a', {'class': 'base-card__full-link'})
-
-                            if title_elem and link_elem:
-                                jobs.append({
-                                    'title': title_elem.get_text(strip=True),
-                                    'company': company_elem.get_text(strip=True) if company_elem else '',
-                                    'location': location_elem.get_text(strip=True) if location_elem else '',
-                                    'url': link_elem.get('href', ''),
-                                    'source': 'linkedin',
-                                    'type': 'job_listing'
-                                })
-                        except Exception as e:
-                            logger.warning(f"Error parsing LinkedIn job: {str(e)}")
-                            continue
-
-                    return jobs
-                else:
-                    logger.warning(f"LinkedIn request failed with status {response.status}")
-                    return []
+            text = await self._safe_request(session, url, timeout=self.timeout.total, headers=self.headers, as_text=True,
+                                            max_bytes=MAX_BYTES['linkedin'])
+            if not text:
+                logger.warning(f"LinkedIn request failed for {url}")
+                return []
+            return self._parse_linkedin_html(text)
         except Exception as e:
             logger.error(f"Error fetching LinkedIn jobs: {str(e)}")
             return []
 
-    async def _parse_lever_jobs(self, session: aiohttp.ClientSession, url: str) -> List[Dict]:
+    @profiled('parse')
+    def _parse_linkedin_html(self, text: str) -> List[Dict]:
+        """Extract job postings from a LinkedIn job search page."""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(text, 'html.parser')
+        jobs = []
+
+        for job in soup.find_all('div', {'class': 'base-card'}):
+            try:
+                title_elem = job.find('h3', {'class': 'base-search-card__title'})
+                company_elem = job.find('h4', {'class': 'base-search-card__subtitle'})
+                location_elem = job.find('span', {'class': 'job-search-card__location'})
+                link_elem = job.find('a', {'class': 'base-card__full-link'})
+
+                if title_elem and link_elem:
+                    jobs.append({
+                        'title': title_elem.get_text(strip=True),
+                        'company': company_elem.get_text(strip=True) if company_elem else '',
+                        'location': location_elem.get_text(strip=True) if location_elem else '',
+                        'url': link_elem.get('href', ''),
+                        'source': 'linkedin',
+                        'type': 'job_listing'
+                    })
+            except Exception as e:
+                logger.warning(f"Error parsing LinkedIn job: {str(e)}")
+                continue
+
+        return jobs
+
+    async def _parse_lever_jobs(self, session: 'aiohttp.ClientSession', url: str) -> List[Dict]:
         """Parse Lever DevRel job listings."""
         try:
-            async with session.get(url, headers=self.headers) as response:
-                if response.status == 200:
-                    text = await response.text()
-                    soup = BeautifulSoup(text, 'html.parser')
-                    jobs = []
-                    job_cards = soup.find_all('div', {'class': 'posting'})
-
-                    for card in job_cards:
-                        try:
-                            title = card.find('h5')
-                            company = card.find('div', {'class': 'posting-company'})
-                            location = card.find('span', {'class': 'location'})
-                            link = card.find('a', {'class': 'posting-btn-submit'})
-
-                            if title and link:
-                                jobs.append({
-                                    'title': title.text.strip(),
-                                    'company': company.text.strip() if company else '',
-                                    'location': location.text.strip() if location else '',
-                                    'url': link['href'],
-                                    'type': 'job_listing',
-                                    'source': 'lever'
-                                })
-                        except Exception as e:
-                            logger.error(f"Error parsing Lever job card: {str(e)}")
-                            continue
-
-                    return jobs
-                return []
+            text = await self._safe_request(session, url, timeout=self.timeout.total, headers=self.headers, as_text=True,
+                                            max_bytes=MAX_BYTES['lever'])
+            return self._parse_lever_html(text) if text else []
         except Exception as e:
             logger.error(f"Error parsing Lever jobs: {str(e)}")
             return []
 
-    async def _parse_greenhouse_jobs(self, session: aiohttp.ClientSession, url: str) -> List[Dict]:
+    @profiled('parse')
+    def _parse_lever_html(self, text: str) -> List[Dict]:
+        """Extract job postings from a Lever job search page."""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(text, 'html.parser')
+        jobs = []
+        job_cards = soup.find_all('div', {'class': 'posting'})
+
+        for card in job_cards:
+            try:
+                title = card.find('h5')
+                company = card.find('div', {'class': 'posting-company'})
+                location = card.find('span', {'class': 'location'})
+                link = card.find('a', {'class': 'posting-btn-submit'})
+
+                if title and link:
+                    jobs.append({
+                        'title': title.text.strip(),
+                        'company': company.text.strip() if company else '',
+                        'location': location.text.strip() if location else '',
+                        'url': link['href'],
+                        'type': 'job_listing',
+                        'source': 'lever'
+                    })
+            except Exception as e:
+                logger.error(f"Error parsing Lever job card: {str(e)}")
+                continue
+
+        return jobs
+
+    async def _parse_greenhouse_jobs(self, session: 'aiohttp.ClientSession', url: str) -> List[Dict]:
         """Parse Greenhouse DevRel job listings."""
         try:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    logger.error(f"HTTP {response.status} error for URL: {url}")
-                    return []
-
-                data = await response.json()
-                jobs = []
-
-                # Extract company name from URL
-                company = url.split('/boards/')[1].split('/')[0] if '/boards/' in url else 'Unknown'
-
-                # Parse jobs from the Greenhouse API response
-                job_list = data.get('jobs', [])
-                for job in job_list:
-                    title = job.get('title', '')
-                    description = job.get('content', '')
-                    location = job.get('location', {}).get('name', '')
-                    job_url = job.get('absolute_url', '')
-
-                    # Only add jobs that pass the DevRel filtering criteria
-                    if self._is_devrel_job(title, description, company):
-                        jobs.append({
-                            'title': title,
-                            'company': company,
-                            'url': job_url,
-                            'description': description,
-                            'locations': [location] if location else [],
-                            'source': 'greenhouse',
-                            'date': datetime.now().strftime('%Y-%m-%d')
-                        })
-
+            data = await self._safe_request(session, url, timeout=self.timeout.total, max_bytes=MAX_BYTES['greenhouse'])
+            if not data:
+                return []
         except Exception as e:
             logger.error(f"Error parsing Greenhouse jobs: {str(e)}")
             return []
 
+        # Only keep jobs that pass the DevRel filtering criteria
+        return [
+            job for job in self._parse_greenhouse_data(data, url)
+            if self._is_devrel_job(job['title'], job['description'], job['company'])
+        ]
+
+    @profiled('parse')
+    def _parse_greenhouse_data(self, data: Dict, url: str) -> List[Dict]:
+        """Convert a Greenhouse board API response into job postings."""
+        jobs = []
+
+        # Extract company name from URL
+        company = url.split('/boards/')[1].split('/')[0] if '/boards/' in url else 'Unknown'
+
+        # Parse jobs from the Greenhouse API response
+        job_list = data.get('jobs', []) if isinstance(data, dict) else []
+        for job in job_list:
+            location = (job.get('location') or {}).get('name', '')
+            jobs.append({
+                'title': job.get('title', ''),
+                'company': company,
+                'url': job.get('absolute_url', ''),
+                'description': job.get('content', ''),
+                'locations': [location] if location else [],
+                'source': 'greenhouse',
+                'date': datetime.now().strftime('%Y-%m-%d')
+            })
+
         return jobs
 
     def _is_devrel_job(self, title: str, description: str, company: str) -> bool:
         """
         Check if a job posting is a Developer Relations role.
         Uses strict filtering for certain companies and checks for negative keywords.
+        Verdicts are memoized by content hash, so unchanged postings are not re-checked.
         """
+        return self.memo.get_or_compute(
+            'devrel_job',
+            (title or '', description or '', company or ''),
+            lambda: self._check_devrel_job(title, description, company)
+        )
+
+    def _check_devrel_job(self, title: str, description: str, company: str) -> bool:
+        """Apply the DevRel job rules without memoization."""
         title = title.lower()
         description = description.lower() if description else ""
         company = company.lower().strip() if company else ""
 
         # Exclude all jobs from these companies
-        excluded_companies = {'stripe', 'twilio'}
-        if company in excluded_companies or any(company.startswith(excluded) for excluded in excluded_companies):
+        if company in EXCLUDED_COMPANIES or any(company.startswith(excluded) for excluded in EXCLUDED_COMPANIES):
             return False
 
-        # Negative keywords that indicate non-DevRel roles
-        negative_keywords = {
-            'account executive', 'sales development', 'business developer',
-            'finance analyst', 'graphic designer', 'production designer',
-            'solutions engineer', 'engineering manager', 'product manager',
-            'program manager', 'talent acquisition', 'recruiter', 'billing',
-            'machine learning engineer', 'principal engineer', 'data scientist',
-            'analytics', 'platform engineer', 'software engineer', 'swe',
-            'frontend', 'backend', 'full stack', 'fullstack', 'full-stack',
-            'devops', 'sre', 'reliability', 'security engineer', 'sales manager',
-            'sales representative', 'business development', 'enterprise',
-            'account manager', 'customer success', 'support engineer',
-            'product designer', 'ui designer', 'ux designer', 'data engineer',
-            'infrastructure', 'network engineer', 'systems engineer',
-            'qa engineer', 'quality assurance', 'technical writer',
-            'content writer', 'marketing manager', 'growth manager',
-            'operations manager', 'project coordinator', 'scrum master',
-            'agile coach', 'business analyst', 'financial analyst',
-            'hr manager', 'recruiter', 'talent specialist', 'office manager',
-            'executive assistant', 'administrative', 'coordinator',
-            'business operations', 'sales operations', 'revenue operations'
-        }
-
-        # DevRel title keywords (must be in title)
-        title_keywords = {
-            'developer relations', 'devrel', 'developer advocate',
-            'developer advocacy', 'technical evangelist', 'developer evangelist',
-            'developer experience', 'dx engineer', 'developer education',
-            'community manager', 'api evangelist', 'community advocate',
-            'community evangelist', 'developer community', 'developer programs',
-            'developer success', 'developer outreach', 'developer engagement',
-            'developer ecosystem', 'developer platform', 'api advocate',
-            'platform advocate', 'product educator', 'technical community',
-            'dev community', 'dev rel', 'dev advocate', 'dx advocate',
-            'dx manager', 'dx lead', 'devrel lead', 'devrel manager',
-            'developer relations lead', 'developer relations manager',
-            'developer advocate lead', 'developer advocate manager'
-        }
-
-        # Companies requiring strict title-only filtering
-        strict_filtering_companies = {
-            'stripe', 'twilio', 'microsoft', 'google', 'amazon', 'meta',
-            'apple', 'netflix', 'uber', 'lyft', 'airbnb', 'twitter',
-            'linkedin', 'adobe', 'salesforce', 'oracle', 'ibm', 'github',
-            'gitlab', 'atlassian', 'hashicorp', 'digitalocean', 'mongodb',
-            'elastic', 'datadog', 'snowflake', 'confluent', 'databricks',
-            'new relic', 'dynatrace', 'splunk', 'okta', 'auth0', 'twitch',
-            'roblox', 'unity', 'epic games', 'ea', 'activision', 'ubisoft'
-        }
-
         # For major tech companies, only accept if DevRel keywords are in the title
-        if company in strict_filtering_companies:
-            return any(keyword in title for keyword in title_keywords)
-
-        # For other companies, also check description
-        description_keywords = {
-            'developer community', 'developer ecosystem', 'api documentation',
-            'technical content', 'developer education', 'developer experience',
-            'developer engagement', 'developer success', 'developer outreach',
-            'developer advocacy', 'developer evangelism', 'devrel',
-            'developer platform', 'developer tools', 'sdk', 'api platform',
-            'developer portal', 'developer hub', 'developer network',
-            'developer program', 'developer relations', 'developer support',
-            'technical community', 'api strategy', 'developer strategy'
-        }
+        if company in STRICT_FILTERING_COMPANIES:
+            return any(keyword in title for keyword in JOB_TITLE_KEYWORDS)
 
         # Check title first, then description
-        return (
-            any(keyword in title for keyword in title_keywords) or
-            (description and any(keyword in description for keyword in description_keywords))
+        return bool(
+            any(keyword in title for keyword in JOB_TITLE_KEYWORDS) or
+            (description and any(keyword in description for keyword in JOB_DESCRIPTION_KEYWORDS))
         )
 
     async def scrape_all(self) -> Dict[str, Any]:
-        """Scrape DevRel GitHub programs, blogs, and job listings."""
+        """Scrape DevRel GitHub programs, blogs, and job listings.
+
+        Sources are streamed through the staged pipeline, so records are merged
+        and published to disk as soon as they are ready rather than after the
+        slowest source returns.
+        """
         try:
             logger.info("Starting DevRel resource scraping")
-            
-            async with aiohttp.ClientSession(headers=self.headers, timeout=self.timeout) as session:
-                # Run all scraping tasks concurrently
-                github_programs_task = self.get_github_programs_async(session)
-                blog_posts_task = self.get_blog_posts_async(session)
-                job_listings_task = self.get_job_listings_async()
-                
-                # Gather results
-                github_programs, blog_posts, job_listings = await asyncio.gather(
-                    github_programs_task,
-                    blog_posts_task,
-                    job_listings_task
-                )
-                
-                logger.info(f"Scraped resources: {len(github_programs)} GitHub programs, {len(blog_posts)} blog posts, {len(job_listings)} job listings")
+            import aiohttp
+
+            # Memoized responses are only valid for a single run
+            self.flights.clear()
+
+            async with aiohttp.ClientSession(timeout=self.timeout) as session:
+                pipeline = ScrapePipeline(self, session, self.pipeline_config)
+                sources = self.yields.select(build_source_registry(), self.pipeline_config.request_budget)
+                try:
+                    resources = await pipeline.run(sources)
+                finally:
+                    self.health.save()
+                    self.yields.commit_run()
+                    self.yields.save()
+                    self.memo.save()
+                    self.write_metrics()
+                    logger.info(f"Request coalescing: {self.flights.stats()}")
                 
-                # Append results
-                resources = await self.append_resources({
-                    "github_programs": github_programs,
-                    "blog_posts": blog_posts,
-                    "job_listings": job_listings
-                })
+                logger.info(f"Scraped resources: {len(resources['github_programs'])} GitHub programs, "
+                            f"{len(resources['blog_posts'])} blog posts, {len(resources['job_listings'])} job listings")
                 
                 return resources
                 
@@ -882,6 +1163,7 @@ class DevRelScraper:
                 "job_listings": []
             }
 
+    @profiled('load')
     def _load_existing_resources(self) -> Dict:
         """Load existing resources from JSON files."""
         resources = {
@@ -890,16 +1172,14 @@ class DevRelScraper:
             'job_listings': []
         }
 
-        file_mapping = {
-            'github_programs': 'github_results.json',
-            'blog_posts': 'blog_results.json',
-            'job_listings': 'job_results.json'
-        }
-
-        for resource_type, filename in file_mapping.items():
+        for resource_type, filename in RESOURCE_FILES.items():
             file_path = os.path.join(self.data_dir, filename)
             try:
-                if os.path.exists(file_path):
+                if resource_type == 'job_listings' and os.path.isdir(os.path.join(self.data_dir, 'jobs')):
+                    # Partitioned storage is already deduplicated and date-indexed
+                    resources[resource_type] = self._get_job_store().newest()
+                    logger.info(f"Loaded {len(resources[resource_type])} existing {resource_type}")
+                elif os.path.exists(file_path):
                     with open(file_path, 'r') as f:
                         data = json.load(f)
                         if resource_type == 'job_listings':
@@ -945,6 +1225,154 @@ class DevRelScraper:
         title = self._normalize_string(job.get('title', ''))
         return (company, title)
 
+    def link_cache(self, ttls: Optional[Dict[str, float]] = None) -> LivenessCache:
+        """Get the link liveness cache stored in data/link_liveness.json."""
+        if self._link_cache is None:
+            self._link_cache = LivenessCache(os.path.join(self.data_dir, 'link_liveness.json'))
+        if ttls:
+            self._link_cache.ttls.update(ttls)
+        return self._link_cache
+
+    def _stamp_resources(self, resources: List[Dict], resource_type: str, timestamp: str) -> List[Dict]:
+        """Add the added_at timestamp and resource_type to new resources.
+
+        Links that the liveness checker found permanently redirected are
+        replaced by their canonical URL, so re-scraped records merge with the
+        stored ones instead of reappearing under the old URL.
+        """
+        cache = self.link_cache()
+        for resource in resources:
+            for field in ('url', 'link'):
+                if isinstance(resource.get(field), str):
+                    resource[field] = cache.canonical(resource[field])
+            if 'added_at' not in resource:
+                resource['added_at'] = timestamp
+            if 'resource_type' not in resource:
+                resource['resource_type'] = resource_type
+        return resources
+
+    def _get_star_history(self) -> StarHistory:
+        """Get the star history store."""
+        if self.star_history is None:
+            self.star_history = StarHistory(os.path.join(self.data_dir, 'star_history.bin'))
+        return self.star_history
+
+    def _record_star_history(self, programs: List[Dict]):
+        """Append the observed star counts of freshly scraped programs to the star history."""
+        if not programs:
+            return
+        try:
+            stars = {program.get('url', ''): int(program.get('stars') or 0) for program in programs}
+            changed = self._get_star_history().record(stars)
+            logger.info(f"Recorded star history snapshot: {changed} of {len(stars)} repositories changed")
+        except Exception as e:
+            logger.error(f"Error recording star history: {str(e)}")
+
+    def get_trending_programs(self, limit: int = 10, window_days: float = 7) -> List[Dict]:
+        """
+        Get the GitHub programs gaining stars fastest over a trailing window.
+        
+        Requires numpy for the velocity computation.
+        
+        Args:
+            limit: Maximum number of programs to return
+            window_days: Length of the trailing window in days
+            
+        Returns:
+            Program records with a 'star_velocity' field (stars per day), fastest first
+        """
+        programs = {program.get('url'): program for program in self._load_existing_resources().get('github_programs', [])}
+        trending = []
+        for url, velocity in self._get_star_history().top_trending(limit, window_days):
+            program = dict(programs.get(url, {'url': url}))
+            program['star_velocity'] = round(velocity, 2)
+            trending.append(program)
+        return trending
+
+    @profiled('merge')
+    def _merge_github_programs(self, new_programs: List[Dict], existing_programs: List[Dict]) -> List[Dict]:
+        """Merge GitHub programs by URL, preferring new records, sorted by stars.
+        
+        The star counts of the new records are also appended to the star history.
+        """
+        self._record_star_history(new_programs)
+        github_dict = {}
+        
+        for program in new_programs + existing_programs:
+            key = program.get('url', '')  # Use url as key, not html_url
+            if key and key not in github_dict:
+                github_dict[key] = program
+        
+        return sorted(
+            github_dict.values(),
+            key=lambda x: int(x.get('stars', 0)) if x.get('stars') else 0,  # Handle None values
+            reverse=True
+        )
+
+    @profiled('merge')
+    def _merge_blog_posts(self, new_posts: List[Dict], existing_posts: List[Dict]) -> List[Dict]:
+        """Merge blog posts by link, keeping the higher relevance score."""
+        blog_dict = {}
+        
+        for post in new_posts + existing_posts:
+            key = post.get('link', '')
+            if not key:
+                continue
+                
+            if key not in blog_dict:
+                blog_dict[key] = post
+            else:
+                # If we already have this post, keep the one with higher relevance score
+                existing_score = blog_dict[key].get('relevance_score', 0)
+                new_score = post.get('relevance_score', 0)
+                if new_score > existing_score:
+                    blog_dict[key] = post
+        
+        return sorted(
+            blog_dict.values(),
+            key=lambda x: (-x.get('relevance_score', 0), x.get('date', '0000-00-00')),
+            reverse=True
+        )
+
+    def _get_job_store(self, seed_jobs: Optional[List[Dict]] = None) -> JobPartitionStore:
+        """Get the partitioned job store, seeding an empty store from legacy job listings."""
+        if self.job_store is None:
+            self.job_store = JobPartitionStore(os.path.join(self.data_dir, 'jobs'))
+            if len(self.job_store) == 0 and seed_jobs:
+                migrated = self.job_store.add(seed_jobs)
+                self.job_store.save()
+                logger.info(f"Migrated {migrated} job listings into partitioned storage")
+        return self.job_store
+
+    @profiled('merge')
+    def _merge_job_listings(self, new_jobs: List[Dict], existing_jobs: List[Dict]) -> tuple:
+        """
+        Merge job listings by (company, title) and drop jobs older than 2 months.
+        
+        Jobs live in monthly partitions with dates normalized once at ingestion,
+        so retention drops whole partitions and the newest-first listing is read
+        from a date-sorted index. ``existing_jobs`` only seeds an empty store.
+        
+        Returns:
+            Tuple of (merged job listings, number of expired jobs filtered out)
+        """
+        store = self._get_job_store(existing_jobs)
+        added = store.add(new_jobs)
+        filtered_count = (len(new_jobs) - added) + store.expire()
+        store.save()
+        return store.newest(), filtered_count
+
+    def _merge_resources(self, resource_type: str, new_records: List[Dict], existing_records: List[Dict]) -> List[Dict]:
+        """Merge new records of one resource type into existing ones using its dedup and ranking rules."""
+        if resource_type == 'github_programs':
+            return self._merge_github_programs(new_records, existing_records)
+        if resource_type == 'blog_posts':
+            return self._merge_blog_posts(new_records, existing_records)
+        merged, filtered_count = self._merge_job_listings(new_records, existing_records)
+        if filtered_count:
+            logger.info(f"Filtered out {filtered_count} job listings older than 2 months")
+        return merged
+
     async def append_resources(self, new_resources: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
         """
         Append resources to existing data with 2-month filtering.
@@ -956,137 +1384,7 @@ class DevRelScraper:
             Dictionary with combined resources
         """
         try:
-            # Load existing resources
-            existing_resources = self._load_existing_resources()
-            
-            # Set the current timestamp for newly added resources
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Create output structure
-            result = {
-                'github_programs': [],
-                'blog_posts': [],
-                'job_listings': []
-            }
-            
-            # Calculate date 2 months ago for filtering
-            two_months_ago = datetime.now() - timedelta(days=60)
-            
-            # Helper function to add a timestamp to resources
-            def add_timestamp(resources, resource_type):
-                for resource in resources:
-                    if 'added_at' not in resource:
-                        resource['added_at'] = timestamp
-                    if 'resource_type' not in resource:
-                        resource['resource_type'] = resource_type
-                return resources
-            
-            # Process GitHub programs
-            github_programs = add_timestamp(new_resources.get('github_programs', []), 'github')
-            existing_github = existing_resources.get('github_programs', [])
-            
-            # Merge GitHub programs
-            all_github = github_programs + existing_github
-            github_dict = {}
-            
-            for program in all_github:
-                key = program.get('url', '')  # Use url as key, not html_url
-                if key and key not in github_dict:
-                    github_dict[key] = program
-            
-            result['github_programs'] = sorted(
-                github_dict.values(),
-                key=lambda x: int(x.get('stars', 0)) if x.get('stars') else 0,  # Handle None values
-                reverse=True
-            )
-            logger.info(f"Added {len(github_programs)} new GitHub repositories, total: {len(result['github_programs'])}")
-            
-            # Process blog posts - CRITICAL FIX: Keep existing blogs even if no new ones are fetched
-            blog_posts = add_timestamp(new_resources.get('blog_posts', []), 'blog')
-            existing_blogs = existing_resources.get('blog_posts', [])
-            
-            # IMPORTANT: If no new blog posts were fetched but we have existing ones, use existing
-            if len(blog_posts) == 0 and len(existing_blogs) > 0:
-                logger.warning("No new blog posts fetched but found existing ones - preserving existing blog posts")
-                result['blog_posts'] = existing_blogs
-                logger.info(f"Preserved {len(existing_blogs)} existing blog posts")
-            else:
-                # Normal merge with blog post relevance score handling
-                all_blogs = blog_posts + existing_blogs
-                blog_dict = {}
-                
-                for post in all_blogs:
-                    key = post.get('link', '')
-                    if not key:
-                        continue
-                        
-                    if key not in blog_dict:
-                        blog_dict[key] = post
-                    elif key in blog_dict:
-                        # If we already have this post, keep the one with higher relevance score
-                        existing_score = blog_dict[key].get('relevance_score', 0)
-                        new_score = post.get('relevance_score', 0)
-                        if new_score > existing_score:
-                            blog_dict[key] = post
-                
-                result['blog_posts'] = sorted(
-                    blog_dict.values(),
-                    key=lambda x: (-x.get('relevance_score', 0), x.get('date', '0000-00-00')),
-                    reverse=True
-                )
-                logger.info(f"Added {len(blog_posts)} new blog posts, total: {len(result['blog_posts'])}")
-            
-            # Process job listings with 2-month filtering
-            job_listings = add_timestamp(new_resources.get('job_listings', []), 'job')
-            existing_jobs = existing_resources.get('job_listings', [])
-            
-            # Merge job listings
-            all_jobs = job_listings + existing_jobs
-            job_dict = {}
-            filtered_count = 0
-            
-            for job in all_jobs:
-                # Check if job is from within the last 2 months
-                job_date_str = job.get('date', job.get('added_at', ''))
-                if job_date_str:
-                    try:
-                        job_date = datetime.strptime(job_date_str, '%Y-%m-%d %H:%M:%S')
-                        if job_date < two_months_ago:
-                            filtered_count += 1
-                            continue  # Skip jobs older than 2 months
-                    except ValueError:
-                        # If date parsing fails, try another format
-                        try:
-                            job_date = datetime.strptime(job_date_str, '%Y-%m-%d')
-                            if job_date < two_months_ago:
-                                filtered_count += 1
-                                continue  # Skip jobs older than 2 months
-                        except ValueError:
-                            # Keep the job if we can't parse the date
-                            pass
-                
-                # Use company and title as a unique key
-                key = (job.get('company', ''), job.get('title', ''))
-                if key and key not in job_dict:
-                    # Normalize location field
-                    if 'location' in job and 'locations' not in job:
-                        job['locations'] = [job['location']]
-                        job.pop('location', None)
-                    job_dict[key] = job
-                elif key in job_dict:
-                    # If already exists, combine locations
-                    existing_job = job_dict[key]
-                    if 'location' in job:
-                        locations = set(existing_job.get('locations', []))
-                        locations.add(job['location'])
-                        existing_job['locations'] = sorted(list(locations))
-            
-            result['job_listings'] = sorted(
-                job_dict.values(),
-                key=lambda x: x.get('added_at', ''),
-                reverse=True
-            )
-            logger.info(f"Added {len(job_listings)} new job listings, filtered out {filtered_count} older than 2 months, total: {len(result['job_listings'])}")
+            result = self.merge_new_resources(new_resources)
             
             # Save results to disk
             await self._save_results(result)
@@ -1098,27 +1396,107 @@ class DevRelScraper:
             traceback.print_exc()  # Print full traceback for better debugging
             # EMERGENCY RECOVERY: Return existing resources in case of error
             logger.warning("Error occurred during resource processing - returning existing resources")
-            return existing_resources
+            return self._load_existing_resources()
+
+    def merge_new_resources(self, new_resources: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
+        """
+        Merge new resources into the stored ones without saving them.
+
+        New records are stamped in place. Unlike append_resources, errors are
+        raised to the caller instead of falling back to the stored resources.
+
+        Args:
+            new_resources: Dictionary containing new resources to merge
+
+        Returns:
+            Dictionary with combined resources
+        """
+        # Load existing resources
+        existing_resources = self._load_existing_resources()
+        
+        # Set the current timestamp for newly added resources
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        # Create output structure
+        result = {
+            'github_programs': [],
+            'blog_posts': [],
+            'job_listings': []
+        }
+        
+        # Process GitHub programs
+        github_programs = self._stamp_resources(new_resources.get('github_programs', []), 'github', timestamp)
+        existing_github = existing_resources.get('github_programs', [])
+        
+        result['github_programs'] = self._merge_github_programs(github_programs, existing_github)
+        logger.info(f"Added {len(github_programs)} new GitHub repositories, total: {len(result['github_programs'])}")
+        
+        # Process blog posts - CRITICAL FIX: Keep existing blogs even if no new ones are fetched
+        blog_posts = self._stamp_resources(new_resources.get('blog_posts', []), 'blog', timestamp)
+        existing_blogs = existing_resources.get('blog_posts', [])
+        
+        # IMPORTANT: If no new blog posts were fetched but we have existing ones, use existing
+        if len(blog_posts) == 0 and len(existing_blogs) > 0:
+            logger.warning("No new blog posts fetched but found existing ones - preserving existing blog posts")
+            result['blog_posts'] = existing_blogs
+            logger.info(f"Preserved {len(existing_blogs)} existing blog posts")
+        else:
+            # Normal merge with blog post relevance score handling
+            result['blog_posts'] = self._merge_blog_posts(blog_posts, existing_blogs)
+            logger.info(f"Added {len(blog_posts)} new blog posts, total: {len(result['blog_posts'])}")
+        
+        # Process job listings with 2-month filtering
+        job_listings = self._stamp_resources(new_resources.get('job_listings', []), 'job', timestamp)
+        existing_jobs = existing_resources.get('job_listings', [])
+        
+        result['job_listings'], filtered_count = self._merge_job_listings(job_listings, existing_jobs)
+        logger.info(f"Added {len(job_listings)} new job listings, filtered out {filtered_count} older than 2 months, total: {len(result['job_listings'])}")
+
+        return result
+
+    @profiled('save')
+    def _save_resource_file(self, resource_type: str, records: List[Dict]) -> str:
+        """Atomically write one resource type to its JSON file and return the path."""
+        file_path = os.path.join(self.data_dir, RESOURCE_FILES[resource_type])
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(records, f, indent=2)
+        # Replace in one step so readers never see a partially written file
+        os.replace(tmp_path, file_path)
+        return file_path
     
-    async def _save_results(self, results: Dict[str, List[Dict]]):
-        """Save results to disk."""
+    def write_metrics(self) -> Optional[str]:
+        """Write the run metrics in Prometheus text format to data/metrics.prom."""
+        return self.metrics.write(os.path.join(self.data_dir, 'metrics.prom'))
+
+    @profiled('snapshot')
+    def export_snapshots(self, resources: Dict[str, List[Dict]], fmt: str = 'arrow') -> Dict[str, str]:
+        """Write a columnar snapshot (Arrow IPC or Parquet) of each resource type to data/snapshots."""
+        return write_snapshots(resources, os.path.join(self.data_dir, 'snapshots'), fmt)
+
+    @profiled('publish')
+    def publish_artifacts(self, resources: Dict[str, List[Dict]], directory: Optional[str] = None) -> Optional[Dict]:
+        """Publish paginated, precompressed shards, the search and facet indexes and their manifest for the frontend."""
         try:
-            # Save GitHub results - fix filename
-            github_path = os.path.join(self.data_dir, 'github_results.json')
-            with open(github_path, 'w', encoding='utf-8') as f:
-                json.dump(results['github_programs'], f, indent=2)
-            
-            # Save blog posts - ensure using the correct filename
-            blogs_path = os.path.join(self.data_dir, 'blog_results.json')
-            with open(blogs_path, 'w', encoding='utf-8') as f:
-                json.dump(results['blog_posts'], f, indent=2)
-            
-            # Save job listings
-            jobs_path = os.path.join(self.data_dir, 'job_results.json')
-            with open(jobs_path, 'w', encoding='utf-8') as f:
-                json.dump(results['job_listings'], f, indent=2)
+            artifacts = {
+                'search_index': build_search_index(resources),
+                'facet_index': build_facet_index(resources)
+            }
+            return publish(resources, directory or self.publish_dir, artifacts=artifacts)
+        except Exception as e:
+            logger.error(f"Error publishing frontend artifacts: {str(e)}")
+            return None
+
+    async def _save_results(self, results: Dict[str, List[Dict]]) -> Optional[Dict]:
+        """Save results to disk and publish them, returning the publish manifest (None if publishing failed)."""
+        try:
+            github_path = self._save_resource_file('github_programs', results['github_programs'])
+            blogs_path = self._save_resource_file('blog_posts', results['blog_posts'])
+            jobs_path = self._save_resource_file('job_listings', results['job_listings'])
             
             logger.info(f"Successfully saved results to disk: {github_path}, {blogs_path}, {jobs_path}")
+            self.export_snapshots(results)
+            return self.publish_artifacts(results)
         except Exception as e:
             logger.error(f"Error saving results to disk: {str(e)}")
             raise
@@ -1156,13 +1534,18 @@ class DevRelScraper:
             logger.error(f"Error in get_devrel_job_listings: {str(e)}")
             return []
 
+    @profiled('clean_html')
     def _clean_html(self, html_text):
         """Clean HTML content by removing tags and unnecessary whitespace."""
         if not html_text:
             return ""
-        
+        return self.memo.get_or_compute('clean_html', (html_text,), lambda: self._strip_html(html_text))
+
+    def _strip_html(self, html_text):
+        """Strip HTML tags and whitespace without memoization."""
         try:
             # Use BeautifulSoup to remove HTML tags
+            from bs4 import BeautifulSoup
             soup = BeautifulSoup(html_text, 'html.parser')
             text = soup.get_text(separator=' ', strip=True)
             
@@ -1182,6 +1565,14 @@ class DevRelScraper:
 
 def main():
     """Main function to run the scraper and save results."""
+    parser = argparse.ArgumentParser(description='Scrape DevRel GitHub programs, blog posts and job listings.')
+    parser.add_argument('--profile', nargs='?', const='', default=None, metavar='DIR',
+                        help='Write per-stage CPU and allocation profiles (default: data/profiles/<timestamp>)')
+    parser.add_argument('--watch-loop', nargs='?', type=float, const=100, default=None, metavar='MS',
+                        help='Report event loop stalls longer than MS milliseconds to data/loop_stalls.json')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+
     try:
         logger.info("Starting scraper from main function")
         # Create a new event loop to run the async code
@@ -1190,8 +1581,13 @@ def main():
         
         # Run the scrape_all method in the event loop
         scraper = DevRelScraper()
+        if args.profile is not None:
+            scraper.enable_profiling(args.profile or None)
         try:
-            result = loop.run_until_complete(scraper.scrape_all())
+            run = scraper.scrape_all()
+            if args.watch_loop is not None:
+                run = watch(run, scraper.loop_stall_report_path(), threshold=args.watch_loop / 1000)
+            result = loop.run_until_complete(run)
             if result:
                 logger.info("Scraping completed successfully")
             else:
@@ -1199,6 +1595,7 @@ def main():
         finally:
             # Always close the loop
             loop.close()
+            scraper.write_profile()
     except Exception as e:
         logger.error(f"Error in main function: {str(e)}")
 
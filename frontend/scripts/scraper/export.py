@@ -0,0 +1,447 @@
+"""
+Streaming export of stored resources.
+
+Records are read from storage one at a time and written as they arrive, so an
+export uses the same memory for a thousand records as for millions, and
+output starts before the input has been read. Stored JSON arrays are decoded
+incrementally (:func:`iter_json_array`) and job partitions are read one month
+at a time, newest first.
+
+Formats:
+
+* ``ndjson`` - one JSON record per line
+* ``csv`` - fixed columns; lists are joined with ``'; '``
+* ``array`` - a single JSON array of records
+* ``json`` - the combined document ``{"github_programs": [...], ..., "last_updated": ...}``
+
+Any format can be gzip-compressed while it is written, and records can be
+filtered and projected onto a subset of fields. :func:`read_records` reads
+every format back incrementally.
+"""
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+try:
+    from .columnar import COLUMNS
+    from .job_store import parse_job_ts, partition_end, retention_cutoff
+except ImportError:
+    # Allow use when the scraper modules are imported as scripts
+    from columnar import COLUMNS
+    from job_store import parse_job_ts, partition_end, retention_cutoff
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ('ndjson', 'csv', 'array', 'json')
+
+# Stored JSON array of each resource type, as written by DevRelScraper._save_resource_file
+RESOURCE_FILES = {
+    'github_programs': 'github_results.json',
+    'blog_posts': 'blog_results.json',
+    'job_listings': 'job_results.json'
+}
+
+# Value of the resource_type field stamped on records when they are stored
+RESOURCE_TYPE_TAGS = {
+    'github_programs': 'github',
+    'blog_posts': 'blog',
+    'job_listings': 'job'
+}
+
+# Characters read per chunk when decoding JSON arrays incrementally
+CHUNK_SIZE = 64 * 1024
+
+Record = Dict[str, Any]
+RecordFilter = Callable[[Record], bool]
+
+
+def iter_json_array(f: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """Decode the elements of a JSON array from a text stream one at a time.
+
+    Only the element being decoded is buffered, so arbitrarily large arrays
+    are read in constant memory.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    eof = False
+    # What may come next: '[' to open, an element or ']' after it, an element after ',',
+    # ',' or ']' after an element, or only whitespace after the closing ']'
+    expect = 'open'
+
+    while True:
+        # Skip whitespace, reading more input as needed
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n\ufeff':
+                pos += 1
+            if pos < len(buffer) or eof:
+                break
+            buffer, pos = f.read(chunk_size), 0
+            eof = not buffer
+
+        if pos >= len(buffer):
+            if expect not in ('open', 'end'):
+                raise ValueError("Unterminated JSON array")
+            return
+        char = buffer[pos]
+        if expect == 'end':
+            raise ValueError("Extra data after the JSON array")
+        if expect == 'open':
+            if char != '[':
+                raise ValueError("Expected a JSON array")
+            expect = 'first'
+            pos += 1
+            continue
+        if char == ']' and expect in ('first', 'separator'):
+            expect = 'end'
+            pos += 1
+            continue
+        if expect == 'separator':
+            if char != ',':
+                raise ValueError("Expected ',' or ']' after a JSON array element")
+            expect = 'element'
+            pos += 1
+            continue
+        if char in ',]':
+            raise ValueError(f"Unexpected {char!r} in a JSON array: expected an element")
+
+        # Decode the next element. It is complete once the ',' or ']' after it has been read;
+        # otherwise it may be cut off at the end of the buffer (a number can even decode early)
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                delimiter = end
+                while delimiter < len(buffer) and buffer[delimiter] in ' \t\r\n':
+                    delimiter += 1
+                if delimiter < len(buffer) and buffer[delimiter] in ',]':
+                    break
+                if eof:
+                    raise ValueError("Expected ',' or ']' after a JSON array element")
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            # Grow reads with the element, so a large element is re-decoded a logarithmic number of times
+            chunk = f.read(max(chunk_size, len(buffer) - pos))
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+        yield value
+        pos = end
+        expect = 'separator'
+
+
+def _open_text(path: str) -> TextIO:
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', newline='')
+    return open(path, 'r', encoding='utf-8', newline='')
+
+
+def detect_format(path: str) -> str:
+    """Get the export format of a file from its extension (ignoring .gz)."""
+    name = path[:-len('.gz')] if path.endswith('.gz') else path
+    extension = os.path.splitext(name)[1].lower()
+    if extension in ('.ndjson', '.jsonl'):
+        return 'ndjson'
+    if extension == '.csv':
+        return 'csv'
+    return 'array'
+
+
+def read_records(path: str, fmt: Optional[str] = None) -> Iterator[Record]:
+    """Read records back from an export or a stored resource file, one at a time.
+
+    ``fmt`` defaults to the format implied by the extension. For the combined
+    ``json`` document use :func:`read_document`.
+    """
+    fmt = fmt or detect_format(path)
+    with _open_text(path) as f:
+        if fmt == 'ndjson':
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        elif fmt == 'csv':
+            yield from csv.DictReader(f)
+        elif fmt == 'array':
+            yield from iter_json_array(f)
+        else:
+            raise ValueError(f"Cannot read {fmt} records from {path}")
+
+
+def read_document(path: str) -> Dict[str, Any]:
+    """Load a combined ``json`` export (it is a single object, so it is read whole)."""
+    with _open_text(path) as f:
+        return json.load(f)
+
+
+def iter_stored(data_dir: str, resource_type: str) -> Iterator[Record]:
+    """Stream the stored records of one resource type from a scraper data directory.
+
+    Jobs come from the monthly partitions, newest month first, when partitioned
+    storage exists, and from the flat job file otherwise. Partitioned jobs
+    older than the retention cutoff are skipped, as ``JobPartitionStore.newest``
+    does, even when their partition has not been expired yet.
+    """
+    jobs_dir = os.path.join(data_dir, 'jobs')
+    if resource_type == 'job_listings' and os.path.isdir(jobs_dir):
+        cutoff = retention_cutoff()
+        partitions = sorted((name for name in os.listdir(jobs_dir) if name.endswith('.json')), reverse=True)
+        for filename in partitions:
+            try:
+                if partition_end(filename[:-len('.json')]) <= cutoff:
+                    continue
+                for record in read_records(os.path.join(jobs_dir, filename), 'array'):
+                    if parse_job_ts(record, 0) >= cutoff:
+                        yield record
+            except Exception as e:
+                logger.error(f"Error reading job partition {filename}: {str(e)}")
+        return
+
+    path = os.path.join(data_dir, RESOURCE_FILES[resource_type])
+    if not os.path.exists(path):
+        return
+    for record in read_records(path, 'array'):
+        if resource_type == 'job_listings' and 'location' in record and 'locations' not in record:
+            # Older job files stored a single location
+            record['locations'] = [record.pop('location')]
+        yield record
+
+
+def default_fields(resource_types: Sequence[str]) -> List[str]:
+    """Get the columns of the given resource types, in schema order, for CSV exports."""
+    fields = []
+    for resource_type in resource_types:
+        for name, _ in COLUMNS[resource_type]:
+            if name not in fields:
+                fields.append(name)
+    return fields
+
+
+def project(record: Record, fields: Optional[Sequence[str]]) -> Record:
+    """Keep only ``fields`` of a record (all of them when ``fields`` is None)."""
+    if not fields:
+        return record
+    return {field: record.get(field) for field in fields}
+
+
+def build_filter(where: Optional[Iterable[str]] = None, since: Optional[str] = None) -> Optional[RecordFilter]:
+    """Build a record filter from ``field=value`` conditions and a minimum date.
+
+    Args:
+        where: Conditions that must all hold; list fields match if they contain the value
+        since: Keep records whose added_at (or date) is on or after this date (YYYY-MM-DD)
+
+    Returns:
+        The filter, or None when there is nothing to filter on
+    """
+    conditions = []
+    for condition in where or []:
+        field, sep, value = condition.partition('=')
+        if not sep:
+            raise ValueError(f"Filter '{condition}' is not of the form field=value")
+        conditions.append((field, value))
+    if not conditions and not since:
+        return None
+
+    def matches(record: Record) -> bool:
+        for field, value in conditions:
+            actual = record.get(field)
+            if isinstance(actual, list):
+                if value not in (str(item) for item in actual):
+                    return False
+            elif str(actual if actual is not None else '') != value:
+                return False
+        if since:
+            # Stored dates are ISO-like, so string order is date order
+            stamp = str(record.get('added_at') or record.get('date') or '')
+            if stamp[:len(since)] < since:
+                return False
+        return True
+    return matches
+
+
+def iter_resources(data_dir: str, resource_types: Sequence[str], record_filter: Optional[RecordFilter] = None,
+                   tag: bool = False) -> Iterator[Tuple[str, Record]]:
+    """Stream (resource_type, record) pairs of several resource types from storage.
+
+    With ``tag`` set, records without a resource_type get the tag they are stored under.
+    """
+    for resource_type in resource_types:
+        for record in iter_stored(data_dir, resource_type):
+            if tag and 'resource_type' not in record:
+                record['resource_type'] = RESOURCE_TYPE_TAGS[resource_type]
+            if record_filter is None or record_filter(record):
+                yield resource_type, record
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return '; '.join(str(item) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def write_ndjson(records: Iterable[Record], f: TextIO) -> int:
+    count = 0
+    for record in records:
+        f.write(json.dumps(record))
+        f.write('\n')
+        count += 1
+    return count
+
+
+def write_csv(records: Iterable[Record], f: TextIO, fields: Sequence[str]) -> int:
+    writer = csv.DictWriter(f, fieldnames=list(fields), extrasaction='ignore')
+    writer.writeheader()
+    count = 0
+    for record in records:
+        writer.writerow({field: _csv_value(record.get(field)) for field in fields})
+        count += 1
+    return count
+
+
+def _write_array_items(records: Iterable[Record], f: TextIO, indent: Optional[int], depth: int) -> int:
+    pad = '\n' + ' ' * (indent * depth) if indent is not None else ''
+    separator = ',' if indent is not None else ', '
+    count = 0
+    for record in records:
+        text = json.dumps(record, indent=indent)
+        if indent is not None:
+            text = text.replace('\n', pad)
+        f.write((separator if count else '') + pad + text)
+        count += 1
+    if count and indent is not None:
+        f.write('\n' + ' ' * (indent * (depth - 1)))
+    return count
+
+
+def write_json_array(records: Iterable[Record], f: TextIO, indent: Optional[int] = None) -> int:
+    f.write('[')
+    count = _write_array_items(records, f, indent, 1)
+    f.write(']')
+    return count
+
+
+def write_document(streams: Dict[str, Iterable[Record]], f: TextIO, extra: Optional[Dict[str, Any]] = None,
+                   indent: Optional[int] = 2) -> Dict[str, int]:
+    """Write the combined document, one resource type array after another, then ``extra`` keys.
+
+    The output is byte-identical to ``json.dump`` of the same document with the
+    same indent, non-ASCII characters escaped included.
+    """
+    counts = {}
+    separator = ',' + ('\n' + ' ' * indent if indent is not None else ' ')
+    f.write('{' + ('\n' + ' ' * indent if indent is not None else ''))
+    for key, records in streams.items():
+        f.write((separator if counts else '') + json.dumps(key) + ': [')
+        counts[key] = _write_array_items(records, f, indent, 2)
+        f.write(']')
+    for i, (key, value) in enumerate((extra or {}).items()):
+        text = json.dumps(value, indent=indent)
+        if indent is not None:
+            text = text.replace('\n', '\n' + ' ' * indent)
+        f.write((separator if counts or i else '') + json.dumps(key) + ': ' + text)
+    f.write(('\n' if indent is not None else '') + '}')
+    return counts
+
+
+@contextmanager
+def open_output(path: str, compress: bool = False) -> Iterator[TextIO]:
+    """Open an export destination for writing text.
+
+    ``'-'`` writes to stdout. Files are written to a temporary path and
+    renamed when complete, so readers never see a partial export. Output is
+    gzip-compressed when ``compress`` is set or the path ends in ``.gz``.
+    """
+    compress = compress or path.endswith('.gz')
+    if path == '-':
+        if compress:
+            with gzip.GzipFile(fileobj=sys.stdout.buffer, mode='wb') as raw:
+                with io.TextIOWrapper(raw, encoding='utf-8', newline='') as f:
+                    yield f
+        else:
+            yield sys.stdout
+            sys.stdout.flush()
+        return
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    try:
+        if compress:
+            f = gzip.open(tmp_path, 'wt', encoding='utf-8', newline='')
+        else:
+            f = open(tmp_path, 'w', encoding='utf-8', newline='')
+        with f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def export(data_dir: str, output: str, fmt: str = 'ndjson', resource_types: Optional[Sequence[str]] = None,
+           fields: Optional[Sequence[str]] = None, record_filter: Optional[RecordFilter] = None,
+           compress: bool = False, indent: Optional[int] = None) -> Dict[str, int]:
+    """Stream stored resources into an export file.
+
+    Args:
+        data_dir: Scraper data directory to read from
+        output: Destination path, or '-' for stdout
+        fmt: One of FORMATS
+        resource_types: Resource types to export (default: all)
+        fields: Fields to keep (default: all; for CSV, the schema columns)
+        record_filter: Predicate records must satisfy
+        compress: Gzip the output (implied by a .gz path)
+        indent: Indentation of the array and json formats
+
+    Returns:
+        Number of records written per resource type
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    resource_types = list(resource_types or RESOURCE_FILES)
+    counts = {resource_type: 0 for resource_type in resource_types}
+
+    def counted(pairs: Iterable[Tuple[str, Record]]) -> Iterator[Record]:
+        for resource_type, record in pairs:
+            counts[resource_type] += 1
+            yield project(record, fields)
+
+    with open_output(output, compress) as f:
+        if fmt == 'json':
+            streams = {
+                resource_type: counted(iter_resources(data_dir, [resource_type], record_filter))
+                for resource_type in resource_types
+            }
+            write_document(streams, f, extra={'last_updated': datetime.now().isoformat()},
+                           indent=2 if indent is None else indent)
+        else:
+            # Records of several types share one stream, so tag each with its type
+            records = counted(iter_resources(data_dir, resource_types, record_filter, tag=True))
+            if fmt == 'ndjson':
+                write_ndjson(records, f)
+            elif fmt == 'csv':
+                write_csv(records, f, fields or default_fields(resource_types))
+            else:
+                write_json_array(records, f, indent)
+    return counts
+
+
+def export_records(records: Iterable[Record], output: str, fmt: str, fields: Optional[Sequence[str]] = None,
+                   compress: bool = False, indent: Optional[int] = None) -> int:
+    """Stream records from any iterable (not only storage) into an ndjson, csv or array export."""
+    with open_output(output, compress) as f:
+        records = (project(record, fields) for record in records)
+        if fmt == 'ndjson':
+            return write_ndjson(records, f)
+        if fmt == 'csv':
+            return write_csv(records, f, fields or default_fields(list(RESOURCE_FILES)))
+        if fmt == 'array':
+            return write_json_array(records, f, indent)
+        raise ValueError(f"Cannot export a record stream as {fmt}")
@@ -0,0 +1,180 @@
+"""
+Bitmap facet index for filtering and counting published resources.
+
+Every facet value (a company, a location, a language, a topic, ...) maps to
+the set of record positions, within its resource type, that carry it. Each set
+is evaluated as a Python int bitset, so combined filters are big-integer
+AND/OR operations and counts are popcounts, regardless of how values are
+spread.
+
+Serialized containers are chosen roaring-style per value: sparse sets are
+stored as varint delta-encoded position arrays, dense sets as raw bitmaps.
+Each value's cardinality is precomputed in the header, so unfiltered facet
+counts need no decoding at all.
+
+Positions follow the published order, so position ``p`` is on page
+``p // page_size`` of its resource type.
+"""
+import json
+import struct
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+try:
+    from .star_history import decode_varint, encode_varint
+except ImportError:
+    # Allow use when the scraper modules are imported as scripts
+    from star_history import decode_varint, encode_varint
+
+MAGIC = b'DRFI1\n'
+
+# Facet name and the record fields it is read from, per resource type
+FACETS = {
+    'github_programs': {'language': ('language',), 'topic': ('topics',)},
+    'blog_posts': {'source': ('source',)},
+    'job_listings': {'company': ('company',), 'location': ('locations', 'location'), 'source': ('source',)}
+}
+
+CONTAINER_ARRAY = 'a'
+CONTAINER_BITMAP = 'b'
+
+
+def popcount(bitmap: int) -> int:
+    return bin(bitmap).count('1')
+
+
+def facet_values(record: Dict, fields: Iterable[str]) -> set:
+    """Get the distinct, non-empty values of a facet across its fields."""
+    values = set()
+    for field in fields:
+        value = record.get(field)
+        for item in (value if isinstance(value, list) else [value]):
+            if isinstance(item, str) and item.strip():
+                values.add(item.strip())
+    return values
+
+
+def _encode_container(positions: List[int], size: int) -> tuple:
+    """Encode sorted positions as whichever container is smaller."""
+    array = bytearray()
+    previous = 0
+    for position in positions:
+        encode_varint(position - previous, array)
+        previous = position
+    bitmap_bytes = (size + 7) // 8
+    if len(array) <= bitmap_bytes:
+        return CONTAINER_ARRAY, bytes(array)
+    bitmap = 0
+    for position in positions:
+        bitmap |= 1 << position
+    return CONTAINER_BITMAP, bitmap.to_bytes(bitmap_bytes, 'little')
+
+
+def build_facet_index(resources: Dict[str, List[Dict]]) -> bytes:
+    """Build and serialize the facet bitmaps of every resource type, in published order."""
+    blob = bytearray()
+    types = {}
+    for resource_type, facets in FACETS.items():
+        records = resources.get(resource_type, [])
+        type_header = {'count': len(records), 'facets': {}}
+        for facet, fields in facets.items():
+            positions = defaultdict(list)
+            for position, record in enumerate(records):
+                for value in facet_values(record, fields):
+                    positions[value].append(position)
+
+            values = {}
+            for value in sorted(positions):
+                kind, payload = _encode_container(positions[value], len(records))
+                values[value] = [len(blob), len(payload), kind, len(positions[value])]
+                blob += payload
+            type_header['facets'][facet] = values
+        types[resource_type] = type_header
+
+    header = json.dumps({'types': types}, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return MAGIC + struct.pack('>I', len(header)) + header + bytes(blob)
+
+
+class FacetIndex:
+    """A loaded facet index; bitmaps are decoded on first use and cached."""
+
+    def __init__(self, data: bytes):
+        if not data.startswith(MAGIC):
+            raise ValueError("Not a facet index artifact")
+        (header_length,) = struct.unpack_from('>I', data, len(MAGIC))
+        header_start = len(MAGIC) + 4
+        self.types: Dict[str, Dict] = json.loads(data[header_start:header_start + header_length])['types']
+        self._blob = memoryview(data)[header_start + header_length:]
+        self._bitmaps: Dict[tuple, int] = {}
+
+    @classmethod
+    def load(cls, path: str) -> 'FacetIndex':
+        with open(path, 'rb') as f:
+            return cls(f.read())
+
+    def all(self, resource_type: str) -> int:
+        """Get the bitmap of every record of a resource type."""
+        return (1 << self.types[resource_type]['count']) - 1
+
+    def bitmap(self, resource_type: str, facet: str, value: str) -> int:
+        """Get the bitmap of records with a facet value (0 if the value is unknown)."""
+        key = (resource_type, facet, value)
+        if key in self._bitmaps:
+            return self._bitmaps[key]
+        entry = self.types[resource_type]['facets'][facet].get(value)
+        if entry is None:
+            return 0
+        offset, length, kind, cardinality = entry
+        if kind == CONTAINER_BITMAP:
+            bitmap = int.from_bytes(self._blob[offset:offset + length], 'little')
+        else:
+            bitmap = 0
+            position = 0
+            pos = offset
+            for _ in range(cardinality):
+                delta, pos = decode_varint(self._blob, pos)
+                position += delta
+                bitmap |= 1 << position
+        self._bitmaps[key] = bitmap
+        return bitmap
+
+    def any_of(self, resource_type: str, facet: str, values: Iterable[str]) -> int:
+        """OR the bitmaps of several values of one facet."""
+        result = 0
+        for value in values:
+            result |= self.bitmap(resource_type, facet, value)
+        return result
+
+    def select(self, resource_type: str, filters: Dict[str, Iterable[str]]) -> int:
+        """Get records matching any value within each facet and every facet (OR within, AND across)."""
+        result = self.all(resource_type)
+        for facet, values in filters.items():
+            result &= self.any_of(resource_type, facet, values)
+            if not result:
+                break
+        return result
+
+    def counts(self, resource_type: str, facet: str, within: Optional[int] = None) -> Dict[str, int]:
+        """Count records per facet value, optionally restricted to a bitmap of records.
+
+        Unrestricted counts come straight from the precomputed cardinalities.
+        """
+        values = self.types[resource_type]['facets'][facet]
+        if within is None:
+            return {value: entry[3] for value, entry in values.items()}
+        counts = {}
+        for value in values:
+            count = popcount(self.bitmap(resource_type, facet, value) & within)
+            if count:
+                counts[value] = count
+        return counts
+
+    @staticmethod
+    def positions(bitmap: int) -> List[int]:
+        """Get the record positions set in a bitmap, in ascending order."""
+        result = []
+        while bitmap:
+            low = bitmap & -bitmap
+            result.append(low.bit_length() - 1)
+            bitmap ^= low
+        return result
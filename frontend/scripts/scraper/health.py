@@ -0,0 +1,171 @@
+"""
+Per-source health tracking with circuit breakers and adaptive timeouts.
+
+Health state is persisted between runs so dead endpoints are skipped until a
+cool-down probe succeeds, and request timeouts follow each source's observed
+latency instead of a fixed worst-case value.
+"""
+import json
+import logging
+import math
+import os
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class SourceHealth:
+    """Latency and failure statistics plus breaker state for one source."""
+
+    # Number of recent successful latencies kept for percentile estimates
+    MAX_SAMPLES = 50
+
+    def __init__(self, data: Optional[Dict] = None):
+        data = data or {}
+        self.state = data.get('state', CLOSED)
+        self.ewma_latency = data.get('ewma_latency')
+        self.latencies = list(data.get('latencies', []))[-self.MAX_SAMPLES:]
+        self.consecutive_failures = data.get('consecutive_failures', 0)
+        self.total_failures = data.get('total_failures', 0)
+        self.total_successes = data.get('total_successes', 0)
+        self.opened_at = data.get('opened_at')
+        self.cooldown = data.get('cooldown', 0)
+        self.last_error = data.get('last_error', '')
+        self.probing = False
+
+    def p95(self) -> Optional[float]:
+        """Get the 95th percentile of recent successful latencies."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = max(0, math.ceil(0.95 * len(ordered)) - 1)
+        return ordered[index]
+
+    def to_dict(self) -> Dict:
+        return {
+            'state': self.state,
+            'ewma_latency': self.ewma_latency,
+            'latencies': self.latencies,
+            'consecutive_failures': self.consecutive_failures,
+            'total_failures': self.total_failures,
+            'total_successes': self.total_successes,
+            'opened_at': self.opened_at,
+            'cooldown': self.cooldown,
+            'last_error': self.last_error
+        }
+
+
+class SourceHealthRegistry:
+    """Persistent registry of source health used to gate and time out requests."""
+
+    def __init__(self, path: str, failure_threshold: int = 3, base_cooldown: float = 3600,
+                 max_cooldown: float = 86400, ewma_alpha: float = 0.3, min_timeout: float = 5,
+                 timeout_multiplier: float = 2.0, min_samples: int = 5):
+        self.path = path
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.ewma_alpha = ewma_alpha
+        self.min_timeout = min_timeout
+        self.timeout_multiplier = timeout_multiplier
+        self.min_samples = min_samples
+        self.sources: Dict[str, SourceHealth] = {}
+        self._load()
+
+    def _load(self):
+        """Load persisted health state, starting fresh if it is missing or corrupt."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.sources = {name: SourceHealth(entry) for name, entry in data.items()}
+            logger.info(f"Loaded health state for {len(self.sources)} sources")
+        except Exception as e:
+            logger.error(f"Error loading source health from {self.path}: {str(e)}")
+            self.sources = {}
+
+    def save(self):
+        """Persist health state for the next run."""
+        try:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({name: health.to_dict() for name, health in self.sources.items()}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Error saving source health to {self.path}: {str(e)}")
+
+    def get(self, name: str) -> SourceHealth:
+        if name not in self.sources:
+            self.sources[name] = SourceHealth()
+        return self.sources[name]
+
+    def allow(self, name: str) -> bool:
+        """Check whether a request to the source may be made now.
+
+        Open breakers reject requests until their cool-down has elapsed, after
+        which a single half-open probe is let through.
+        """
+        health = self.get(name)
+        if health.state == CLOSED:
+            return True
+        if health.probing:
+            return False
+        if health.state == OPEN:
+            if time.time() - (health.opened_at or 0) < health.cooldown:
+                return False
+            health.state = HALF_OPEN
+            logger.info(f"Circuit for {name} is half-open, probing")
+        health.probing = True
+        return True
+
+    def timeout_for(self, name: str, default: float) -> float:
+        """Derive a request timeout from the source's observed p95 latency."""
+        health = self.get(name)
+        p95 = health.p95()
+        if p95 is None or len(health.latencies) < self.min_samples:
+            return default
+        return min(default, max(self.min_timeout, p95 * self.timeout_multiplier))
+
+    def record_success(self, name: str, latency: float):
+        health = self.get(name)
+        health.latencies = (health.latencies + [round(latency, 3)])[-SourceHealth.MAX_SAMPLES:]
+        if health.ewma_latency is None:
+            health.ewma_latency = latency
+        else:
+            health.ewma_latency = self.ewma_alpha * latency + (1 - self.ewma_alpha) * health.ewma_latency
+        health.total_successes += 1
+        health.consecutive_failures = 0
+        health.probing = False
+        if health.state != CLOSED:
+            logger.info(f"Circuit for {name} closed after successful probe")
+        health.state = CLOSED
+        health.opened_at = None
+        health.cooldown = 0
+
+    def record_failure(self, name: str, error: str = ''):
+        health = self.get(name)
+        health.total_failures += 1
+        health.consecutive_failures += 1
+        health.last_error = error
+        was_probing = health.probing
+        health.probing = False
+
+        if health.state == HALF_OPEN or was_probing:
+            # Failed probe: re-open with a longer cool-down
+            health.cooldown = min(self.max_cooldown, max(self.base_cooldown, health.cooldown * 2))
+            self._open(name, health)
+        elif health.state == CLOSED and health.consecutive_failures >= self.failure_threshold:
+            health.cooldown = self.base_cooldown
+            self._open(name, health)
+
+    def _open(self, name: str, health: SourceHealth):
+        health.state = OPEN
+        health.opened_at = time.time()
+        logger.warning(f"Circuit for {name} opened after {health.consecutive_failures} consecutive failures, "
+                       f"skipping for {health.cooldown:.0f} seconds")
@@ -0,0 +1,236 @@
+"""
+Time-partitioned storage for job listings.
+
+Jobs are stored in monthly partition files with their date normalized once, at
+ingestion, to an epoch integer (``date_ts``). An in-memory index sorted by
+``date_ts`` serves newest-first reads and range scans with bisect, and
+retention drops whole partitions, so neither depends on the size of the
+history.
+"""
+import bisect
+import json
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Date formats accepted for job 'date' / 'added_at' fields
+DATE_FORMATS = ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d')
+
+# Days a job listing is kept after its date
+RETENTION_DAYS = 60
+
+
+def parse_job_ts(job: Dict, default: int) -> int:
+    """Normalize a job's date to an epoch integer, falling back to ``default``."""
+    if isinstance(job.get('date_ts'), int):
+        return job['date_ts']
+    date_str = job.get('date', job.get('added_at', ''))
+    for fmt in DATE_FORMATS:
+        try:
+            return int(datetime.strptime(date_str, fmt).timestamp())
+        except (TypeError, ValueError):
+            continue
+    return default
+
+
+def retention_cutoff(retention_days: int = RETENTION_DAYS, now: Optional[float] = None) -> int:
+    """Get the oldest date_ts still inside a retention window."""
+    now = time.time() if now is None else now
+    return int(now - retention_days * 86400)
+
+
+def partition_for(ts: int) -> str:
+    """Get the monthly partition name (YYYY-MM) for an epoch timestamp."""
+    return datetime.fromtimestamp(ts).strftime('%Y-%m')
+
+
+def partition_end(partition: str) -> int:
+    """Get the epoch timestamp at which a monthly partition ends."""
+    start = datetime.strptime(partition, '%Y-%m')
+    next_month = (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return int(next_month.timestamp())
+
+
+def job_key(job: Dict) -> Tuple[str, str]:
+    """Get the (company, title) key jobs are deduplicated by."""
+    return (job.get('company', ''), job.get('title', ''))
+
+
+class JobPartitionStore:
+    """Job listings in monthly partitions with a date-sorted index."""
+
+    def __init__(self, root_dir: str, retention_days: int = RETENTION_DAYS):
+        self.root_dir = root_dir
+        self.retention_days = retention_days
+        self.partitions: Dict[str, Dict[Tuple[str, str], Dict]] = {}
+        self._where: Dict[Tuple[str, str], str] = {}
+        # Parallel lists sorted by date_ts: timestamps for bisect, keys for lookup
+        self._index_ts: List[int] = []
+        self._index_keys: List[Tuple[str, str]] = []
+        self._dirty = set()
+        self._dropped = set()
+        self._load()
+
+    def _path(self, partition: str) -> str:
+        return os.path.join(self.root_dir, f'{partition}.json')
+
+    def _load(self):
+        """Load partitions still inside the retention window."""
+        if not os.path.isdir(self.root_dir):
+            return
+        cutoff = self.cutoff()
+        for filename in sorted(os.listdir(self.root_dir)):
+            if not filename.endswith('.json'):
+                continue
+            partition = filename[:-len('.json')]
+            try:
+                if partition_end(partition) <= cutoff:
+                    self._dropped.add(partition)
+                    continue
+                with open(self._path(partition), 'r', encoding='utf-8') as f:
+                    jobs = json.load(f)
+            except Exception as e:
+                logger.error(f"Error loading job partition {filename}: {str(e)}")
+                continue
+            self.partitions[partition] = {}
+            for job in jobs:
+                self._insert(partition, job)
+        self._dirty.clear()
+        logger.info(f"Loaded {len(self._where)} jobs from {len(self.partitions)} partitions")
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def cutoff(self, now: Optional[float] = None) -> int:
+        """Get the oldest date_ts still inside the retention window."""
+        return retention_cutoff(self.retention_days, now)
+
+    def _insert(self, partition: str, job: Dict):
+        key = job_key(job)
+        self.partitions.setdefault(partition, {})[key] = job
+        self._where[key] = partition
+        position = bisect.bisect_right(self._index_ts, job['date_ts'])
+        self._index_ts.insert(position, job['date_ts'])
+        self._index_keys.insert(position, key)
+        self._dirty.add(partition)
+
+    def _remove(self, key: Tuple[str, str]) -> Dict:
+        partition = self._where.pop(key)
+        job = self.partitions[partition].pop(key)
+        low = bisect.bisect_left(self._index_ts, job['date_ts'])
+        high = bisect.bisect_right(self._index_ts, job['date_ts'])
+        position = self._index_keys.index(key, low, high)
+        del self._index_ts[position]
+        del self._index_keys[position]
+        self._dirty.add(partition)
+        return job
+
+    def add(self, jobs: List[Dict], now: Optional[float] = None) -> int:
+        """Add jobs, replacing existing jobs with the same key and merging their locations.
+
+        Returns:
+            Number of jobs added (jobs already outside the retention window are dropped)
+        """
+        now_ts = int(time.time() if now is None else now)
+        cutoff = self.cutoff(now)
+        added = 0
+        for job in jobs:
+            job['date_ts'] = parse_job_ts(job, now_ts)
+            if job['date_ts'] < cutoff:
+                continue
+
+            # Normalize location field
+            if 'location' in job and 'locations' not in job:
+                job['locations'] = [job['location']]
+                job.pop('location', None)
+
+            key = job_key(job)
+            if key in self._where:
+                previous = self._remove(key)
+                if previous.get('locations') and previous.get('locations') != job.get('locations'):
+                    job['locations'] = sorted(set(job.get('locations', [])) | set(previous['locations']))
+            self._insert(partition_for(job['date_ts']), job)
+            added += 1
+        return added
+
+    def remove(self, jobs: List[Dict]) -> int:
+        """Remove stored jobs with the same keys as the given jobs.
+
+        Returns:
+            Number of jobs removed
+        """
+        removed = 0
+        for job in jobs:
+            key = job_key(job)
+            if key in self._where:
+                self._remove(key)
+                removed += 1
+        return removed
+
+    def touch(self, jobs: List[Dict]):
+        """Mark the partitions of stored jobs that were changed in place for the next save."""
+        for job in jobs:
+            partition = self._where.get(job_key(job))
+            if partition is not None:
+                self._dirty.add(partition)
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """Drop every partition that ends before the retention cutoff.
+
+        Partitions cover contiguous date ranges, so their index entries are a
+        prefix of the sorted index and are removed with one slice.
+
+        Returns:
+            Number of jobs dropped
+        """
+        cutoff = self.cutoff(now)
+        expired = [partition for partition in sorted(self.partitions) if partition_end(partition) <= cutoff]
+        if not expired:
+            return 0
+        end = bisect.bisect_left(self._index_ts, partition_end(expired[-1]))
+        del self._index_ts[:end]
+        del self._index_keys[:end]
+        dropped = 0
+        for partition in expired:
+            for key in self.partitions.pop(partition):
+                del self._where[key]
+                dropped += 1
+            self._dirty.discard(partition)
+            self._dropped.add(partition)
+        logger.info(f"Expired {len(expired)} job partitions ({dropped} jobs)")
+        return dropped
+
+    def range(self, start_ts: int, end_ts: Optional[int] = None) -> List[Dict]:
+        """Get jobs with start_ts <= date_ts < end_ts, newest first."""
+        low = bisect.bisect_left(self._index_ts, start_ts)
+        high = len(self._index_ts) if end_ts is None else bisect.bisect_left(self._index_ts, end_ts)
+        return [self.partitions[self._where[key]][key] for key in reversed(self._index_keys[low:high])]
+
+    def newest(self, limit: Optional[int] = None, now: Optional[float] = None) -> List[Dict]:
+        """Get jobs inside the retention window, newest first."""
+        low = bisect.bisect_left(self._index_ts, self.cutoff(now))
+        if limit is not None:
+            low = max(low, len(self._index_keys) - limit)
+        return [self.partitions[self._where[key]][key] for key in reversed(self._index_keys[low:])]
+
+    def save(self):
+        """Write changed partitions and delete dropped ones."""
+        os.makedirs(self.root_dir, exist_ok=True)
+        for partition in sorted(self._dirty):
+            jobs = sorted(self.partitions.get(partition, {}).values(), key=lambda job: job['date_ts'], reverse=True)
+            path = self._path(partition)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(jobs, f, indent=2)
+            os.replace(tmp_path, path)
+        for partition in self._dropped:
+            try:
+                os.remove(self._path(partition))
+            except FileNotFoundError:
+                pass
+        self._dirty.clear()
+        self._dropped.clear()
@@ -0,0 +1,340 @@
+"""
+Link liveness checks for the stored corpus.
+
+Stored programs, blog posts and jobs keep their URLs until a merge drops them,
+so links that have gone dead keep being served and re-merged. The checker
+probes every stored URL with a HEAD request, falling back to a ranged GET of
+the first byte for servers that reject or mishandle HEAD. Requests run
+concurrently under a global limit and a smaller per-host limit, so thousands of
+links are checked quickly without hammering any one site.
+
+Results are cached in ``data/link_liveness.json`` with a TTL per outcome, so
+repeated runs only probe links whose result has expired:
+
+* ``alive`` - the link (or its redirect target) answered with 2xx/3xx
+* ``dead`` - 404/410, or the host has been unreachable on several checks in a row
+* ``unknown`` - timeouts, rate limits, server errors; retried sooner
+
+When every redirect on the way to the target is permanent (301/308), the
+target becomes the record's canonical URL. The old URL is kept in
+``redirected_from`` and the cache maps it to the canonical URL, so re-scraped
+records are stored under the canonical URL too. Dead records are marked with
+``link_status`` or, with ``prune``, removed.
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+import urllib.parse
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger(__name__)
+
+ALIVE = 'alive'
+DEAD = 'dead'
+UNKNOWN = 'unknown'
+
+# Statuses that mean the resource is gone
+GONE_STATUSES = {404, 410}
+
+# Statuses with which servers commonly reject or mishandle HEAD; those are retried with a ranged GET
+HEAD_FALLBACK_STATUSES = {400, 403, 405, 406, 429, 500, 501, 502, 503}
+
+PERMANENT_REDIRECTS = {301, 308}
+
+# Fields holding the link of each resource type, in order of preference
+URL_FIELDS = {
+    'github_programs': ('url',),
+    'blog_posts': ('link', 'url'),
+    'job_listings': ('url',)
+}
+
+# Seconds each outcome stays cached before the link is probed again
+DEFAULT_TTLS = {
+    ALIVE: 7 * 86400,
+    DEAD: 86400,
+    UNKNOWN: 6 * 3600
+}
+
+
+def record_url(record: Dict, resource_type: str) -> Tuple[Optional[str], Optional[str]]:
+    """Get the (field, url) of a record's link, or (None, None) if it has none."""
+    for field in URL_FIELDS[resource_type]:
+        url = record.get(field)
+        if isinstance(url, str) and url.startswith(('http://', 'https://')):
+            return field, url
+    return None, None
+
+
+class LivenessCache:
+    """Persistent liveness results keyed by URL, with a TTL per outcome."""
+
+    def __init__(self, path: str, ttls: Optional[Dict[str, float]] = None):
+        self.path = path
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading link liveness cache from {self.path}: {str(e)}")
+            self.entries = {}
+
+    def save(self):
+        """Persist the results, dropping entries that expired long ago."""
+        if not self._dirty:
+            return
+        horizon = time.time() - 4 * max(self.ttls.values())
+        entries = {
+            url: entry for url, entry in self.entries.items()
+            if entry.get('checked_at', 0) >= horizon or entry.get('canonical')
+        }
+        try:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except Exception as e:
+            logger.error(f"Error saving link liveness cache to {self.path}: {str(e)}")
+
+    def get(self, url: str, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Get the cached result for a URL if it has not expired."""
+        entry = self.entries.get(url)
+        if entry is None:
+            return None
+        now = time.time() if now is None else now
+        if now - entry.get('checked_at', 0) >= self.ttls.get(entry.get('status'), 0):
+            return None
+        return entry
+
+    def put(self, url: str, result: Dict[str, Any]):
+        self.entries[url] = result
+        self._dirty = True
+
+    def canonical(self, url: str) -> str:
+        """Follow recorded permanent redirects from a URL to its canonical URL."""
+        seen = {url}
+        while True:
+            target = (self.entries.get(url) or {}).get('canonical')
+            if not target or target in seen:
+                return url
+            seen.add(target)
+            url = target
+
+
+class LinkChecker:
+    """Checks URLs concurrently with per-host limits, using and filling a LivenessCache."""
+
+    def __init__(self, session: 'aiohttp.ClientSession', cache: LivenessCache, concurrency: int = 64,
+                 per_host: int = 4, timeout: float = 15, dead_after: int = 3, metrics=None):
+        """
+        Args:
+            session: Session to send probes with
+            cache: Results cache, consulted before and updated after every probe
+            concurrency: Maximum probes in flight overall
+            per_host: Maximum probes in flight to any one host
+            timeout: Seconds before a probe counts as timed out
+            dead_after: Consecutive unreachable checks after which a link is dead
+            metrics: Optional ScraperMetrics to record probes and outcomes in
+        """
+        self.session = session
+        self.cache = cache
+        self.per_host = per_host
+        self.timeout = timeout
+        self.dead_after = dead_after
+        self.metrics = metrics
+        self._slots = asyncio.Semaphore(concurrency)
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+
+    def _host_slots(self, url: str) -> asyncio.Semaphore:
+        host = urllib.parse.urlsplit(url).netloc.lower()
+        if host not in self._hosts:
+            self._hosts[host] = asyncio.Semaphore(self.per_host)
+        return self._hosts[host]
+
+    async def check(self, url: str) -> Dict[str, Any]:
+        """Get the liveness of one URL, from the cache when its result is still fresh."""
+        cached = self.cache.get(url)
+        if cached is not None:
+            if self.metrics is not None:
+                self.metrics.link_checks.inc(outcome='cached')
+            return cached
+
+        previous = self.cache.entries.get(url) or {}
+        async with self._host_slots(url), self._slots:
+            result = await self._probe(url)
+
+        if result['status'] == UNKNOWN and result.pop('unreachable', False):
+            # DNS failures and refused connections are often transient, so only a streak counts as dead
+            result['failures'] = previous.get('failures', 0) + 1
+            if result['failures'] >= self.dead_after:
+                result['status'] = DEAD
+        result.pop('unreachable', None)
+        result['checked_at'] = time.time()
+        self.cache.put(url, result)
+        if self.metrics is not None:
+            self.metrics.link_checks.inc(outcome=result['status'])
+        return result
+
+    async def _request(self, method: str, url: str, headers: Optional[Dict] = None):
+        """Send one probe, returning (status, final url, redirect statuses) without reading the body."""
+        import aiohttp
+
+        start = time.monotonic()
+        status = 'error'
+        try:
+            async with self.session.request(method, url, headers=headers, allow_redirects=True,
+                                            timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
+                status = response.status
+                return response.status, str(response.url), [step.status for step in response.history]
+        except asyncio.TimeoutError:
+            status = 'timeout'
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.observe_request(url, status, time.monotonic() - start)
+
+    async def _probe(self, url: str) -> Dict[str, Any]:
+        import aiohttp
+
+        try:
+            status, final_url, redirects = await self._request('HEAD', url)
+            if status in HEAD_FALLBACK_STATUSES:
+                # Ask for the first byte only; servers that ignore Range still answer before the body is read
+                status, final_url, redirects = await self._request('GET', url, headers={'Range': 'bytes=0-0'})
+        except asyncio.TimeoutError:
+            return {'status': UNKNOWN, 'http_status': None, 'error': 'timeout'}
+        except aiohttp.ClientSSLError as e:
+            # The host answered, so the link may well be fine for browsers
+            return {'status': UNKNOWN, 'http_status': None, 'error': str(e)}
+        except (aiohttp.ClientConnectorError, aiohttp.InvalidURL) as e:
+            return {'status': UNKNOWN, 'http_status': None, 'error': str(e), 'unreachable': True}
+        except aiohttp.ClientError as e:
+            return {'status': UNKNOWN, 'http_status': None, 'error': str(e)}
+
+        result = {'status': UNKNOWN, 'http_status': status}
+        if status in GONE_STATUSES:
+            result['status'] = DEAD
+        elif status < 400 or status == 416:
+            # 416: the Range was rejected, but the resource exists
+            result['status'] = ALIVE
+        if redirects and final_url != url and all(step in PERMANENT_REDIRECTS for step in redirects):
+            result['canonical'] = final_url
+        return result
+
+    async def check_all(self, urls: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Check many URLs concurrently; the limits are applied inside each check."""
+        urls = list(dict.fromkeys(urls))
+
+        async def check(url):
+            try:
+                return url, await self.check(url)
+            except Exception as e:
+                logger.error(f"Error checking link {url}: {str(e)}")
+                return url, {'status': UNKNOWN, 'http_status': None, 'error': str(e)}
+
+        return dict(await asyncio.gather(*(check(url) for url in urls)))
+
+
+def apply_results(resources: Dict[str, List[Dict]], results: Dict[str, Dict[str, Any]],
+                  prune: bool = False) -> Tuple[Dict[str, List[Dict]], Dict[str, Dict[str, int]]]:
+    """Mark records with their link status, move them to canonical URLs and optionally drop dead ones.
+
+    Returns:
+        The updated resources, and per resource type counts of alive, dead,
+        unknown, redirected and pruned records
+    """
+    checked_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    updated = {}
+    summary = {}
+    for resource_type, records in resources.items():
+        counts = {ALIVE: 0, DEAD: 0, UNKNOWN: 0, 'redirected': 0, 'pruned': 0}
+        kept = []
+        for record in records:
+            field, url = record_url(record, resource_type)
+            result = results.get(url) if url else None
+            if result is None:
+                kept.append(record)
+                continue
+            counts[result['status']] += 1
+            canonical = result.get('canonical')
+            if canonical and canonical != url:
+                record[field] = canonical
+                record['redirected_from'] = sorted(set(record.get('redirected_from', [])) | {url})
+                counts['redirected'] += 1
+            record['link_status'] = result['status']
+            record['link_checked_at'] = checked_at
+            if prune and result['status'] == DEAD:
+                counts['pruned'] += 1
+                continue
+            kept.append(record)
+        updated[resource_type] = kept
+        summary[resource_type] = counts
+    return updated, summary
+
+
+async def check_corpus(scraper, resource_types: Optional[Iterable[str]] = None, prune: bool = False,
+                       concurrency: int = 64, per_host: int = 4, timeout: float = 15,
+                       ttls: Optional[Dict[str, float]] = None) -> Dict[str, Dict[str, int]]:
+    """Check every stored link, then save the marked (or pruned) resources and republish them.
+
+    Args:
+        scraper: DevRelScraper whose stored resources are checked
+        resource_types: Resource types to check (default: all)
+        prune: Remove dead records instead of only marking them
+        concurrency: Maximum probes in flight overall
+        per_host: Maximum probes in flight to one host
+        timeout: Seconds per probe
+        ttls: Cache TTL in seconds per outcome, overriding DEFAULT_TTLS
+
+    Returns:
+        Per resource type counts of alive, dead, unknown, redirected and pruned records
+    """
+    import aiohttp
+
+    resources = scraper._load_existing_resources()
+    selected = list(resource_types or URL_FIELDS)
+    urls = []
+    for resource_type in selected:
+        for record in resources.get(resource_type, []):
+            _, url = record_url(record, resource_type)
+            if url:
+                urls.append(url)
+
+    cache = scraper.link_cache(ttls)
+    # Probes never read bodies, so keep connections per host small and reuse them
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=per_host)
+    async with aiohttp.ClientSession(connector=connector, headers={'User-Agent': scraper.headers['User-Agent']}) as session:
+        checker = LinkChecker(session, cache, concurrency=concurrency, per_host=per_host, timeout=timeout,
+                              metrics=scraper.metrics)
+        started = time.monotonic()
+        results = await checker.check_all(urls)
+    cache.save()
+    logger.info(f"Checked {len(results)} links in {time.monotonic() - started:.1f}s")
+
+    updated, summary = apply_results({resource_type: resources.get(resource_type, []) for resource_type in selected},
+                                     results, prune)
+    if 'job_listings' in updated and scraper.job_store is not None:
+        # Records came from the partitioned store; write the marks and removals back to it
+        kept = {id(job) for job in updated['job_listings']}
+        scraper.job_store.remove([job for job in resources['job_listings'] if id(job) not in kept])
+        scraper.job_store.touch(updated['job_listings'])
+        scraper.job_store.save()
+    await scraper._save_results({**resources, **updated})
+    scraper.write_metrics()
+
+    for resource_type, counts in summary.items():
+        logger.info(f"{resource_type}: " + ', '.join(f"{count} {name}" for name, count in counts.items()))
+    return summary
@@ -0,0 +1,249 @@
+"""
+Event-loop stall watchdog.
+
+A heartbeat task sleeps for a short interval on the loop being watched and
+measures how late it wakes up. That lateness is the loop lag: the time some
+callback or coroutine held the loop without yielding. A monitor thread watches
+the heartbeat. When no beat arrives within the threshold, it captures the
+loop thread's stack with ``sys._current_frames``, which shows the call that is
+blocking, and the task that made it.
+
+Stalls are grouped by the innermost frame in scraper code, so a run report
+shows which call sites block the loop, how often and for how long. It also
+shows lag percentiles and the share of the run the loop was stalled, which
+tells whether the run really overlapped its I/O.
+"""
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from datetime import datetime
+from typing import Any, Awaitable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Frames from these paths are the event loop machinery, not the blocking call site
+_LIBRARY_PATHS = (os.path.dirname(asyncio.__file__), os.path.dirname(threading.__file__))
+
+# Stack frames kept per sampled stall
+MAX_STACK_FRAMES = 30
+
+# Lag samples kept for percentiles
+MAX_LAG_SAMPLES = 100000
+
+
+def _project_root() -> str:
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class LoopWatchdog:
+    """Measures event-loop lag and samples the loop thread's stack when it stalls.
+
+    Use as an async context manager around the work to watch::
+
+        async with LoopWatchdog(threshold=0.1) as watchdog:
+            await scraper.scrape_all()
+        watchdog.write_report(path)
+    """
+
+    def __init__(self, interval: float = 0.01, threshold: float = 0.1):
+        """
+        Args:
+            interval: Seconds between heartbeats
+            threshold: Seconds without a heartbeat after which the loop counts as stalled
+        """
+        self.interval = interval
+        self.threshold = threshold
+        self.lags: List[float] = []
+        self.stalls: Dict[str, Dict] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat = 0.0
+        self._pending: Optional[Dict] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._monitor: Optional[threading.Thread] = None
+        self._started = None
+        self._finished = None
+
+    async def __aenter__(self) -> 'LoopWatchdog':
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    def start(self):
+        """Start the heartbeat and monitor; must be called from the watched loop."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._started = time.monotonic()
+        self._last_beat = self._started
+        self._stop.clear()
+        self._heartbeat = self._loop.create_task(self._beat(), name='loop-watchdog-heartbeat')
+        self._monitor = threading.Thread(target=self._watch, name='loop-watchdog', daemon=True)
+        self._monitor.start()
+
+    async def stop(self):
+        """Stop watching and finish any stall still in progress."""
+        self._stop.set()
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            try:
+                await self._heartbeat
+            except asyncio.CancelledError:
+                pass
+        if self._monitor is not None:
+            await asyncio.to_thread(self._monitor.join)
+        self._finished = time.monotonic()
+        self._close_stall(self._finished)
+
+    async def _beat(self):
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+            if len(self.lags) < MAX_LAG_SAMPLES:
+                self.lags.append(lag)
+            self._close_stall(now)
+
+    def _watch(self):
+        check_every = min(self.interval, self.threshold / 4)
+        while not self._stop.wait(check_every):
+            stalled_for = time.monotonic() - self._last_beat
+            if stalled_for >= self.threshold and self._pending is None:
+                self._capture()
+
+    def _capture(self):
+        """Sample the loop thread's stack and the task it is running."""
+        beat = self._last_beat
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+        stack = traceback.extract_stack(frame)[-MAX_STACK_FRAMES:]
+        task = asyncio.current_task(self._loop)
+        coroutine = task.get_coro() if task is not None else None
+        with self._lock:
+            if self._last_beat != beat:
+                # The loop caught up while the stack was sampled, so it shows the wrong call
+                return
+            self._pending = {
+                'site': self._site(stack),
+                'task': task.get_name() if task is not None else None,
+                'coroutine': getattr(coroutine, '__qualname__', None),
+                'stack': [f"{entry.filename}:{entry.lineno} in {entry.name}" for entry in stack]
+            }
+
+    @staticmethod
+    def _site(stack: traceback.StackSummary) -> str:
+        """Get the innermost frame in scraper code (or outside the loop machinery) as the stall site."""
+        root = _project_root()
+        fallback = None
+        for entry in reversed(stack):
+            if entry.filename == __file__:
+                continue
+            if entry.filename.startswith(root):
+                return f"{os.path.relpath(entry.filename, root)}:{entry.lineno} in {entry.name}"
+            if fallback is None and not entry.filename.startswith(_LIBRARY_PATHS):
+                fallback = f"{entry.filename}:{entry.lineno} in {entry.name}"
+        return fallback or 'unknown'
+
+    def _close_stall(self, now: float):
+        """Record a heartbeat, attributing the time since the last one to a captured stall."""
+        with self._lock:
+            duration = now - self._last_beat
+            self._last_beat = now
+            pending, self._pending = self._pending, None
+            if pending is None:
+                return
+            entry = self.stalls.setdefault(pending['site'], {
+                'count': 0,
+                'total_seconds': 0.0,
+                'max_seconds': 0.0,
+                'tasks': {},
+                'stack': pending['stack']
+            })
+            entry['count'] += 1
+            entry['total_seconds'] += duration
+            if duration > entry['max_seconds']:
+                entry['max_seconds'] = duration
+                entry['stack'] = pending['stack']
+            task = pending['coroutine'] or pending['task'] or 'callback'
+            entry['tasks'][task] = entry['tasks'].get(task, 0) + 1
+
+    @staticmethod
+    def _percentile(ordered: List[float], fraction: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def report(self) -> Dict:
+        """Summarize loop lag and stalls, worst stall sites first."""
+        ordered = sorted(self.lags)
+        wall = ((self._finished or time.monotonic()) - self._started) if self._started else 0.0
+        stalled = sum(entry['total_seconds'] for entry in self.stalls.values())
+        sites = sorted(self.stalls.items(), key=lambda item: item[1]['total_seconds'], reverse=True)
+        return {
+            'generated_at': datetime.now().isoformat(),
+            'interval_seconds': self.interval,
+            'threshold_seconds': self.threshold,
+            'wall_seconds': round(wall, 3),
+            'stalled_seconds': round(stalled, 3),
+            'stalled_fraction': round(stalled / wall, 4) if wall else 0.0,
+            'lag_seconds': {
+                'samples': len(ordered),
+                'p50': round(self._percentile(ordered, 0.5), 6),
+                'p99': round(self._percentile(ordered, 0.99), 6),
+                'max': round(ordered[-1], 6) if ordered else 0.0
+            },
+            'stalls': [
+                {
+                    'site': site,
+                    'count': entry['count'],
+                    'total_seconds': round(entry['total_seconds'], 4),
+                    'max_seconds': round(entry['max_seconds'], 4),
+                    'tasks': entry['tasks'],
+                    'stack': entry['stack']
+                }
+                for site, entry in sites
+            ]
+        }
+
+    def write_report(self, path: str) -> Optional[Dict]:
+        """Write the report as JSON and log the worst stall sites."""
+        report = self.report()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.error(f"Error writing loop stall report: {str(e)}")
+            return None
+
+        lag = report['lag_seconds']
+        logger.info(f"Event loop stalled {report['stalled_seconds']}s of {report['wall_seconds']}s "
+                    f"({report['stalled_fraction']:.1%}), lag p50 {lag['p50'] * 1000:.1f}ms, "
+                    f"p99 {lag['p99'] * 1000:.1f}ms, max {lag['max'] * 1000:.1f}ms; report written to {path}")
+        for stall in report['stalls'][:5]:
+            logger.info(f"  {stall['count']} stalls, {stall['total_seconds']}s total, "
+                        f"{stall['max_seconds']}s max at {stall['site']}")
+        return report
+
+
+async def watch(awaitable: Awaitable, report_path: str, threshold: float = 0.1) -> Any:
+    """Await something under a watchdog and write the stall report when it finishes."""
+    watchdog = LoopWatchdog(threshold=threshold)
+    watchdog.start()
+    try:
+        return await awaitable
+    finally:
+        await watchdog.stop()
+        watchdog.write_report(report_path)
@@ -0,0 +1,111 @@
+"""
+Content-hash memoization of cleaning and classification results.
+
+Results are keyed by a hash of the raw input and stamped with a version of the
+rule set, so unchanged blog descriptions and job postings skip the CPU work on
+re-runs, and changing the keyword lists invalidates every entry automatically.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def rules_version(*rule_sets: Any) -> str:
+    """Hash rule definitions (keyword lists, code version numbers) into a version stamp."""
+    canonical = json.dumps(
+        [sorted(rules) if isinstance(rules, (set, frozenset)) else rules for rules in rule_sets],
+        sort_keys=True
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+class ContentMemo:
+    """Persistent LRU cache of results keyed by a namespace and a content hash."""
+
+    def __init__(self, path: str, version: str, max_entries: int = 50000):
+        self.path = path
+        self.version = version
+        self.max_entries = max_entries
+        self.entries: 'OrderedDict[str, Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._loaded = False
+        # Classification runs in worker threads, so guard the shared OrderedDict
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self):
+        """Read the memo file on first use, so commands that never clean or classify skip it."""
+        if self._loaded:
+            return
+        with self._lock:
+            if not self._loaded:
+                self._load()
+                self._loaded = True
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != self.version:
+                logger.info("Rule set changed since the content memo was written, discarding it")
+                self._dirty = True
+                return
+            self.entries = OrderedDict(data.get('entries', []))
+            logger.info(f"Loaded {len(self.entries)} memoized results")
+        except Exception as e:
+            logger.error(f"Error loading content memo from {self.path}: {str(e)}")
+
+    def save(self):
+        """Persist the cache, oldest entries first so LRU order survives reloads."""
+        if not self._dirty:
+            return
+        try:
+            with self._lock:
+                data = {'version': self.version, 'entries': list(self.entries.items())}
+                self._dirty = False
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Error saving content memo to {self.path}: {str(e)}")
+
+    @staticmethod
+    def key(namespace: str, parts: Iterable[str]) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode('utf-8', 'surrogatepass'))
+            digest.update(b'\x00')
+        return f"{namespace}:{digest.hexdigest()}"
+
+    def get_or_compute(self, namespace: str, parts: Tuple[str, ...], compute: Callable[[], Any]) -> Any:
+        """Get the memoized result for the inputs, computing and storing it on a miss."""
+        self._ensure_loaded()
+        key = self.key(namespace, parts)
+        with self._lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+
+        value = compute()
+        with self._lock:
+            self.misses += 1
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            self._dirty = True
+        return value
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self.entries)}
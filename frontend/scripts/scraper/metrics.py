@@ -0,0 +1,264 @@
+"""
+Run metrics for the scraper in the Prometheus text exposition format.
+
+Counters, gauges and histograms are kept in memory for the life of the scraper
+(one run, or every cycle of the daemon) and can be rendered for a ``/metrics``
+endpoint or written to ``data/metrics.prom`` for a node exporter textfile
+collector. Updates are thread-safe because parsing and classification run in
+worker threads.
+"""
+import logging
+import math
+import os
+import threading
+import urllib.parse
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds for request and fetch latencies
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+# Upper bounds in seconds for CPU-bound parsing
+PARSE_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    """A metric family: one value (or histogram) per combination of label values."""
+
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Mapping[str, object]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+        return '\n'.join(lines + self.samples())
+
+
+class Counter(Metric):
+    """A monotonically increasing count."""
+
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}' for key, value in items]
+
+
+class Gauge(Counter):
+    """A value that can go up and down."""
+
+    kind = 'gauge'
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Histogram(Metric):
+    """Observations counted into cumulative buckets, with their sum and count."""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Iterable[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * len(self.buckets), 0.0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._values[key] = (counts, total + value)
+
+    def count(self, **labels) -> int:
+        counts, _ = self._values.get(self._key(labels), ([0], 0.0))
+        return sum(counts)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self._values.items())
+        lines = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f'{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}')
+            lines.append(f'{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}')
+            lines.append(f'{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}')
+        return lines
+
+
+class MetricsRegistry:
+    """A set of metric families rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Iterable[float] = LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        return '\n'.join(metric.render() for metric in self._metrics.values()) + '\n'
+
+    def write(self, path: str) -> Optional[str]:
+        """Atomically write the rendered metrics to a file, returning its path."""
+        try:
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self.render())
+            os.replace(tmp_path, path)
+            return path
+        except Exception as e:
+            logger.error(f"Error writing metrics to {path}: {str(e)}")
+            return None
+
+
+class ScraperMetrics(MetricsRegistry):
+    """The metric families recorded by DevRelScraper and its pipeline."""
+
+    def __init__(self):
+        super().__init__()
+        self.request_seconds = self.histogram(
+            'devrel_scraper_http_request_duration_seconds',
+            'Time from sending an HTTP request to reading its whole body.',
+            ('host', 'status'))
+        self.response_bytes = self.counter(
+            'devrel_scraper_http_response_bytes_total',
+            'Response body bytes received.',
+            ('host',))
+        self.truncated_responses = self.counter(
+            'devrel_scraper_http_truncated_responses_total',
+            'Response bodies cut off at the size cap or rejected before reading '
+            '(content_type, content_length or size_cap).',
+            ('host', 'reason'))
+        self.retries = self.counter(
+            'devrel_scraper_http_retries_total',
+            'Requests retried after a failed or empty response.',
+            ('source',))
+        self.rate_limit_remaining = self.gauge(
+            'devrel_scraper_rate_limit_remaining',
+            'Requests left in the current rate limit window, from X-RateLimit-Remaining.',
+            ('host', 'resource'))
+        self.rate_limit_limit = self.gauge(
+            'devrel_scraper_rate_limit_limit',
+            'Size of the current rate limit window, from X-RateLimit-Limit.',
+            ('host', 'resource'))
+        self.fetch_seconds = self.histogram(
+            'devrel_scraper_source_fetch_duration_seconds',
+            'Time to fetch one source, including request coalescing and memoization.',
+            ('source',))
+        self.fetches = self.counter(
+            'devrel_scraper_source_fetches_total',
+            'Source fetches by outcome (ok, failed or skipped by an open circuit).',
+            ('source', 'outcome'))
+        self.parse_seconds = self.histogram(
+            'devrel_scraper_parse_duration_seconds',
+            'Time to parse one source payload into candidate records.',
+            ('parser',), buckets=PARSE_BUCKETS)
+        self.items = self.counter(
+            'devrel_scraper_items_total',
+            'Records per source and stage (parsed, kept, discarded, duplicate, new).',
+            ('source', 'stage'))
+        self.link_checks = self.counter(
+            'devrel_scraper_link_checks_total',
+            'Stored links checked for liveness by outcome (alive, dead, unknown, cached).',
+            ('outcome',))
+
+    def observe_request(self, url: str, status: object, seconds: float, nbytes: Optional[int] = None):
+        """Record one HTTP request; status is the HTTP code or 'timeout'/'error'."""
+        host = urllib.parse.urlsplit(url).hostname or 'unknown'
+        self.request_seconds.observe(seconds, host=host, status=status)
+        if nbytes:
+            self.response_bytes.inc(nbytes, host=host)
+
+    def observe_truncation(self, url: str, reason: str):
+        """Record a response body that was not read whole."""
+        host = urllib.parse.urlsplit(url).hostname or 'unknown'
+        self.truncated_responses.inc(host=host, reason=reason)
+
+    def observe_rate_limit(self, url: str, headers: Mapping[str, str]):
+        """Record rate limit headroom from X-RateLimit-* response headers, if present."""
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            return
+        host = urllib.parse.urlsplit(url).hostname or 'unknown'
+        resource = headers.get('X-RateLimit-Resource', 'default')
+        try:
+            self.rate_limit_remaining.set(int(remaining), host=host, resource=resource)
+            if headers.get('X-RateLimit-Limit') is not None:
+                self.rate_limit_limit.set(int(headers['X-RateLimit-Limit']), host=host, resource=resource)
+        except ValueError:
+            logger.debug(f"Ignoring malformed rate limit headers from {host}")
+
+    def record_items(self, source: str, stage: str, count: int = 1):
+        if count:
+            self.items.inc(count, source=source, stage=stage)
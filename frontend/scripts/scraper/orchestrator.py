@@ -0,0 +1,228 @@
+"""
+Checkpointed, resumable multi-stage run orchestrator.
+
+Stages form a DAG: each stage runs as soon as the stages it depends on have
+finished, so independent stages run concurrently, each under its own timeout.
+Finished stage outputs are checkpointed to disk, and a run that crashed or was
+interrupted resumes from its last good checkpoints instead of re-spending API
+quota on stages that already succeeded.
+"""
+import asyncio
+import json
+import logging
+import os
+import shutil
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+RUN_FILE = 'run.json'
+
+# Format of run ids, which are the run's start time
+RUN_ID_FORMAT = '%Y%m%dT%H%M%S%f'
+
+# Unfinished runs older than this are started over instead of resumed
+MAX_RESUME_AGE = 24 * 3600
+
+
+@dataclass
+class Stage:
+    """A unit of work in a run.
+
+    ``func`` receives a dict of the outputs of the stages listed in ``deps``
+    and must return a JSON-serializable result.
+    """
+    name: str
+    func: Callable[[Dict[str, Any]], Awaitable[Any]]
+    deps: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+
+
+class StageError(Exception):
+    """Raised when a run finishes with failed or skipped stages."""
+
+    def __init__(self, run_id: str, failed: Dict[str, str]):
+        self.run_id = run_id
+        self.failed = failed
+        super().__init__(f"Run {run_id} has unfinished stages: {failed}")
+
+
+class RunOrchestrator:
+    """Runs a DAG of stages with per-stage timeouts and on-disk checkpoints."""
+
+    def __init__(self, stages: List[Stage], checkpoint_dir: str, keep_runs: int = 3,
+                 max_resume_age: Optional[float] = MAX_RESUME_AGE):
+        self.stages = {stage.name: stage for stage in stages}
+        self.checkpoint_dir = checkpoint_dir
+        self.keep_runs = keep_runs
+        self.max_resume_age = max_resume_age
+        self._validate()
+
+    def _validate(self):
+        """Check that every dependency exists and the stages have no cycles."""
+        for stage in self.stages.values():
+            for dep in stage.deps:
+                if dep not in self.stages:
+                    raise ValueError(f"Stage {stage.name} depends on unknown stage {dep}")
+
+        visiting, done = set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Stage dependency cycle through {name}")
+            visiting.add(name)
+            for dep in self.stages[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.stages:
+            visit(name)
+
+    def _run_dir(self, run_id: str) -> str:
+        return os.path.join(self.checkpoint_dir, run_id)
+
+    def _read_json(self, path: str) -> Optional[Any]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error reading checkpoint {path}: {str(e)}")
+            return None
+
+    def _write_json(self, path: str, data: Any):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def _find_resumable_run(self) -> Optional[str]:
+        """Get the most recent run that did not complete, if any and not too old to resume."""
+        if not os.path.isdir(self.checkpoint_dir):
+            return None
+        for run_id in sorted(os.listdir(self.checkpoint_dir), reverse=True):
+            state = self._read_json(os.path.join(self._run_dir(run_id), RUN_FILE))
+            if state is None:
+                continue
+            if state.get('status') == 'complete':
+                return None
+            if self.max_resume_age is not None:
+                try:
+                    age = (datetime.now() - datetime.strptime(run_id, RUN_ID_FORMAT)).total_seconds()
+                except ValueError:
+                    age = None
+                if age is None or age > self.max_resume_age:
+                    # Its checkpointed outputs are stale; start a fresh run instead
+                    logger.info(f"Not resuming run {run_id}: started too long ago")
+                    return None
+            return run_id
+        return None
+
+    def _prune_completed_runs(self):
+        """Keep only the most recent completed runs."""
+        run_ids = sorted(os.listdir(self.checkpoint_dir), reverse=True)
+        for run_id in run_ids[self.keep_runs:]:
+            shutil.rmtree(self._run_dir(run_id), ignore_errors=True)
+
+    def _load_checkpoints(self, run_id: str) -> Dict[str, Any]:
+        """Load the outputs of stages already finished in a run."""
+        outputs = {}
+        state = self._read_json(os.path.join(self._run_dir(run_id), RUN_FILE)) or {}
+        for name in state.get('completed', []):
+            if name not in self.stages:
+                continue
+            data = self._read_json(os.path.join(self._run_dir(run_id), f'{name}.json'))
+            if data is not None:
+                outputs[name] = data['output']
+        return outputs
+
+    def _save_state(self, run_id: str, status: str, outputs: Dict[str, Any], failed: Dict[str, str]):
+        self._write_json(os.path.join(self._run_dir(run_id), RUN_FILE), {
+            'run_id': run_id,
+            'status': status,
+            'completed': sorted(outputs),
+            'failed': failed,
+            'updated_at': datetime.now().isoformat()
+        })
+
+    async def run(self, resume: bool = True) -> Dict[str, Any]:
+        """Run all stages, resuming an unfinished run when ``resume`` is set.
+
+        Returns:
+            Dictionary mapping stage names to their outputs
+
+        Raises:
+            StageError: If any stage failed, timed out or was skipped; the run
+                stays resumable from its checkpoints.
+        """
+        run_id = self._find_resumable_run() if resume else None
+        if run_id:
+            outputs = self._load_checkpoints(run_id)
+            logger.info(f"Resuming run {run_id} with checkpointed stages: {sorted(outputs)}")
+        else:
+            run_id = datetime.now().strftime(RUN_ID_FORMAT)
+            outputs = {}
+            logger.info(f"Starting run {run_id}")
+        os.makedirs(self._run_dir(run_id), exist_ok=True)
+        self._save_state(run_id, 'running', outputs, {})
+
+        failed: Dict[str, str] = {}
+        running: Dict[asyncio.Task, str] = {}
+
+        while True:
+            # Start every stage whose dependencies have all finished
+            for name, stage in self.stages.items():
+                if name in outputs or name in failed or name in running.values():
+                    continue
+                if any(dep in failed for dep in stage.deps):
+                    failed[name] = 'skipped: dependency failed'
+                    logger.warning(f"Skipping stage {name}: a dependency failed")
+                    continue
+                if all(dep in outputs for dep in stage.deps):
+                    inputs = {dep: outputs[dep] for dep in stage.deps}
+                    running[asyncio.create_task(self._run_stage(stage, inputs))] = name
+
+            if not running:
+                break
+
+            finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                name = running.pop(task)
+                try:
+                    output = task.result()
+                except asyncio.TimeoutError:
+                    failed[name] = f'timed out after {self.stages[name].timeout}s'
+                    logger.error(f"Stage {name} timed out")
+                except Exception as e:
+                    failed[name] = str(e) or type(e).__name__
+                    logger.error(f"Stage {name} failed: {failed[name]}")
+                else:
+                    self._write_json(os.path.join(self._run_dir(run_id), f'{name}.json'), {
+                        'stage': name,
+                        'finished_at': datetime.now().isoformat(),
+                        'output': output
+                    })
+                    outputs[name] = output
+                    logger.info(f"Stage {name} checkpointed")
+                self._save_state(run_id, 'running', outputs, failed)
+
+        if failed:
+            self._save_state(run_id, 'failed', outputs, failed)
+            raise StageError(run_id, failed)
+
+        self._save_state(run_id, 'complete', outputs, {})
+        self._prune_completed_runs()
+        logger.info(f"Run {run_id} complete")
+        return outputs
+
+    async def _run_stage(self, stage: Stage, inputs: Dict[str, Any]) -> Any:
+        logger.info(f"Starting stage {stage.name}")
+        if stage.timeout:
+            return await asyncio.wait_for(stage.func(inputs), timeout=stage.timeout)
+        return await stage.func(inputs)
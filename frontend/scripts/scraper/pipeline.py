@@ -0,0 +1,235 @@
+"""
+Staged streaming pipeline for DevRel resource scraping.
+
+Sources flow through fetch -> parse -> classify -> dedup -> sink stages that are
+connected by bounded asyncio queues. A slow stage fills its input queue and
+blocks the stages upstream of it, so memory stays bounded, and records reach
+storage as soon as they are ready instead of after the slowest source returns.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_TYPES = ('github_programs', 'blog_posts', 'job_listings')
+
+# resource_type label stamped on newly added records, as in append_resources
+RESOURCE_LABELS = {
+    'github_programs': 'github',
+    'blog_posts': 'blog',
+    'job_listings': 'job'
+}
+
+# Marker passed down a queue to stop one worker of the next stage
+_STOP = object()
+
+
+@dataclass
+class PipelineConfig:
+    """Worker counts and queue bounds for the scrape pipeline."""
+    fetch_workers: int = 8
+    parse_workers: int = 2
+    classify_workers: int = 2
+    queue_size: int = 32
+    flush_every: int = 50
+    # Maximum sources polled per run, allocated by yield (None polls every source)
+    request_budget: Optional[int] = None
+
+
+def dedup_key(resource_type: str, record: Dict) -> Any:
+    """Get the key used to deduplicate a record of the given resource type."""
+    if resource_type == 'github_programs':
+        return record.get('url', '')
+    if resource_type == 'blog_posts':
+        return record.get('link', '')
+    return (record.get('company', ''), record.get('title', ''))
+
+
+class ResourceSink:
+    """Merges pipeline records into stored resources and publishes them incrementally."""
+
+    def __init__(self, scraper, flush_every: int = 50):
+        self.scraper = scraper
+        self.flush_every = flush_every
+        self.timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.resources = scraper._load_existing_resources()
+        self.known = {
+            resource_type: {dedup_key(resource_type, record) for record in self.resources[resource_type]}
+            for resource_type in RESOURCE_TYPES
+        }
+        self.pending = {resource_type: [] for resource_type in RESOURCE_TYPES}
+        self.added = {resource_type: 0 for resource_type in RESOURCE_TYPES}
+
+    def start_run(self):
+        """Start a new run, refreshing the added_at timestamp for new records."""
+        self.timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.added = {resource_type: 0 for resource_type in RESOURCE_TYPES}
+
+    def is_new(self, resource_type: str, record: Dict) -> bool:
+        """Check whether a record is not in storage yet."""
+        return dedup_key(resource_type, record) not in self.known[resource_type]
+
+    def add(self, resource_type: str, record: Dict, replaces: bool = False) -> bool:
+        """Queue a record for the next flush, returning True when a flush is due.
+
+        With ``replaces`` set, the record supersedes a copy added earlier in the
+        run. It takes that copy's place while the copy is still pending; once
+        flushed, the copy is replaced by the merge rules on the next flush.
+        """
+        key = dedup_key(resource_type, record)
+        self.scraper._stamp_resources([record], RESOURCE_LABELS[resource_type], self.timestamp)
+        pending = self.pending[resource_type]
+        if replaces:
+            for index, queued in enumerate(pending):
+                if dedup_key(resource_type, queued) == key:
+                    pending[index] = record
+                    return False
+            pending.append(record)
+            return len(pending) >= self.flush_every
+        self.known[resource_type].add(key)
+        pending.append(record)
+        self.added[resource_type] += 1
+        return len(pending) >= self.flush_every
+
+    def flush(self, resource_type: str, force: bool = False):
+        """Merge pending records of one type into storage and write its file."""
+        pending = self.pending[resource_type]
+        if not pending and not force:
+            return
+        self.pending[resource_type] = []
+        self.resources[resource_type] = self.scraper._merge_resources(
+            resource_type, pending, self.resources[resource_type]
+        )
+        path = self.scraper._save_resource_file(resource_type, self.resources[resource_type])
+        logger.info(f"Published {len(pending)} new {resource_type} to {path}, total: {len(self.resources[resource_type])}")
+
+    def close(self) -> Dict[str, List[Dict]]:
+        """Flush every resource type, snapshot and publish them, and return the merged resources."""
+        for resource_type in RESOURCE_TYPES:
+            self.flush(resource_type, force=True)
+        self.scraper.export_snapshots(self.resources)
+        self.scraper.publish_artifacts(self.resources)
+        return self.resources
+
+
+class ScrapePipeline:
+    """Runs sources through fetch, parse, classify, dedup and sink stages."""
+
+    def __init__(self, scraper, session, config: Optional[PipelineConfig] = None,
+                 sink: Optional[ResourceSink] = None):
+        self.scraper = scraper
+        self.session = session
+        self.config = config or PipelineConfig()
+        self.sink = sink
+        self.stats = {}
+
+    async def run(self, sources: List) -> Dict[str, List[Dict]]:
+        """Run every source through the pipeline and return the merged resources."""
+        config = self.config
+        if self.sink is None:
+            self.sink = await asyncio.to_thread(ResourceSink, self.scraper, config.flush_every)
+        self.sink.start_run()
+
+        self.stats = {name: 0 for name in ('fetched', 'failed', 'parsed', 'kept', 'discarded', 'duplicates', 'new', 'stored')}
+        # Dedup keys sent to the sink this run, with the relevance score of the copy sent
+        self._seen = {resource_type: {} for resource_type in RESOURCE_TYPES}
+
+        source_q = asyncio.Queue(maxsize=config.queue_size)
+        parse_q = asyncio.Queue(maxsize=config.queue_size)
+        classify_q = asyncio.Queue(maxsize=config.queue_size)
+        dedup_q = asyncio.Queue(maxsize=config.queue_size)
+        sink_q = asyncio.Queue(maxsize=config.queue_size)
+
+        async def feed():
+            for source in sources:
+                await source_q.put(source)
+            for _ in range(config.fetch_workers):
+                await source_q.put(_STOP)
+
+        await asyncio.gather(
+            feed(),
+            self._run_stage('fetch', config.fetch_workers, source_q, parse_q, config.parse_workers, self._fetch),
+            self._run_stage('parse', config.parse_workers, parse_q, classify_q, config.classify_workers, self._parse),
+            self._run_stage('classify', config.classify_workers, classify_q, dedup_q, 1, self._classify),
+            self._run_stage('dedup', 1, dedup_q, sink_q, 1, self._dedup),
+            self._run_stage('sink', 1, sink_q, None, 0, self._sink)
+        )
+
+        resources = await asyncio.to_thread(self.sink.close)
+        logger.info(f"Pipeline finished: {self.stats}")
+        return resources
+
+    async def _run_stage(self, name: str, workers: int, in_q: asyncio.Queue, out_q: Optional[asyncio.Queue],
+                         downstream_workers: int, handler: Callable):
+        """Run a stage's workers until stopped, then stop the next stage."""
+        async def worker():
+            while True:
+                item = await in_q.get()
+                if item is _STOP:
+                    return
+                try:
+                    await handler(item, out_q)
+                except Exception as e:
+                    logger.error(f"Error in pipeline stage {name}: {str(e)}")
+
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        if out_q is not None:
+            for _ in range(downstream_workers):
+                await out_q.put(_STOP)
+
+    async def _fetch(self, source, out_q: asyncio.Queue):
+        raw = await self.scraper.fetch_source(self.session, source)
+        if raw is None:
+            self.stats['failed'] += 1
+            return
+        self.stats['fetched'] += 1
+        await out_q.put((source, raw))
+
+    async def _parse(self, item, out_q: asyncio.Queue):
+        source, raw = item
+        # Parsing (BeautifulSoup, date handling) is CPU-bound, keep it off the event loop
+        records = await asyncio.to_thread(self.scraper.parse_source, source, raw)
+        self.stats['parsed'] += len(records)
+        for record in records:
+            await out_q.put((source, record))
+
+    async def _classify(self, item, out_q: asyncio.Queue):
+        source, record = item
+        kept = await asyncio.to_thread(self.scraper.classify_record, source, record)
+        if kept is None:
+            self.stats['discarded'] += 1
+            self.scraper.metrics.record_items(source.name, 'discarded')
+            return
+        self.stats['kept'] += 1
+        self.scraper.metrics.record_items(source.name, 'kept')
+        await out_q.put((source, kept))
+
+    async def _dedup(self, item, out_q: asyncio.Queue):
+        source, record = item
+        resource_type = source.resource_type
+        key = dedup_key(resource_type, record)
+        score = record.get('relevance_score', 0)
+        if not key or key in self._seen[resource_type]:
+            self.stats['duplicates'] += 1
+            self.scraper.metrics.record_items(source.name, 'duplicate')
+            if key and resource_type == 'blog_posts' and score > self._seen[resource_type][key]:
+                # As in _merge_blog_posts, the higher-scored copy wins, whichever feed returned first
+                self._seen[resource_type][key] = score
+                await out_q.put((resource_type, record, True))
+            return
+        self._seen[resource_type][key] = score
+        if self.sink.is_new(resource_type, record):
+            self.stats['new'] += 1
+            self.scraper.metrics.record_items(source.name, 'new')
+            self.scraper.yields.record_new(source.name)
+        await out_q.put((resource_type, record, False))
+
+    async def _sink(self, item, out_q: Optional[asyncio.Queue]):
+        resource_type, record, replaces = item
+        if not replaces:
+            self.stats['stored'] += 1
+        if self.sink.add(resource_type, record, replaces):
+            await asyncio.to_thread(self.sink.flush, resource_type)
@@ -0,0 +1,294 @@
+"""
+Opt-in run profiling for the scraper entry points (``--profile``).
+
+Scraper methods decorated with :func:`profiled` are grouped into stages (fetch,
+parse, classify, clean_html, merge, save, ...). While a :class:`RunProfiler`
+is attached to the scraper, each stage gets:
+
+* call count, wall time and CPU time
+* a cProfile profile per thread, merged when the report is written
+* peak traced memory (tracemalloc) sampled while the stage is active
+
+A sampling thread also records the stack of every thread at a fixed interval,
+which is written as a flamegraph-compatible collapsed-stack file.
+``write_report`` produces, in the run's profile directory:
+
+* ``report.txt`` / ``report.json`` - stage table, top functions by cumulative
+  time per stage, peak memory by stage and top allocation sites of the run
+* ``stacks.collapsed`` - input for flamegraph.pl, speedscope or inferno
+* ``<stage>.pstats`` - raw profiles for snakeviz or pstats
+
+cProfile only sees the thread it is enabled on. A stage entered while another
+stage is already profiling the same thread (nested calls, or async stages that
+overlap on the event loop) is timed on its own, but its functions are counted
+in the outer stage's profile.
+"""
+import asyncio
+import cProfile
+import functools
+import io
+import json
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Frames kept per allocation traceback
+TRACEMALLOC_FRAMES = 16
+
+TOP_FUNCTIONS = 25
+TOP_ALLOCATIONS = 25
+
+
+def default_profile_dir(data_dir: str) -> str:
+    """Get a fresh directory for one run's profile under data/profiles."""
+    return os.path.join(data_dir, 'profiles', datetime.now().strftime('%Y%m%d-%H%M%S'))
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StageStats:
+    """Timing, memory and per-thread profiles of one stage."""
+
+    def __init__(self):
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.peak_memory = 0
+        self.active = 0
+        self.profiles: Dict[int, cProfile.Profile] = {}
+
+
+class RunProfiler:
+    """Collects per-stage CPU and allocation profiles and sampled stacks for one run."""
+
+    def __init__(self, output_dir: str, sample_interval: float = 0.005):
+        self.output_dir = output_dir
+        self.sample_interval = sample_interval
+        self.stages: Dict[str, StageStats] = defaultdict(StageStats)
+        self.stacks: Counter = Counter()
+        self._lock = threading.Lock()
+        # Thread id -> stage currently profiling that thread
+        self._profiling: Dict[int, str] = {}
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._baseline = None
+        self._started = None
+
+    def start(self):
+        """Start tracing allocations and sampling stacks."""
+        self._started = time.perf_counter()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        self._baseline = tracemalloc.take_snapshot()
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample, name='profile-sampler', daemon=True)
+        self._sampler.start()
+
+    def stop(self):
+        """Stop sampling; allocation tracing stays on until the report is written."""
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def _sample(self):
+        own = threading.get_ident()
+        names = {}
+        while not self._stop.wait(self.sample_interval):
+            current = tracemalloc.get_traced_memory()[0]
+            with self._lock:
+                for stats in self.stages.values():
+                    if stats.active and current > stats.peak_memory:
+                        stats.peak_memory = current
+            if len(names) != threading.active_count():
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                labels = []
+                while frame is not None:
+                    labels.append(_frame_label(frame))
+                    frame = frame.f_back
+                labels.append(names.get(thread_id, str(thread_id)))
+                self.stacks[';'.join(reversed(labels))] += 1
+
+    @contextmanager
+    def stage(self, name: str):
+        """Profile the enclosed block as (part of) a stage."""
+        thread_id = threading.get_ident()
+        with self._lock:
+            stats = self.stages[name]
+            stats.calls += 1
+            stats.active += 1
+            owns_thread = thread_id not in self._profiling
+            if owns_thread:
+                self._profiling[thread_id] = name
+                profile = stats.profiles.setdefault(thread_id, cProfile.Profile())
+        if owns_thread:
+            profile.enable()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield stats
+        finally:
+            cpu = time.thread_time() - cpu_start
+            wall = time.perf_counter() - wall_start
+            if owns_thread:
+                profile.disable()
+            current = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+            with self._lock:
+                stats.wall += wall
+                stats.cpu += cpu
+                stats.active -= 1
+                stats.peak_memory = max(stats.peak_memory, current)
+                if owns_thread:
+                    del self._profiling[thread_id]
+
+    def _stage_stats(self, stats: StageStats) -> Optional[pstats.Stats]:
+        merged = None
+        for profile in stats.profiles.values():
+            profile.create_stats()
+            if not profile.stats:
+                continue
+            if merged is None:
+                merged = pstats.Stats(profile, stream=io.StringIO())
+            else:
+                merged.add(profile)
+        return merged
+
+    @staticmethod
+    def _top_functions(merged: pstats.Stats, limit: int) -> List[Dict]:
+        rows = []
+        for (filename, line, function), (_, ncalls, tottime, cumtime, _) in merged.stats.items():
+            rows.append({
+                'function': f"{function} ({os.path.basename(filename)}:{line})",
+                'calls': ncalls,
+                'tottime': round(tottime, 6),
+                'cumtime': round(cumtime, 6)
+            })
+        rows.sort(key=lambda row: row['cumtime'], reverse=True)
+        return rows[:limit]
+
+    def _top_allocations(self, limit: int) -> List[Dict]:
+        if not tracemalloc.is_tracing() or self._baseline is None:
+            return []
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>')
+        ))
+        rows = []
+        for diff in snapshot.compare_to(self._baseline, 'lineno')[:limit]:
+            frame = diff.traceback[0]
+            rows.append({
+                'site': f"{frame.filename}:{frame.lineno}",
+                'size_diff': diff.size_diff,
+                'count_diff': diff.count_diff,
+                'size': diff.size
+            })
+        return rows
+
+    def write_report(self) -> Optional[str]:
+        """Stop profiling and write the report, collapsed stacks and pstats files.
+
+        Returns:
+            Path of the text report, or None if it could not be written
+        """
+        self.stop()
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            report = {
+                'generated_at': datetime.now().isoformat(),
+                'wall_seconds': round(time.perf_counter() - self._started, 3) if self._started else None,
+                'peak_traced_bytes': tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else None,
+                'samples': sum(self.stacks.values()),
+                'stages': {}
+            }
+            for name, stats in sorted(self.stages.items(), key=lambda item: item[1].wall, reverse=True):
+                merged = self._stage_stats(stats)
+                if merged is not None:
+                    merged.dump_stats(os.path.join(self.output_dir, f'{name}.pstats'))
+                report['stages'][name] = {
+                    'calls': stats.calls,
+                    'wall_seconds': round(stats.wall, 6),
+                    'cpu_seconds': round(stats.cpu, 6),
+                    'peak_traced_bytes': stats.peak_memory,
+                    'top_functions': self._top_functions(merged, TOP_FUNCTIONS) if merged is not None else []
+                }
+            report['top_allocations'] = self._top_allocations(TOP_ALLOCATIONS)
+            tracemalloc.stop()
+
+            with open(os.path.join(self.output_dir, 'stacks.collapsed'), 'w', encoding='utf-8') as f:
+                for stack, count in self.stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            with open(os.path.join(self.output_dir, 'report.json'), 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            report_path = os.path.join(self.output_dir, 'report.txt')
+            with open(report_path, 'w', encoding='utf-8') as f:
+                f.write(self.format_report(report))
+            logger.info(f"Profile written to {self.output_dir}")
+            return report_path
+        except Exception as e:
+            logger.error(f"Error writing profile report: {str(e)}")
+            return None
+
+    @staticmethod
+    def format_report(report: Dict) -> str:
+        """Render a report dict as plain text."""
+        mib = 1024 * 1024
+        lines = [
+            f"Profile generated {report['generated_at']}",
+            f"Wall time: {report['wall_seconds']}s, peak traced memory: "
+            f"{(report['peak_traced_bytes'] or 0) / mib:.1f} MiB, stack samples: {report['samples']}",
+            '',
+            f"{'stage':<20} {'calls':>8} {'wall s':>10} {'cpu s':>10} {'peak MiB':>10}"
+        ]
+        for name, stage in report['stages'].items():
+            lines.append(f"{name:<20} {stage['calls']:>8} {stage['wall_seconds']:>10.3f} "
+                         f"{stage['cpu_seconds']:>10.3f} {stage['peak_traced_bytes'] / mib:>10.1f}")
+
+        for name, stage in report['stages'].items():
+            if not stage['top_functions']:
+                continue
+            lines += ['', f"Top functions by cumulative time in {name}:"]
+            for row in stage['top_functions']:
+                lines.append(f"  {row['cumtime']:>10.4f} {row['tottime']:>10.4f} {row['calls']:>8}  {row['function']}")
+
+        lines += ['', 'Top allocation sites since the run started:']
+        for row in report['top_allocations']:
+            lines.append(f"  {row['size_diff'] / 1024:>10.1f} KiB {row['count_diff']:>8} blocks  {row['site']}")
+        return '\n'.join(lines) + '\n'
+
+
+def profiled(stage_name: str) -> Callable:
+    """Record calls of a scraper method as a profiling stage when ``self.profiler`` is set."""
+    def decorate(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                if self.profiler is None:
+                    return await func(self, *args, **kwargs)
+                with self.profiler.stage(stage_name):
+                    return await func(self, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if self.profiler is None:
+                return func(self, *args, **kwargs)
+            with self.profiler.stage(stage_name):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorate
@@ -0,0 +1,195 @@
+"""
+Publish precompressed, paginated read artifacts for the Next.js frontend.
+
+Each resource type is split into fixed-size pages in its stored order. Each page
+is written as compact JSON plus ``.gz`` and ``.br`` variants, under a
+content-hashed file name so it can be cached forever. ``manifest.json`` is the
+only mutable file. It lists every page with its hash, byte sizes, record count,
+index range and sort-key range, so a page that shows one screen of cards
+fetches a few kilobytes instead of a whole results file. Binary artifacts built
+from the same data, such as the search index, are published alongside the pages
+and listed in the manifest.
+
+Brotli output needs the optional ``brotli`` package and is skipped without it.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = 'manifest.json'
+
+# Subdirectory for published binary artifacts such as indexes
+ARTIFACTS_DIR = 'artifacts'
+
+# Bump when the page or manifest layout changes
+PUBLISH_FORMAT_VERSION = 1
+
+DEFAULT_PAGE_SIZE = 50
+
+# Field each resource type is ordered by in storage, reported as the page key range
+SORT_KEYS = {
+    'github_programs': 'stars',
+    'blog_posts': 'date',
+    'job_listings': 'date'
+}
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def default_publish_dir() -> str:
+    """Get the directory Next.js serves static files from (frontend/public/data)."""
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'public', 'data')
+
+
+def _write_atomic(path: str, data: bytes):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def encode_page(records: List[Dict]) -> bytes:
+    """Serialize a page as compact UTF-8 JSON."""
+    return json.dumps(records, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def write_hashed(directory: str, prefix: str, extension: str, payload: bytes) -> Dict[str, Any]:
+    """Write a file and its compressed variants under a content-hashed name.
+
+    Files whose content is unchanged already exist under the same name and are
+    not rewritten.
+
+    Returns:
+        Manifest entry describing the written files
+    """
+    digest = hashlib.sha256(payload).hexdigest()
+    name = f'{prefix}.{digest[:12]}{extension}'
+    path = os.path.join(directory, name)
+    entry = {'file': name, 'sha256': digest, 'bytes': len(payload)}
+
+    if not os.path.exists(path):
+        _write_atomic(path, payload)
+    gz_path = f'{path}.gz'
+    if not os.path.exists(gz_path):
+        # mtime=0 keeps the gzip bytes identical for identical pages
+        _write_atomic(gz_path, gzip.compress(payload, compresslevel=9, mtime=0))
+    entry['gzip_bytes'] = os.path.getsize(gz_path)
+
+    if brotli is not None:
+        br_path = f'{path}.br'
+        if not os.path.exists(br_path):
+            _write_atomic(br_path, brotli.compress(payload, quality=11))
+        entry['br_bytes'] = os.path.getsize(br_path)
+    return entry
+
+
+def write_page(directory: str, resource_type: str, number: int, payload: bytes) -> Dict[str, Any]:
+    """Write a page of one resource type under a content-hashed name."""
+    return write_hashed(directory, f'{resource_type}/page-{number:04d}', '.json', payload)
+
+
+def _load_manifest(directory: str) -> Optional[Dict]:
+    try:
+        with open(os.path.join(directory, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.error(f"Error reading publish manifest: {str(e)}")
+        return None
+
+
+def _manifest_files(manifest: Optional[Dict]) -> set:
+    if not manifest:
+        return set()
+    files = {page['file'] for entry in manifest.get('types', {}).values() for page in entry.get('pages', [])}
+    return files | {entry['file'] for entry in manifest.get('artifacts', {}).values()}
+
+
+def _remove_unreferenced(directory: str, subdirs: List[str], keep: set):
+    """Delete files referenced by neither the current nor the previous manifest."""
+    for subdir in subdirs:
+        path = os.path.join(directory, subdir)
+        if not os.path.isdir(path):
+            continue
+        for filename in os.listdir(path):
+            base = filename
+            for suffix in ('.gz', '.br', '.tmp'):
+                if base.endswith(suffix):
+                    base = base[:-len(suffix)]
+            if f'{subdir}/{base}' not in keep:
+                os.remove(os.path.join(path, filename))
+
+
+def publish(resources: Dict[str, List[Dict]], directory: Optional[str] = None,
+            page_size: int = DEFAULT_PAGE_SIZE, artifacts: Optional[Dict[str, bytes]] = None) -> Dict[str, Any]:
+    """Write paginated, precompressed shards of each resource type and the manifest.
+
+    Pages from the previous manifest are kept for one more generation, so clients
+    still holding the old manifest can finish paging before its files disappear.
+
+    Args:
+        resources: Records per resource type, in the order pages should follow
+        directory: Publish directory (defaults to frontend/public/data)
+        page_size: Records per page
+        artifacts: Extra binary artifacts (e.g. indexes) to publish under artifacts/, by name
+
+    Returns:
+        The written manifest
+    """
+    directory = directory or default_publish_dir()
+    previous = _load_manifest(directory)
+
+    manifest = {
+        'version': PUBLISH_FORMAT_VERSION,
+        'generated_at': datetime.now().isoformat(),
+        'page_size': page_size,
+        'encodings': ['gzip', 'br'] if brotli is not None else ['gzip'],
+        'types': {}
+    }
+    for resource_type, records in resources.items():
+        if not isinstance(records, list):
+            continue
+        os.makedirs(os.path.join(directory, resource_type), exist_ok=True)
+        sort_key = SORT_KEYS.get(resource_type)
+        pages = []
+        for number, start in enumerate(range(0, len(records), page_size), start=1):
+            chunk = records[start:start + page_size]
+            entry = write_page(directory, resource_type, number, encode_page(chunk))
+            entry.update({'count': len(chunk), 'range': [start, start + len(chunk)]})
+            if sort_key:
+                entry['key_range'] = [chunk[0].get(sort_key), chunk[-1].get(sort_key)]
+            pages.append(entry)
+
+        type_digest = hashlib.sha256(''.join(page['sha256'] for page in pages).encode('utf-8')).hexdigest()
+        manifest['types'][resource_type] = {
+            'count': len(records),
+            'sort_key': sort_key,
+            'sha256': type_digest,
+            'pages': pages
+        }
+
+    if artifacts:
+        os.makedirs(os.path.join(directory, ARTIFACTS_DIR), exist_ok=True)
+        manifest['artifacts'] = {
+            name: write_hashed(directory, f'{ARTIFACTS_DIR}/{name}', '.bin', payload)
+            for name, payload in artifacts.items()
+        }
+
+    _write_atomic(os.path.join(directory, MANIFEST_FILE),
+                  json.dumps(manifest, indent=2).encode('utf-8'))
+    _remove_unreferenced(directory, list(manifest['types']) + [ARTIFACTS_DIR],
+                         _manifest_files(manifest) | _manifest_files(previous))
+
+    logger.info(f"Published {sum(entry['count'] for entry in manifest['types'].values())} records "
+                f"in {sum(len(entry['pages']) for entry in manifest['types'].values())} pages to {directory}")
+    return manifest
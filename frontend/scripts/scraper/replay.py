@@ -0,0 +1,507 @@
+"""
+HTTP record/replay for offline end-to-end runs and load tests.
+
+Record mode captures every response the scraper receives into a cassette
+directory. ``index.json`` maps each normalized request URL to its status,
+headers and a content-hashed body file under ``bodies/``. Replay mode serves the
+cassette from a local aiohttp stub server. The scraper's ``url_rewriter`` hook
+then points every request at the stub, so ``scrape_all`` and the pipeline run
+unchanged with no network.
+
+The stub can also serve synthetic fixtures for thousands of feeds, job boards
+and searches (``/fixtures/<parser>/<n>``). They are cloned from recorded
+responses of the same parser, or built from templates when the cassette has
+none, with links made unique per fixture. Knobs inject latency, server errors,
+403 rate-limit responses and 304s, so the real concurrency path can be
+load-tested in isolation.
+
+Usage from ``frontend/scripts``::
+
+    python -m scraper.replay record --cassette data/cassette
+    python -m scraper.replay replay --latency 0.2 --rate-limit-rate 0.1
+    python -m scraper.replay serve --cassette data/cassette --port 8090 --latency 0.05
+    python -m scraper.replay loadtest --feeds 2000 --boards 1000 --latency 0.05 --error-rate 0.02
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import shutil
+import tempfile
+import time
+import urllib.parse
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Mapping, Optional
+
+import aiohttp
+from aiohttp import web
+
+from .devrel_scraper import LOG_FORMAT, DevRelScraper
+from .pipeline import PipelineConfig, ScrapePipeline
+from .singleflight import normalize_url
+from .sources import Source, build_source_registry
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+INDEX_FILE = 'index.json'
+
+# Response headers worth replaying; hop-by-hop and encoding headers are re-derived by the stub
+RECORDED_HEADERS = (
+    'Content-Type', 'ETag', 'Last-Modified', 'Cache-Control',
+    'X-RateLimit-Limit', 'X-RateLimit-Remaining', 'X-RateLimit-Reset', 'X-RateLimit-Resource'
+)
+
+# Resource type and response format of each parser, for synthetic fixture sources
+FIXTURE_PARSERS = {
+    'github_search': ('github_programs', 'json'),
+    'rss2json': ('blog_posts', 'json'),
+    'greenhouse': ('job_listings', 'json'),
+    'linkedin': ('job_listings', 'text'),
+    'lever': ('job_listings', 'text')
+}
+
+# Fields holding item links in JSON payloads, made unique per fixture
+_LINK_FIELDS = ('link', 'url', 'html_url', 'absolute_url', 'guid')
+_HREF_RE = re.compile(r'href="([^"#?]+)')
+
+_TEMPLATE_TITLES = [
+    'Developer Advocate', 'Senior Developer Relations Engineer', 'Developer Community Manager',
+    'Head of Developer Relations', 'Technical Evangelist', 'Software Engineer', 'Account Executive',
+    'Developer Experience Engineer', 'Product Manager', 'DevRel Lead'
+]
+_TEMPLATE_TEXT = (
+    'Join our developer relations team to grow the developer community, write technical content '
+    'and improve the developer experience of our API platform.'
+)
+
+
+def default_cassette_dir() -> str:
+    return os.path.join(DevRelScraper.default_data_dir(), 'cassette')
+
+
+class Cassette:
+    """Recorded responses keyed by normalized URL, with bodies stored by content hash."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.entries: Dict[str, Dict] = {}
+        self._bodies: Dict[str, bytes] = {}
+        path = os.path.join(directory, INDEX_FILE)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get('entries', {})
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def record(self, url: str, status: int, headers: Mapping[str, str], body: bytes):
+        """Store a response; the latest response for a URL wins."""
+        digest = hashlib.sha256(body).hexdigest()[:16]
+        body_file = f'bodies/{digest}.bin'
+        path = os.path.join(self.directory, body_file)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(body)
+        self.entries[normalize_url(url)] = {
+            'url': url,
+            'status': status,
+            'headers': {name: headers[name] for name in RECORDED_HEADERS if name in headers},
+            'body': body_file,
+            'recorded_at': datetime.now().isoformat()
+        }
+
+    def save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, INDEX_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CASSETTE_VERSION, 'entries': self.entries}, f, indent=2)
+        os.replace(tmp_path, path)
+        logger.info(f"Saved {len(self.entries)} recorded responses to {self.directory}")
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        return self.entries.get(normalize_url(url))
+
+    def body(self, entry: Dict) -> bytes:
+        if entry['body'] not in self._bodies:
+            with open(os.path.join(self.directory, entry['body']), 'rb') as f:
+                self._bodies[entry['body']] = f.read()
+        return self._bodies[entry['body']]
+
+
+def rewrite_to_stub(stub_url: str):
+    """Get a url_rewriter that sends every request to the stub, keeping the original host in the path."""
+    stub_url = stub_url.rstrip('/')
+
+    def rewrite(url: str) -> str:
+        if url.startswith(stub_url):
+            return url
+        parts = urllib.parse.urlsplit(url)
+        rewritten = f"{stub_url}/replay/{parts.scheme}/{parts.netloc}{parts.path or '/'}"
+        return f"{rewritten}?{parts.query}" if parts.query else rewritten
+    return rewrite
+
+
+def fixture_sources(stub_url: str, feeds: int = 0, boards: int = 0, searches: int = 0,
+                    pages: int = 0) -> List[Source]:
+    """Build sources for synthetic stub fixtures.
+
+    Args:
+        stub_url: Base URL of a running stub server
+        feeds: rss2json blog feeds
+        boards: Greenhouse job boards
+        searches: GitHub repository searches
+        pages: LinkedIn and Lever job search pages (half each)
+    """
+    stub_url = stub_url.rstrip('/')
+    counts = {'rss2json': feeds, 'greenhouse': boards, 'github_search': searches,
+              'linkedin': pages - pages // 2, 'lever': pages // 2}
+    sources = []
+    for parser, count in counts.items():
+        resource_type, fmt = FIXTURE_PARSERS[parser]
+        for i in range(count):
+            # Greenhouse parsing reads the company from the /boards/<name>/ segment
+            tail = f'/boards/board{i}/jobs' if parser == 'greenhouse' else ''
+            sources.append(Source(
+                name=f'fixture:{parser}:{i}',
+                resource_type=resource_type,
+                url=f'{stub_url}/fixtures/{parser}/{i}{tail}',
+                parser=parser,
+                format=fmt,
+                devrel_specific=i % 2 == 0
+            ))
+    return sources
+
+
+def _template(parser: str, index: int, items: int = 10) -> bytes:
+    """Build a fixture payload for a parser when the cassette has no recording to clone."""
+    now = datetime.now()
+    titles = [_TEMPLATE_TITLES[(index + i) % len(_TEMPLATE_TITLES)] for i in range(items)]
+    if parser == 'github_search':
+        return json.dumps({'total_count': items, 'items': [{
+            'full_name': f'fixture-{index}/devrel-{i}',
+            'html_url': f'https://github.com/fixture-{index}/devrel-{i}',
+            'description': _TEMPLATE_TEXT,
+            'stargazers_count': (index * 37 + i * 101) % 5000,
+            'language': 'Python',
+            'topics': ['devrel', 'community'],
+            'updated_at': (now - timedelta(days=i)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        } for i in range(items)]}).encode('utf-8')
+    if parser == 'rss2json':
+        return json.dumps({'status': 'ok', 'items': [{
+            'title': f'{title} stories #{index}-{i}',
+            'link': f'https://blog.example.com/{index}/{i}',
+            'pubDate': (now - timedelta(days=i)).strftime('%Y-%m-%d %H:%M:%S'),
+            'description': f'<p>{_TEMPLATE_TEXT}</p>'
+        } for i, title in enumerate(titles)]}).encode('utf-8')
+    if parser == 'greenhouse':
+        return json.dumps({'jobs': [{
+            'title': title,
+            'absolute_url': f'https://boards.greenhouse.io/board{index}/jobs/{i}',
+            'location': {'name': 'Remote'},
+            'content': f'<p>{_TEMPLATE_TEXT}</p>'
+        } for i, title in enumerate(titles)]}).encode('utf-8')
+    if parser == 'linkedin':
+        cards = ''.join(
+            f'<div class="base-card"><a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/{index}-{i}">'
+            f'</a><h3 class="base-search-card__title">{title}</h3>'
+            f'<h4 class="base-search-card__subtitle">Company {index}</h4>'
+            f'<span class="job-search-card__location">Remote</span></div>'
+            for i, title in enumerate(titles)
+        )
+        return f'<html><body>{cards}</body></html>'.encode('utf-8')
+    cards = ''.join(
+        f'<div class="posting"><h5>{title}</h5><div class="posting-company">Company {index}</div>'
+        f'<span class="location">Remote</span>'
+        f'<a class="posting-btn-submit" href="https://jobs.lever.co/company{index}/{i}">Apply</a></div>'
+        for i, title in enumerate(titles)
+    )
+    return f'<html><body>{cards}</body></html>'.encode('utf-8')
+
+
+def _make_unique(value: Any, suffix: str) -> Any:
+    """Append a fixture suffix to every link field in a decoded JSON payload."""
+    if isinstance(value, dict):
+        return {
+            key: (f"{item}{'&' if '?' in item else '?'}{suffix}" if key in _LINK_FIELDS and isinstance(item, str)
+                  else _make_unique(item, suffix))
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_make_unique(item, suffix) for item in value]
+    return value
+
+
+class StubServer:
+    """Serves recorded responses and synthetic fixtures with injected latency and failures."""
+
+    def __init__(self, cassette: Optional[Cassette] = None, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, rate_limit_rate: float = 0.0, not_modified_rate: float = 0.0,
+                 rate_limit: int = 5000, seed: Optional[int] = None):
+        """
+        Args:
+            cassette: Recorded responses to replay (fixtures use templates without one)
+            latency: Seconds added before every response
+            jitter: Extra random latency, up to this many seconds
+            error_rate: Share of requests answered with a 500 or 503
+            rate_limit_rate: Share of requests answered with a 403 and an exhausted X-RateLimit window
+            not_modified_rate: Share of requests answered with a 304
+            rate_limit: Size of the X-RateLimit window advertised per host
+            seed: Random seed, for reproducible failure injection
+        """
+        self.cassette = cassette or Cassette(tempfile.mkdtemp(prefix='devrel-cassette-'))
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.not_modified_rate = not_modified_rate
+        self.rate_limit = rate_limit
+        self.random = random.Random(seed)
+        self.stats: Counter = Counter()
+        self._remaining: Dict[str, int] = {}
+        self._fixtures: Dict[tuple, bytes] = {}
+        self._runner: Optional[web.AppRunner] = None
+        self.url: Optional[str] = None
+
+        parsers = {source.url: source.parser for source in build_source_registry()}
+        self._recorded_by_parser: Dict[str, List[Dict]] = {}
+        for entry in self.cassette.entries.values():
+            parser = parsers.get(entry['url'])
+            if parser and entry['status'] == 200:
+                self._recorded_by_parser.setdefault(parser, []).append(entry)
+
+    def _rate_limit_headers(self, host: str) -> Dict[str, str]:
+        remaining = max(0, self._remaining.get(host, self.rate_limit) - 1)
+        self._remaining[host] = remaining
+        return {
+            'X-RateLimit-Limit': str(self.rate_limit),
+            'X-RateLimit-Remaining': str(remaining),
+            'X-RateLimit-Reset': str(int(time.time()) + 3600)
+        }
+
+    async def _inject(self, host: str) -> Optional[web.Response]:
+        """Apply latency, then answer with an injected failure if one is drawn."""
+        delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            await asyncio.sleep(delay)
+        draw = self.random.random()
+        if draw < self.error_rate:
+            self.stats['error'] += 1
+            return web.Response(status=self.random.choice((500, 503)), text='Injected server error')
+        draw -= self.error_rate
+        if draw < self.rate_limit_rate:
+            self.stats['rate_limited'] += 1
+            return web.Response(status=403, text='API rate limit exceeded', headers={
+                'X-RateLimit-Limit': str(self.rate_limit),
+                'X-RateLimit-Remaining': '0',
+                'X-RateLimit-Reset': str(int(time.time()) + 60)
+            })
+        draw -= self.rate_limit_rate
+        if draw < self.not_modified_rate:
+            self.stats['not_modified'] += 1
+            return web.Response(status=304)
+        return None
+
+    async def replay(self, request: web.Request) -> web.Response:
+        scheme, host, path = request.match_info['scheme'], request.match_info['host'], request.match_info['path']
+        url = f"{scheme}://{host}/{path}"
+        if request.query_string:
+            url = f"{url}?{request.query_string}"
+        injected = await self._inject(host)
+        if injected is not None:
+            return injected
+        entry = self.cassette.lookup(url)
+        if entry is None:
+            self.stats['missing'] += 1
+            logger.warning(f"No recorded response for {url}")
+            return web.Response(status=404, text='Not recorded')
+        self.stats['replayed'] += 1
+        headers = dict(entry['headers'])
+        headers.update(self._rate_limit_headers(host))
+        content_type = headers.pop('Content-Type', 'application/octet-stream')
+        return web.Response(status=entry['status'], body=self.cassette.body(entry), headers=headers,
+                            content_type=content_type.split(';')[0])
+
+    def _fixture(self, parser: str, index: int) -> bytes:
+        key = (parser, index)
+        if key not in self._fixtures:
+            recorded = self._recorded_by_parser.get(parser)
+            if not recorded:
+                payload = _template(parser, index)
+            else:
+                body = self.cassette.body(recorded[index % len(recorded)])
+                suffix = f'fixture={index}'
+                if FIXTURE_PARSERS[parser][1] == 'json':
+                    payload = json.dumps(_make_unique(json.loads(body), suffix)).encode('utf-8')
+                else:
+                    payload = _HREF_RE.sub(lambda m: f'href="{m.group(1)}?{suffix}', body.decode('utf-8', 'replace')).encode('utf-8')
+            self._fixtures[key] = payload
+        return self._fixtures[key]
+
+    async def fixture(self, request: web.Request) -> web.Response:
+        parser = request.match_info['parser']
+        if parser not in FIXTURE_PARSERS:
+            raise web.HTTPNotFound(text=f'Unknown fixture parser {parser}')
+        injected = await self._inject(f'fixtures-{parser}')
+        if injected is not None:
+            return injected
+        self.stats['fixture'] += 1
+        body = self._fixture(parser, int(request.match_info['index']))
+        content_type = 'application/json' if FIXTURE_PARSERS[parser][1] == 'json' else 'text/html'
+        return web.Response(body=body, content_type=content_type,
+                            headers=self._rate_limit_headers(f'fixtures-{parser}'))
+
+    async def stats_handler(self, request: web.Request) -> web.Response:
+        return web.json_response(dict(self.stats))
+
+    def build_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get('/replay/{scheme}/{host}/{path:.*}', self.replay)
+        app.router.add_get(r'/fixtures/{parser}/{index:\d+}{tail:.*}', self.fixture)
+        app.router.add_get('/__stats', self.stats_handler)
+        return app
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """Start serving in the current loop, returning the base URL (port 0 picks a free port)."""
+        self._runner = web.AppRunner(self.build_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f'http://{host}:{port}'
+        logger.info(f"Stub server listening on {self.url} with {len(self.cassette)} recorded responses")
+        return self.url
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+async def record(cassette_dir: str, data_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Run a live scrape and record every response into a cassette."""
+    cassette = Cassette(cassette_dir)
+    scraper = DevRelScraper(data_dir=data_dir)
+    scraper.recorder = cassette
+    try:
+        resources = await scraper.scrape_all()
+    finally:
+        cassette.save()
+    return {key: len(value) for key, value in resources.items() if isinstance(value, list)}
+
+
+async def replay_scrape(stub: StubServer) -> Dict[str, Any]:
+    """Run scrape_all against the stub in a scratch data directory."""
+    stub_url = await stub.start()
+    workdir = tempfile.mkdtemp(prefix='devrel-replay-')
+    try:
+        scraper = DevRelScraper(data_dir=os.path.join(workdir, 'data'), publish_dir=os.path.join(workdir, 'public'))
+        scraper.url_rewriter = rewrite_to_stub(stub_url)
+        resources = await scraper.scrape_all()
+        counts = {key: len(value) for key, value in resources.items() if isinstance(value, list)}
+        return {'resources': counts, 'stub': dict(stub.stats)}
+    finally:
+        await stub.stop()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+async def load_test(stub: StubServer, feeds: int = 0, boards: int = 0, searches: int = 0, pages: int = 0,
+                    include_registry: bool = True, config: Optional[PipelineConfig] = None) -> Dict[str, Any]:
+    """Run the scrape pipeline against the stub in a scratch data directory and report throughput."""
+    stub_url = await stub.start()
+    workdir = tempfile.mkdtemp(prefix='devrel-loadtest-')
+    try:
+        scraper = DevRelScraper(pipeline_config=config, data_dir=os.path.join(workdir, 'data'),
+                                publish_dir=os.path.join(workdir, 'public'))
+        scraper.url_rewriter = rewrite_to_stub(stub_url)
+        sources = fixture_sources(stub_url, feeds, boards, searches, pages)
+        if include_registry:
+            sources = build_source_registry() + sources
+
+        started = time.monotonic()
+        connector = aiohttp.TCPConnector(limit=scraper.pipeline_config.fetch_workers)
+        async with aiohttp.ClientSession(timeout=scraper.timeout, connector=connector) as session:
+            pipeline = ScrapePipeline(scraper, session, scraper.pipeline_config)
+            await pipeline.run(sources)
+        elapsed = time.monotonic() - started
+
+        return {
+            'sources': len(sources),
+            'seconds': round(elapsed, 3),
+            'sources_per_second': round(len(sources) / elapsed, 1) if elapsed else None,
+            'records_per_second': round(pipeline.stats['parsed'] / elapsed, 1) if elapsed else None,
+            'pipeline': pipeline.stats,
+            'stub': dict(stub.stats),
+            'coalescing': scraper.flights.stats()
+        }
+    finally:
+        await stub.stop()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _add_stub_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--cassette', default=default_cassette_dir(), help='Cassette directory')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra random latency, up to this many seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Share of 500/503 responses')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='Share of 403 rate-limit responses')
+    parser.add_argument('--not-modified-rate', type=float, default=0.0, help='Share of 304 responses')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed for injected failures')
+
+
+def _stub_from_args(args) -> StubServer:
+    return StubServer(Cassette(args.cassette), latency=args.latency, jitter=args.jitter,
+                      error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate,
+                      not_modified_rate=args.not_modified_rate, seed=args.seed)
+
+
+def main():
+    """Record, serve or load-test against recorded scraper traffic."""
+    parser = argparse.ArgumentParser(description='Record and replay DevRel scraper HTTP traffic.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = commands.add_parser('record', help='Run a live scrape and record every response')
+    record_parser.add_argument('--cassette', default=default_cassette_dir(), help='Cassette directory')
+
+    replay_parser = commands.add_parser('replay', help='Run a full scrape against the recorded responses')
+    _add_stub_arguments(replay_parser)
+
+    serve_parser = commands.add_parser('serve', help='Serve a cassette and fixtures from a stub server')
+    _add_stub_arguments(serve_parser)
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8090)
+
+    load_parser = commands.add_parser('loadtest', help='Run the scrape pipeline against the stub server')
+    _add_stub_arguments(load_parser)
+    load_parser.add_argument('--feeds', type=int, default=1000, help='Synthetic rss2json feeds')
+    load_parser.add_argument('--boards', type=int, default=500, help='Synthetic Greenhouse boards')
+    load_parser.add_argument('--searches', type=int, default=50, help='Synthetic GitHub searches')
+    load_parser.add_argument('--pages', type=int, default=100, help='Synthetic LinkedIn/Lever pages')
+    load_parser.add_argument('--fetch-workers', type=int, default=PipelineConfig.fetch_workers)
+    load_parser.add_argument('--no-registry', action='store_true', help='Only fetch synthetic fixtures')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+
+    if args.command == 'record':
+        print(json.dumps(asyncio.run(record(args.cassette)), indent=2))
+    elif args.command == 'replay':
+        print(json.dumps(asyncio.run(replay_scrape(_stub_from_args(args))), indent=2))
+    elif args.command == 'serve':
+        stub = _stub_from_args(args)
+        web.run_app(stub.build_app(), host=args.host, port=args.port, access_log=None)
+    else:
+        config = PipelineConfig(fetch_workers=args.fetch_workers)
+        report = asyncio.run(load_test(_stub_from_args(args), args.feeds, args.boards, args.searches, args.pages,
+                                       include_registry=not args.no_registry, config=config))
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+"""
+Inverted search index over the published resources.
+
+Titles, descriptions, topics, companies and locations are tokenized, stemmed
+and indexed into posting lists of (doc id, weighted term frequency). Doc ids
+are delta-encoded and all integers are varints, so the serialized index stays
+small. Queries decode only the posting lists of their terms and rank documents
+with BM25.
+
+Doc ids follow the published order, so doc ``i`` of a resource type is record
+``position`` on page ``position // page_size`` of that type.
+
+Artifact layout: ``MAGIC``, a 4-byte big-endian header length, a JSON header
+(documents, vocabulary offsets, parameters), then the postings blob followed by
+the varint document lengths.
+"""
+import heapq
+import html
+import json
+import math
+import re
+import struct
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from .star_history import decode_varint, encode_varint
+except ImportError:
+    # Allow use when the scraper modules are imported as scripts
+    from star_history import decode_varint, encode_varint
+
+MAGIC = b'DRSI1\n'
+
+# Bump when tokenization or stemming changes; readers must tokenize queries the same way
+ANALYZER_VERSION = 'light-stem-1'
+
+# Indexed fields and their weights per resource type
+SEARCH_FIELDS = {
+    'github_programs': [('name', 3), ('topics', 2), ('language', 1), ('description', 1)],
+    'blog_posts': [('title', 3), ('description', 1)],
+    'job_listings': [('title', 3), ('company', 2), ('locations', 1), ('location', 1), ('tags', 1), ('description', 1)]
+}
+
+# Field holding each resource type's stable identifier
+KEY_FIELDS = {'github_programs': 'url', 'blog_posts': 'link', 'job_listings': 'url'}
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or that the this to was we were will with you your
+our us i not but if into about can all more their they them than then so do does
+""".split())
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_TOKEN_RE = re.compile(r'[a-z0-9]+(?:[+#][a-z0-9+#]*)?')
+_VOWELS = set('aeiouy')
+
+# Derivational suffixes and their replacements, longest first
+_DERIVATIONAL = [
+    ('ational', 'ate'), ('ization', 'ize'), ('isation', 'ize'), ('tional', 'tion'), ('fulness', 'ful'),
+    ('ousness', 'ous'), ('iveness', 'ive'), ('ation', 'ate'), ('ator', 'ate'), ('ness', ''),
+    ('ment', ''), ('ful', ''), ('ly', '')
+]
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def stem(word: str) -> str:
+    """Reduce an English word to a stem with a light Porter-style suffix stripper."""
+    if len(word) <= 3 or not word.isalpha():
+        return word
+    if word.endswith('sses'):
+        word = word[:-2]
+    elif word.endswith('ies') and len(word) > 4:
+        word = word[:-3] + 'y'
+    elif word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        word = word[:-1]
+
+    for suffix in ('ing', 'ed'):
+        base = word[:-len(suffix)]
+        if word.endswith(suffix) and len(base) >= 3 and _VOWELS & set(base):
+            word = base
+            # running -> run
+            if word[-1] == word[-2] and word[-1] not in 'lsz':
+                word = word[:-1]
+            break
+
+    for suffix, replacement in _DERIVATIONAL:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[:-len(suffix)] + replacement
+            break
+
+    if word.endswith('e') and len(word) > 4:
+        word = word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, strip HTML, split into tokens, drop stopwords and stem."""
+    text = html.unescape(_TAG_RE.sub(' ', text)).lower()
+    return [stem(token) for token in _TOKEN_RE.findall(text) if token not in STOPWORDS]
+
+
+def _field_text(value) -> str:
+    if isinstance(value, list):
+        return ' '.join(str(item) for item in value)
+    return str(value) if value is not None else ''
+
+
+def build_search_index(resources: Dict[str, List[Dict]]) -> bytes:
+    """Build and serialize the inverted index over every record, in published order."""
+    postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+    docs = []
+    doc_lengths = []
+    for resource_type, fields in SEARCH_FIELDS.items():
+        for position, record in enumerate(resources.get(resource_type, [])):
+            doc_id = len(docs)
+            docs.append([resource_type, position, record.get(KEY_FIELDS[resource_type], '')])
+            length = 0
+            for field, weight in fields:
+                for term in tokenize(_field_text(record.get(field))):
+                    postings[term][doc_id] = postings[term].get(doc_id, 0) + weight
+                    length += weight
+            doc_lengths.append(length)
+
+    blob = bytearray()
+    vocabulary = {}
+    for term in sorted(postings):
+        start = len(blob)
+        previous = 0
+        entries = sorted(postings[term].items())
+        for doc_id, tf in entries:
+            encode_varint(doc_id - previous, blob)
+            encode_varint(tf, blob)
+            previous = doc_id
+        vocabulary[term] = [start, len(blob) - start, len(entries)]
+
+    lengths_offset = len(blob)
+    for length in doc_lengths:
+        encode_varint(length, blob)
+
+    header = json.dumps({
+        'analyzer': ANALYZER_VERSION,
+        'docs': docs,
+        'vocabulary': vocabulary,
+        'lengths_offset': lengths_offset,
+        'avg_length': (sum(doc_lengths) / len(doc_lengths)) if doc_lengths else 0.0
+    }, separators=(',', ':')).encode('utf-8')
+    return MAGIC + struct.pack('>I', len(header)) + header + bytes(blob)
+
+
+class SearchIndex:
+    """A loaded search index; posting lists are decoded on demand per query term."""
+
+    def __init__(self, data: bytes):
+        if not data.startswith(MAGIC):
+            raise ValueError("Not a search index artifact")
+        (header_length,) = struct.unpack_from('>I', data, len(MAGIC))
+        header_start = len(MAGIC) + 4
+        header = json.loads(data[header_start:header_start + header_length])
+        if header['analyzer'] != ANALYZER_VERSION:
+            raise ValueError(f"Search index analyzer {header['analyzer']} does not match {ANALYZER_VERSION}")
+        self.docs: List[List] = header['docs']
+        self.vocabulary: Dict[str, List[int]] = header['vocabulary']
+        self.avg_length: float = header['avg_length'] or 1.0
+        self._blob = memoryview(data)[header_start + header_length:]
+
+        self.doc_lengths = []
+        pos = header['lengths_offset']
+        for _ in self.docs:
+            length, pos = decode_varint(self._blob, pos)
+            self.doc_lengths.append(length)
+
+    @classmethod
+    def load(cls, path: str) -> 'SearchIndex':
+        with open(path, 'rb') as f:
+            return cls(f.read())
+
+    def postings(self, term: str) -> List[Tuple[int, int]]:
+        """Decode the (doc id, term frequency) pairs of an already analyzed term."""
+        entry = self.vocabulary.get(term)
+        if entry is None:
+            return []
+        offset, _, count = entry
+        result = []
+        doc_id = 0
+        pos = offset
+        for _ in range(count):
+            delta, pos = decode_varint(self._blob, pos)
+            tf, pos = decode_varint(self._blob, pos)
+            doc_id += delta
+            result.append((doc_id, tf))
+        return result
+
+    def search(self, query: str, limit: int = 10, resource_types: Optional[Iterable[str]] = None,
+               candidates: Optional[set] = None) -> List[Dict]:
+        """Rank documents matching any query term with BM25.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+            resource_types: Only return documents of these resource types
+            candidates: Only score these doc ids (e.g. the result of a facet filter)
+
+        Returns:
+            Results with resource_type, position, key, doc_id and score, best first
+        """
+        allowed = set(resource_types) if resource_types else None
+        total = len(self.docs)
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            matches = self.postings(term)
+            if not matches:
+                continue
+            idf = math.log(1 + (total - len(matches) + 0.5) / (len(matches) + 0.5))
+            for doc_id, tf in matches:
+                if candidates is not None and doc_id not in candidates:
+                    continue
+                if allowed is not None and self.docs[doc_id][0] not in allowed:
+                    continue
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_lengths[doc_id] / self.avg_length)
+                scores[doc_id] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [
+            {
+                'resource_type': self.docs[doc_id][0],
+                'position': self.docs[doc_id][1],
+                'key': self.docs[doc_id][2],
+                'doc_id': doc_id,
+                'score': round(score, 4)
+            }
+            for doc_id, score in best
+        ]
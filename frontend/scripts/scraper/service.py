@@ -0,0 +1,326 @@
+"""
+Async HTTP service for published DevRel resources.
+
+The service keeps the latest published snapshot in memory: the records of each
+resource type plus their search and facet indexes. Paginated, filtered and
+searched queries are answered without touching disk. Responses carry ETags
+derived from the snapshot version, so unchanged results revalidate with 304,
+and larger bodies are compressed for clients that accept gzip or deflate. A
+background task watches the publish manifest and swaps in a new snapshot when
+one is published. ``POST /refresh`` queues a scrape without blocking the
+request.
+
+Usage from ``frontend/scripts``::
+
+    python -m scraper.service --port 8081
+
+Endpoints:
+
+* ``GET /healthz`` - snapshot version, counts and refresh status
+* ``GET /resources/{resource_type}?page=1&page_size=50&q=...&<facet>=...`` -
+  records in published order, or by BM25 score when ``q`` is given, with facet
+  counts for the filtered set
+* ``GET /search?q=...&limit=20`` - ranked results across every resource type
+* ``POST /refresh`` - start a scrape in the background (202), ``GET /refresh`` for its status
+* ``GET /metrics`` - scraper metrics of background refreshes, in Prometheus text format
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+from .devrel_scraper import LOG_FORMAT, DevRelScraper
+from .facet_index import FACETS, FacetIndex, build_facet_index, popcount
+from .pipeline import RESOURCE_TYPES
+from .publish import MANIFEST_FILE, default_publish_dir
+from .search_index import SearchIndex, build_search_index
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class Snapshot:
+    """An immutable, fully loaded set of published resources and their indexes."""
+
+    def __init__(self, version: str, resources: Dict[str, List[Dict]],
+                 search: SearchIndex, facets: FacetIndex, generated_at: Optional[str] = None):
+        self.version = version
+        self.resources = resources
+        self.search = search
+        self.facets = facets
+        self.generated_at = generated_at
+        self.loaded_at = datetime.now().isoformat()
+
+    @classmethod
+    def from_publish_dir(cls, directory: str) -> 'Snapshot':
+        """Load the snapshot described by a publish manifest."""
+        with open(os.path.join(directory, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+        resources = {}
+        for resource_type, entry in manifest['types'].items():
+            records = []
+            for page in entry['pages']:
+                with open(os.path.join(directory, page['file']), 'r', encoding='utf-8') as f:
+                    records.extend(json.load(f))
+            resources[resource_type] = records
+
+        artifacts = manifest.get('artifacts', {})
+        if 'search_index' in artifacts and 'facet_index' in artifacts:
+            search = SearchIndex.load(os.path.join(directory, artifacts['search_index']['file']))
+            facets = FacetIndex.load(os.path.join(directory, artifacts['facet_index']['file']))
+        else:
+            search = SearchIndex(build_search_index(resources))
+            facets = FacetIndex(build_facet_index(resources))
+
+        digests = [manifest['types'][t]['sha256'] for t in sorted(manifest['types'])]
+        version = hashlib.sha256(''.join(digests).encode('utf-8')).hexdigest()[:16]
+        return cls(version, resources, search, facets, manifest.get('generated_at'))
+
+    @classmethod
+    def from_storage(cls, scraper: DevRelScraper) -> 'Snapshot':
+        """Build a snapshot from the scraper's storage when nothing has been published yet."""
+        stored = scraper._load_existing_resources()
+        resources = {resource_type: stored.get(resource_type, []) for resource_type in RESOURCE_TYPES}
+        search_data = build_search_index(resources)
+        version = hashlib.sha256(search_data).hexdigest()[:16]
+        return cls(version, resources, SearchIndex(search_data), FacetIndex(build_facet_index(resources)))
+
+
+class ResourceService:
+    """Serves the in-memory snapshot and hot-reloads it when a new one is published."""
+
+    def __init__(self, scraper: DevRelScraper, publish_dir: Optional[str] = None, reload_interval: float = 5):
+        self.scraper = scraper
+        self.publish_dir = publish_dir or default_publish_dir()
+        self.reload_interval = reload_interval
+        self.snapshot: Optional[Snapshot] = None
+        self._manifest_mtime = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.refresh_status: Dict[str, Any] = {'state': 'idle'}
+
+    def _manifest_path(self) -> str:
+        return os.path.join(self.publish_dir, MANIFEST_FILE)
+
+    async def reload(self, force: bool = False) -> bool:
+        """Load a new snapshot if the manifest changed, returning True if one was swapped in."""
+        try:
+            mtime = os.stat(self._manifest_path()).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if not force and self.snapshot is not None and mtime == self._manifest_mtime:
+            return False
+
+        try:
+            if mtime is None:
+                snapshot = await asyncio.to_thread(Snapshot.from_storage, self.scraper)
+            else:
+                snapshot = await asyncio.to_thread(Snapshot.from_publish_dir, self.publish_dir)
+        except Exception as e:
+            logger.error(f"Error loading resource snapshot: {str(e)}")
+            return False
+
+        # Swapping the reference is atomic; in-flight requests keep the snapshot they started with
+        self.snapshot = snapshot
+        self._manifest_mtime = mtime
+        logger.info(f"Loaded snapshot {snapshot.version}: " +
+                    ', '.join(f"{len(records)} {t}" for t, records in snapshot.resources.items()))
+        return True
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            await self.reload()
+
+    async def _refresh(self):
+        self.refresh_status = {'state': 'running', 'started_at': datetime.now().isoformat()}
+        try:
+            resources = await self.scraper.scrape_all()
+            self.refresh_status.update({
+                'state': 'error' if resources.get('error') else 'done',
+                'error': resources.get('error'),
+                'finished_at': datetime.now().isoformat()
+            })
+        except Exception as e:
+            logger.error(f"Error in background refresh: {str(e)}")
+            self.refresh_status.update({'state': 'error', 'error': str(e), 'finished_at': datetime.now().isoformat()})
+        await self.reload()
+
+    # Handlers
+
+    @staticmethod
+    def _etag(version: str, parts: str) -> str:
+        return '"' + hashlib.sha1(f"{version}:{parts}".encode('utf-8')).hexdigest() + '"'
+
+    @staticmethod
+    def _not_modified(request: web.Request, etag: str) -> Optional[web.Response]:
+        """Get a 304 response if the client already holds the representation with this ETag."""
+        if etag in request.headers.get('If-None-Match', ''):
+            return web.Response(status=304, headers={'ETag': etag, 'Cache-Control': 'no-cache'})
+        return None
+
+    def _json(self, data: Any, etag: Optional[str] = None, status: int = 200) -> web.Response:
+        """Build a JSON response, compressed when large with an encoding the client accepts."""
+        headers = {'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+        if etag is not None:
+            headers['ETag'] = etag
+        response = web.Response(
+            status=status,
+            body=json.dumps(data, separators=(',', ':')).encode('utf-8'),
+            content_type='application/json',
+            headers=headers
+        )
+        if response.content_length and response.content_length > 1024:
+            # No forced coding: aiohttp picks one from Accept-Encoding, or sends it uncompressed
+            response.enable_compression()
+        return response
+
+    async def healthz(self, request: web.Request) -> web.Response:
+        snapshot = self.snapshot
+        return self._json({
+            'status': 'ok' if snapshot else 'loading',
+            'version': snapshot.version if snapshot else None,
+            'generated_at': snapshot.generated_at if snapshot else None,
+            'loaded_at': snapshot.loaded_at if snapshot else None,
+            'counts': {t: len(records) for t, records in snapshot.resources.items()} if snapshot else {},
+            'refresh': self.refresh_status
+        })
+
+    async def resources(self, request: web.Request) -> web.Response:
+        snapshot = self.snapshot
+        resource_type = request.match_info['resource_type']
+        if snapshot is None:
+            raise web.HTTPServiceUnavailable(text='Snapshot not loaded yet')
+        if resource_type not in snapshot.resources:
+            raise web.HTTPNotFound(text=f'Unknown resource type {resource_type}')
+        try:
+            page = max(1, int(request.query.get('page', 1)))
+            page_size = min(MAX_PAGE_SIZE, max(1, int(request.query.get('page_size', DEFAULT_PAGE_SIZE))))
+        except ValueError:
+            raise web.HTTPBadRequest(text='page and page_size must be integers')
+
+        # Answer revalidations before doing any query work
+        etag = self._etag(snapshot.version, f"{request.path}?{sorted(request.query.items())}")
+        not_modified = self._not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+
+        facets = FACETS.get(resource_type, {})
+        filters = {facet: request.query.getall(facet) for facet in facets if facet in request.query}
+        selected = snapshot.facets.select(resource_type, filters) if filters else snapshot.facets.all(resource_type)
+
+        query = request.query.get('q', '').strip()
+        if query:
+            hits = snapshot.search.search(query, limit=len(snapshot.resources[resource_type]),
+                                          resource_types=[resource_type])
+            positions = [hit['position'] for hit in hits if selected >> hit['position'] & 1]
+        else:
+            positions = FacetIndex.positions(selected)
+
+        records = snapshot.resources[resource_type]
+        start = (page - 1) * page_size
+        return self._json({
+            'resource_type': resource_type,
+            'version': snapshot.version,
+            'total': len(positions),
+            'page': page,
+            'page_size': page_size,
+            'pages': (len(positions) + page_size - 1) // page_size,
+            'items': [records[position] for position in positions[start:start + page_size]],
+            'facets': {facet: snapshot.facets.counts(resource_type, facet, within=selected) for facet in facets},
+            'matched': popcount(selected)
+        }, etag)
+
+    async def search(self, request: web.Request) -> web.Response:
+        snapshot = self.snapshot
+        if snapshot is None:
+            raise web.HTTPServiceUnavailable(text='Snapshot not loaded yet')
+        query = request.query.get('q', '').strip()
+        if not query:
+            raise web.HTTPBadRequest(text='q is required')
+        try:
+            limit = min(MAX_PAGE_SIZE, max(1, int(request.query.get('limit', 20))))
+        except ValueError:
+            raise web.HTTPBadRequest(text='limit must be an integer')
+
+        etag = self._etag(snapshot.version, f"search?{query}&{limit}")
+        not_modified = self._not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+
+        started = time.perf_counter()
+        hits = snapshot.search.search(query, limit=limit)
+        for hit in hits:
+            hit['item'] = snapshot.resources[hit['resource_type']][hit['position']]
+        return self._json({
+            'query': query,
+            'version': snapshot.version,
+            'took_ms': round((time.perf_counter() - started) * 1000, 3),
+            'results': hits
+        }, etag)
+
+    async def refresh(self, request: web.Request) -> web.Response:
+        if request.method == 'POST' and (self._refresh_task is None or self._refresh_task.done()):
+            self.refresh_status = {'state': 'queued', 'queued_at': datetime.now().isoformat()}
+            self._refresh_task = asyncio.create_task(self._refresh())
+            return self._json(self.refresh_status, status=202)
+        return self._json(self.refresh_status)
+
+    async def metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            text=self.scraper.metrics.render(),
+            content_type='text/plain',
+            headers={'Cache-Control': 'no-cache'}
+        )
+
+    # Lifecycle
+
+    async def _on_startup(self, app: web.Application):
+        await self.reload(force=True)
+        self._watch_task = asyncio.create_task(self._watch())
+
+    async def _on_cleanup(self, app: web.Application):
+        self._watch_task.cancel()
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+
+    def build_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get('/healthz', self.healthz)
+        app.router.add_get('/resources/{resource_type}', self.resources)
+        app.router.add_get('/search', self.search)
+        app.router.add_route('*', '/refresh', self.refresh)
+        app.router.add_get('/metrics', self.metrics)
+        app.on_startup.append(self._on_startup)
+        app.on_cleanup.append(self._on_cleanup)
+        return app
+
+
+def main():
+    """Run the resource service from the command line."""
+    parser = argparse.ArgumentParser(description='Serve published DevRel resources over HTTP.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8081)
+    parser.add_argument('--publish-dir', default=None, help='Directory with the publish manifest')
+    parser.add_argument('--data-dir', default=None, help='Scraped data directory used by /refresh (default: scripts/data)')
+    parser.add_argument('--reload-interval', type=float, default=5, help='Seconds between manifest checks')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+
+    # Refreshes must publish where the service reloads from
+    scraper = DevRelScraper(data_dir=args.data_dir, publish_dir=args.publish_dir)
+    service = ResourceService(scraper, args.publish_dir, args.reload_interval)
+    web.run_app(service.build_app(), host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+"""
+Sharded multi-process and multi-node scraping with a merge reducer.
+
+The source registry is partitioned across N workers by a stable hash of each
+source name. Every worker runs the normal pipeline over its partition and
+writes a partial shard file into a shared directory; a reducer then merges the
+shards into storage with the usual ``append_resources`` dedup and ranking
+rules. The shared directory is the only coordination, so workers can be local
+processes or separate hosts mounting the same path. Shard files are named by
+run id, so shards left behind by an earlier run whose reduce failed are never
+merged into a later one.
+
+Usage from ``frontend/scripts``::
+
+    python -m scraper.sharding --local 4                      # N local processes + reduce
+    python -m scraper.sharding --run-id 20250101 --shard 0 --shards 4 --shard-dir /mnt/shards   # on each node
+    python -m scraper.sharding --run-id 20250101 --reduce --shards 4 --shard-dir /mnt/shards --wait 600
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List
+
+import aiohttp
+
+from .devrel_scraper import LOG_FORMAT, DevRelScraper
+from .health import SourceHealth
+from .pipeline import RESOURCE_TYPES, ResourceSink, ScrapePipeline
+from .sources import Source, build_source_registry
+
+logger = logging.getLogger(__name__)
+
+
+def shard_for(source_name: str, num_shards: int) -> int:
+    """Get the shard a source belongs to; stable across processes and hosts."""
+    return zlib.crc32(source_name.encode('utf-8')) % num_shards
+
+
+def partition_sources(sources: List[Source], shard_index: int, num_shards: int) -> List[Source]:
+    """Get the sources assigned to one shard."""
+    return [source for source in sources if shard_for(source.name, num_shards) == shard_index]
+
+
+def new_run_id() -> str:
+    return datetime.now().strftime('%Y%m%dT%H%M%S')
+
+
+def shard_path(shard_dir: str, run_id: str, shard_index: int, num_shards: int) -> str:
+    return os.path.join(shard_dir, f'shard-{run_id}-{shard_index}-of-{num_shards}.json')
+
+
+class ShardSink(ResourceSink):
+    """Collects a worker's new records instead of merging them into storage."""
+
+    def __init__(self, scraper, flush_every: int = 50):
+        super().__init__(scraper, flush_every)
+        self.collected = {resource_type: [] for resource_type in RESOURCE_TYPES}
+
+    def flush(self, resource_type: str, force: bool = False):
+        self.collected[resource_type].extend(self.pending[resource_type])
+        self.pending[resource_type] = []
+
+    def close(self) -> Dict[str, List[Dict]]:
+        for resource_type in RESOURCE_TYPES:
+            self.flush(resource_type)
+        return self.collected
+
+
+async def run_shard(scraper: DevRelScraper, run_id: str, shard_index: int, num_shards: int, shard_dir: str) -> str:
+    """Scrape one shard of the source registry and write its shard file.
+
+    The shard file carries the new records plus the health and yield state of
+    the shard's sources, so the reducer can persist them without workers
+    racing on the shared state files.
+    """
+    sources = partition_sources(build_source_registry(), shard_index, num_shards)
+    logger.info(f"Shard {shard_index}/{num_shards}: scraping {len(sources)} sources")
+
+    sink = await asyncio.to_thread(ShardSink, scraper, scraper.pipeline_config.flush_every)
+    async with aiohttp.ClientSession(timeout=scraper.timeout) as session:
+        pipeline = ScrapePipeline(scraper, session, scraper.pipeline_config, sink=sink)
+        records = await pipeline.run(sources)
+    scraper.yields.commit_run()
+
+    names = {source.name for source in sources}
+    payload = {
+        'run_id': run_id,
+        'shard': shard_index,
+        'shards': num_shards,
+        'finished_at': time.time(),
+        'stats': pipeline.stats,
+        'records': records,
+        'health': {name: health.to_dict() for name, health in scraper.health.sources.items() if name in names},
+        'yields': {name: entry for name, entry in scraper.yields.stats.items() if name in names}
+    }
+
+    os.makedirs(shard_dir, exist_ok=True)
+    path = shard_path(shard_dir, run_id, shard_index, num_shards)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f)
+    # The atomic rename doubles as the worker's completion marker
+    os.replace(tmp_path, path)
+    logger.info(f"Shard {shard_index}/{num_shards} wrote {sum(len(v) for v in records.values())} records to {path}")
+    return path
+
+
+async def reduce_shards(scraper: DevRelScraper, run_id: str, shard_dir: str, num_shards: int,
+                        wait: float = 0, poll_interval: float = 5) -> Dict[str, List[Dict]]:
+    """Merge the shard files of one run into storage with the append_resources rules.
+
+    Waits up to ``wait`` seconds for missing shards, then merges whatever is
+    present. Shards of other runs are ignored. Merged shard files are removed
+    so they are not merged twice.
+    """
+    paths = [shard_path(shard_dir, run_id, index, num_shards) for index in range(num_shards)]
+    deadline = time.monotonic() + wait
+    while True:
+        missing = [path for path in paths if not os.path.exists(path)]
+        if not missing or time.monotonic() >= deadline:
+            break
+        logger.info(f"Waiting for {len(missing)} of {num_shards} shards")
+        await asyncio.sleep(poll_interval)
+
+    if missing:
+        logger.warning(f"Reducing without {len(missing)} missing shards: {missing}")
+
+    merged = {resource_type: [] for resource_type in RESOURCE_TYPES}
+    present = [path for path in paths if path not in missing]
+    for path in present:
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        for resource_type in RESOURCE_TYPES:
+            merged[resource_type].extend(payload['records'].get(resource_type, []))
+        for name, entry in payload.get('health', {}).items():
+            scraper.health.sources[name] = SourceHealth(entry)
+        scraper.yields.stats.update(payload.get('yields', {}))
+
+    result = await scraper.append_resources(merged)
+    scraper.health.save()
+    scraper.yields.save()
+
+    for path in present:
+        os.remove(path)
+    logger.info(f"Reduced {len(present)} shards of run {run_id}: " + ', '.join(f"{len(v)} {k}" for k, v in merged.items()))
+    return result
+
+
+def _shard_worker(run_id: str, shard_index: int, num_shards: int, shard_dir: str) -> str:
+    """Process entry point for a local shard worker."""
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    return asyncio.run(run_shard(DevRelScraper(), run_id, shard_index, num_shards, shard_dir))
+
+
+def run_local(num_workers: int, shard_dir: str) -> Dict[str, List[Dict]]:
+    """Scrape with one local process per shard under a new run id, then reduce the shards."""
+    run_id = new_run_id()
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(_shard_worker, run_id, index, num_workers, shard_dir)
+                   for index in range(num_workers)]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Shard worker failed: {str(e)}")
+    return asyncio.run(reduce_shards(DevRelScraper(), run_id, shard_dir, num_workers))
+
+
+def main():
+    """Run a shard worker, the reducer, or both locally from the command line."""
+    parser = argparse.ArgumentParser(description='Sharded DevRel scraping across processes or hosts.')
+    parser.add_argument('--shard-dir', default=None, help='Shared directory for shard files')
+    parser.add_argument('--run-id', default=None, help='Id shared by the workers and reducer of one run')
+    parser.add_argument('--shards', type=int, default=None, help='Total number of shards')
+    parser.add_argument('--shard', type=int, default=None, help='Index of the shard to scrape')
+    parser.add_argument('--reduce', action='store_true', help='Merge shard files into storage')
+    parser.add_argument('--wait', type=float, default=0, help='Seconds the reducer waits for missing shards')
+    parser.add_argument('--local', type=int, default=None, help='Run N local shard processes and reduce')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+
+    shard_dir = args.shard_dir or os.path.join(DevRelScraper.default_data_dir(), 'shards')
+
+    if args.local:
+        run_local(args.local, shard_dir)
+    elif args.reduce:
+        if not args.shards or not args.run_id:
+            parser.error('--reduce requires --shards and --run-id')
+        asyncio.run(reduce_shards(DevRelScraper(), args.run_id, shard_dir, args.shards, wait=args.wait))
+    elif args.shard is not None and args.shards:
+        if not 0 <= args.shard < args.shards:
+            parser.error('--shard must be between 0 and --shards - 1')
+        if not args.run_id:
+            parser.error('--shard requires --run-id')
+        asyncio.run(run_shard(DevRelScraper(), args.run_id, args.shard, args.shards, shard_dir))
+    else:
+        parser.error('use --local N, --run-id ID --shard I --shards N, or --run-id ID --reduce --shards N')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Single-flight request coalescing for the DevRel scraper.
+
+Concurrent callers asking for the same normalized request share one in-flight
+future, and successful results are memoized for the rest of the run so
+duplicate requests never reach the network.
+"""
+import asyncio
+import logging
+import urllib.parse
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL so equivalent requests share a key.
+
+    Lowercases the scheme and host, drops default ports and fragments, and
+    sorts query parameters.
+    """
+    parts = urllib.parse.urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme == 'https' and netloc.endswith(':443')) or (scheme == 'http' and netloc.endswith(':80')):
+        netloc = netloc.rsplit(':', 1)[0]
+    query = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(parts.query, keep_blank_values=True)), safe='+:/')
+    return urllib.parse.urlunsplit((scheme, netloc, parts.path or '/', query, ''))
+
+
+class SingleFlight:
+    """Coalesces concurrent calls per key and memoizes results for a run."""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._results: Dict[Hashable, Any] = {}
+        self.hits = 0
+        self.coalesced = 0
+        self.misses = 0
+
+    def clear(self):
+        """Forget memoized results, starting a new run."""
+        self._results.clear()
+        self.hits = self.coalesced = self.misses = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable], memoize: bool = True,
+                 should_cache: Callable[[Any], bool] = bool) -> Any:
+        """Run ``fn`` once per key, sharing its result with concurrent callers.
+
+        Results are kept for later callers when ``memoize`` is set and
+        ``should_cache`` accepts them, so failures are retried next time.
+        """
+        if key in self._results:
+            self.hits += 1
+            return self._results[key]
+
+        if key in self._inflight:
+            self.coalesced += 1
+            return await asyncio.shield(self._inflight[key])
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+                # Mark the exception retrieved when nobody else was waiting
+                future.exception()
+            raise
+        else:
+            if memoize and should_cache(result):
+                self._results[key] = result
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    def do_sync(self, key: Hashable, fn: Callable[[], Any], should_cache: Callable[[Any], bool] = bool) -> Any:
+        """Memoize a synchronous call for the rest of the run."""
+        if key in self._results:
+            self.hits += 1
+            return self._results[key]
+        self.misses += 1
+        result = fn()
+        if should_cache(result):
+            self._results[key] = result
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'coalesced': self.coalesced, 'misses': self.misses, 'memoized': len(self._results)}
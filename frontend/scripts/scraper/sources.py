@@ -0,0 +1,138 @@
+"""
+Source registry for the DevRel scraper.
+
+Every endpoint the scraper polls is described by a ``Source`` so that the
+pipeline, and anything scheduling or sharding work, can treat sources uniformly.
+"""
+import urllib.parse
+from dataclasses import dataclass
+from typing import List
+
+# GitHub search queries used for DevRel program discovery
+GITHUB_PROGRAM_QUERIES = [
+    'developer+relations+program',
+    'devrel+program',
+    'developer+advocacy',
+    'developer+community'
+]
+
+# Known good DevRel-specific RSS/Atom feeds (via rss2json)
+DEVREL_FEEDS = [
+    "https://api.rss2json.com/v1/api.json?rss_url=https://dev.to/feed/tag/devrel",
+    "https://api.rss2json.com/v1/api.json?rss_url=https://medium.com/feed/tag/developer-relations",
+    "https://api.rss2json.com/v1/api.json?rss_url=https://developerrelations.com/feed",
+    "https://api.rss2json.com/v1/api.json?rss_url=https://devrel.net/feed",
+    "https://api.rss2json.com/v1/api.json?rss_url=https://hackernoon.com/feed/tagged/developer-relations"
+]
+
+# Popular tech blogs to check for DevRel content (filtered by keywords)
+TECH_BLOG_FEEDS = [
+    "https://api.rss2json.com/v1/api.json?rss_url=https://techcrunch.com/feed",
+    "https://api.rss2json.com/v1/api.json?rss_url=https://feeds.feedburner.com/thenextweb"
+]
+
+LINKEDIN_JOB_URLS = [
+    'https://www.linkedin.com/jobs/developer-relations-jobs',
+    'https://www.linkedin.com/jobs/developer-advocate-jobs',
+    'https://www.linkedin.com/jobs/technical-evangelist-jobs'
+]
+
+LEVER_JOB_URLS = [
+    'https://jobs.lever.co/search?team=Developer%20Relations'
+]
+
+GREENHOUSE_JOB_URLS = [
+    'https://boards-api.greenhouse.io/v1/boards/stripe/jobs?content=true',
+    'https://boards-api.greenhouse.io/v1/boards/twilio/jobs?content=true'
+]
+
+GITHUB_SEARCH_URL = 'https://api.github.com/search/repositories?q={query}&sort=stars&order=desc'
+
+# Largest response body read from a source, by parser. Search pages and feeds are
+# small; Greenhouse boards include every posting's HTML description.
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+MAX_BYTES = {
+    'github_search': 2 * 1024 * 1024,
+    'rss2json': 4 * 1024 * 1024,
+    'linkedin': 4 * 1024 * 1024,
+    'lever': 4 * 1024 * 1024,
+    'greenhouse': 16 * 1024 * 1024
+}
+
+
+@dataclass(frozen=True)
+class Source:
+    """A single endpoint polled by the scraper."""
+    name: str
+    resource_type: str
+    url: str
+    parser: str
+    format: str = 'json'
+    timeout: int = 30
+    devrel_specific: bool = True
+    max_bytes: int = DEFAULT_MAX_BYTES
+
+
+def feed_source_name(feed_url: str) -> str:
+    """Derive a short source name from an rss2json feed URL."""
+    query = urllib.parse.urlparse(feed_url).query
+    rss_url = urllib.parse.parse_qs(query).get('rss_url', [feed_url])[0]
+    parsed = urllib.parse.urlparse(rss_url)
+    return f"{parsed.netloc}{parsed.path}"
+
+
+def build_source_registry() -> List[Source]:
+    """Build the list of all sources polled by a full scrape."""
+    sources = []
+
+    for query in GITHUB_PROGRAM_QUERIES:
+        sources.append(Source(
+            name=f'github:{query}',
+            resource_type='github_programs',
+            url=GITHUB_SEARCH_URL.format(query=query),
+            parser='github_search',
+            max_bytes=MAX_BYTES['github_search']
+        ))
+
+    for feed_url in DEVREL_FEEDS + TECH_BLOG_FEEDS:
+        sources.append(Source(
+            name=f'blog:{feed_source_name(feed_url)}',
+            resource_type='blog_posts',
+            url=feed_url,
+            parser='rss2json',
+            timeout=60,
+            devrel_specific=feed_url in DEVREL_FEEDS,
+            max_bytes=MAX_BYTES['rss2json']
+        ))
+
+    for url in LINKEDIN_JOB_URLS:
+        sources.append(Source(
+            name=f"jobs:linkedin:{url.rstrip('/').split('/')[-1]}",
+            resource_type='job_listings',
+            url=url,
+            parser='linkedin',
+            format='text',
+            max_bytes=MAX_BYTES['linkedin']
+        ))
+
+    for url in LEVER_JOB_URLS:
+        sources.append(Source(
+            name='jobs:lever:developer-relations',
+            resource_type='job_listings',
+            url=url,
+            parser='lever',
+            format='text',
+            max_bytes=MAX_BYTES['lever']
+        ))
+
+    for url in GREENHOUSE_JOB_URLS:
+        board = url.split('/boards/')[1].split('/')[0]
+        sources.append(Source(
+            name=f'jobs:greenhouse:{board}',
+            resource_type='job_listings',
+            url=url,
+            parser='greenhouse',
+            max_bytes=MAX_BYTES['greenhouse']
+        ))
+
+    return sources
@@ -0,0 +1,252 @@
+"""
+Compact star history for GitHub programs.
+
+Every scrape appends the observed star counts to an append-only binary file so
+programs can be ranked by momentum rather than by the latest count alone. The
+file is a sequence of blocks:
+
+* ``REPOS`` blocks assign sequential integer ids to newly seen repository URLs.
+* ``SNAPSHOT`` blocks hold a timestamp delta and, for each repository whose
+  count changed, the repo id delta and the zigzag-encoded star delta.
+
+All integers are LEB128 varints, and unchanged repositories are not written at
+all, so years of daily snapshots for thousands of repositories stay within a
+few MB. Queries (velocity, acceleration, top-k trending) use NumPy, which is
+only imported when a query runs.
+"""
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'DRSH1\n'
+BLOCK_REPOS = 1
+BLOCK_SNAPSHOT = 2
+
+DAY = 86400
+
+
+def encode_varint(value: int, out: bytearray):
+    """Append an unsigned LEB128 varint."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Decode an unsigned LEB128 varint, returning (value, next position)."""
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def zigzag(value: int) -> int:
+    return (value << 1) if value >= 0 else ((-value << 1) - 1)
+
+
+def unzigzag(value: int) -> int:
+    return (value >> 1) if not value & 1 else -((value + 1) >> 1)
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("Star history queries require numpy (pip install numpy)") from e
+    return numpy
+
+
+class StarHistory:
+    """Append-only, delta and varint encoded time series of (repo, timestamp, stars)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.repo_ids: Dict[str, int] = {}
+        self.repos: List[str] = []
+        self.last_stars: List[int] = []
+        self.last_ts = 0
+        self.snapshots = 0
+        self._load()
+
+    def _load(self):
+        """Replay the file to restore ids and the latest counts needed for appending."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            for _ in self._iter_snapshots():
+                pass
+        except Exception as e:
+            logger.error(f"Error reading star history from {self.path}: {str(e)}")
+
+    def _read(self) -> bytes:
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        if not data.startswith(MAGIC):
+            raise ValueError(f"{self.path} is not a star history file")
+        return data
+
+    def _iter_snapshots(self):
+        """Decode the file, yielding (timestamp, changed repo ids, new star counts) per snapshot.
+
+        Rebuilds ``repos``, ``last_stars`` and ``last_ts`` as a side effect.
+        """
+        data = self._read()
+        self.repo_ids, self.repos, self.last_stars = {}, [], []
+        self.last_ts, self.snapshots = 0, 0
+        pos = len(MAGIC)
+        while pos < len(data):
+            block = data[pos]
+            pos += 1
+            if block == BLOCK_REPOS:
+                count, pos = decode_varint(data, pos)
+                for _ in range(count):
+                    length, pos = decode_varint(data, pos)
+                    url = data[pos:pos + length].decode('utf-8')
+                    pos += length
+                    self.repo_ids[url] = len(self.repos)
+                    self.repos.append(url)
+                    self.last_stars.append(0)
+            elif block == BLOCK_SNAPSHOT:
+                ts_delta, pos = decode_varint(data, pos)
+                count, pos = decode_varint(data, pos)
+                self.last_ts += ts_delta
+                ids, values = [], []
+                repo_id = 0
+                for _ in range(count):
+                    id_delta, pos = decode_varint(data, pos)
+                    star_delta, pos = decode_varint(data, pos)
+                    repo_id += id_delta
+                    stars = self.last_stars[repo_id] + unzigzag(star_delta)
+                    self.last_stars[repo_id] = stars
+                    ids.append(repo_id)
+                    values.append(stars)
+                self.snapshots += 1
+                yield self.last_ts, ids, values
+            else:
+                raise ValueError(f"Unknown star history block type {block} at offset {pos - 1}")
+
+    def record(self, stars_by_url: Dict[str, int], ts: Optional[int] = None) -> int:
+        """Append a snapshot of star counts, storing only repositories whose count changed.
+
+        Returns:
+            Number of repositories written to the snapshot
+        """
+        ts = int(time.time() if ts is None else ts)
+        if ts < self.last_ts:
+            raise ValueError("Star history snapshots must be appended in time order")
+
+        out = bytearray()
+        if not os.path.exists(self.path):
+            out += MAGIC
+
+        new_urls = [url for url in stars_by_url if url and url not in self.repo_ids]
+        if new_urls:
+            out.append(BLOCK_REPOS)
+            encode_varint(len(new_urls), out)
+            for url in new_urls:
+                encoded = url.encode('utf-8')
+                encode_varint(len(encoded), out)
+                out += encoded
+                self.repo_ids[url] = len(self.repos)
+                self.repos.append(url)
+                # New repositories start from 0 so their first count is stored in full
+                self.last_stars.append(0)
+
+        changes = []
+        for url, stars in stars_by_url.items():
+            if not url:
+                continue
+            repo_id = self.repo_ids[url]
+            stars = int(stars or 0)
+            if stars != self.last_stars[repo_id] or url in new_urls:
+                changes.append((repo_id, stars))
+        changes.sort()
+
+        out.append(BLOCK_SNAPSHOT)
+        encode_varint(ts - self.last_ts, out)
+        encode_varint(len(changes), out)
+        previous_id = 0
+        for repo_id, stars in changes:
+            encode_varint(repo_id - previous_id, out)
+            encode_varint(zigzag(stars - self.last_stars[repo_id]), out)
+            previous_id = repo_id
+            self.last_stars[repo_id] = stars
+
+        with open(self.path, 'ab') as f:
+            f.write(out)
+        self.last_ts = ts
+        self.snapshots += 1
+        return len(changes)
+
+    def stars_at(self, timestamps: Sequence[int]):
+        """Get star counts of every repository as of each timestamp.
+
+        Returns:
+            Float array of shape (len(timestamps), repos); NaN where a repository
+            had not been seen yet.
+        """
+        np = _import_numpy()
+        targets = np.asarray(sorted(timestamps), dtype=np.int64)
+        result = np.full((len(targets), 0), np.nan)
+        if not os.path.exists(self.path):
+            return result
+
+        captured = []
+        state = np.full(0, np.nan)
+        target_index = 0
+        for ts, ids, values in self._iter_snapshots():
+            while target_index < len(targets) and targets[target_index] < ts:
+                captured.append(state.copy())
+                target_index += 1
+            if len(state) < len(self.repos):
+                state = np.concatenate([state, np.full(len(self.repos) - len(state), np.nan)])
+            if ids:
+                state[np.asarray(ids, dtype=np.int64)] = values
+        while target_index < len(targets):
+            captured.append(state.copy())
+            target_index += 1
+
+        result = np.full((len(targets), len(self.repos)), np.nan)
+        for row, snapshot in enumerate(captured):
+            result[row, :len(snapshot)] = snapshot
+        order = np.argsort(np.argsort(np.asarray(timestamps, dtype=np.int64), kind='stable'), kind='stable')
+        return result[order]
+
+    def velocity(self, window_days: float = 7, now: Optional[int] = None):
+        """Get stars gained per day over the trailing window, per repository."""
+        np = _import_numpy()
+        now = self.last_ts if now is None else now
+        start, end = self.stars_at([int(now - window_days * DAY), now])
+        # Repositories first seen inside the window count from their first observation
+        start = np.where(np.isnan(start), end, start)
+        return (end - start) / window_days
+
+    def acceleration(self, window_days: float = 7, now: Optional[int] = None):
+        """Get the change in daily star velocity between the last two windows, per repository."""
+        np = _import_numpy()
+        now = self.last_ts if now is None else now
+        window = int(window_days * DAY)
+        older, middle, latest = self.stars_at([now - 2 * window, now - window, now])
+        middle = np.where(np.isnan(middle), latest, middle)
+        older = np.where(np.isnan(older), middle, older)
+        return ((latest - middle) - (middle - older)) / window_days
+
+    def top_trending(self, k: int = 10, window_days: float = 7, now: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Get the k repositories with the highest star velocity as (url, stars per day)."""
+        np = _import_numpy()
+        velocity = np.nan_to_num(self.velocity(window_days, now), nan=0.0)
+        if not len(velocity):
+            return []
+        k = min(k, len(velocity))
+        top = np.argpartition(-velocity, k - 1)[:k]
+        top = top[np.argsort(-velocity[top])]
+        return [(self.repos[index], float(velocity[index])) for index in top]
@@ -6,12 +6,14 @@ This script runs the scraper and updates the data files with new information.
 
 import os
 import sys
-import json
+import copy
+import argparse
 import logging
-import time
+import asyncio
 from datetime import datetime
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+import aiohttp
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -19,68 +21,133 @@ logger = logging.getLogger(__name__)
 
 sys.path.insert(0, str(Path(__file__).parent))
 from scraper.devrel_scraper import DevRelScraper
+from scraper.orchestrator import RunOrchestrator, Stage, StageError
+from scraper.loop_watchdog import watch
+from scraper.export import RESOURCE_TYPE_TAGS, export_records, open_output, write_document
+
+# Per-stage timeouts in seconds
+STAGE_TIMEOUTS = {
+    'github_programs': 300,
+    'blog_posts': 300,
+    'job_listings': 300,
+    'combine': 60,
+    'publish': 120
+}
+
+def _write_combined(inputs, output_file, csv_file):
+    """Stream every scraped record into the combined JSON document and CSV, one record at a time."""
+    streams = {resource_type: iter(inputs[resource_type]) for resource_type in RESOURCE_TYPE_TAGS}
+    with open_output(str(output_file)) as f:
+        write_document(streams, f, extra={'last_updated': datetime.now().isoformat()})
+
+    rows = (
+        {'resource_type': tag, **record}
+        for resource_type, tag in RESOURCE_TYPE_TAGS.items()
+        for record in inputs[resource_type]
+    )
+    export_records(rows, str(csv_file), 'csv')
+
+def _log_results(stage_name, results):
+    """Log a scraping stage's yield. Empty results are valid and checkpointed like any other."""
+    if not results:
+        logger.warning(f"No {stage_name.replace('_', ' ')} found")
+    else:
+        logger.info(f"Found {len(results)} {stage_name.replace('_', ' ')}")
+    return results or []
+
+async def update_resources(resume=True, profile=False, profile_dir=None):
+    """Update DevRel resources by running the scraper and saving results.
+
+    The GitHub, blog and job stages run concurrently and are checkpointed, so
+    an interrupted or failed run resumes from the stages that already finished.
+    A stage fails only when it raises or times out; a source that yields
+    nothing still lets the combined files be written.
+    With ``profile`` set, per-stage CPU and allocation profiles are written to
+    ``profile_dir``, by default scripts/data/profiles/<timestamp>.
+    """
+    output_dir = Path(__file__).parent.parent / 'data'
+    output_dir.mkdir(exist_ok=True)
+    output_file = output_dir / 'devrel_resources.json'
+    # devrel_resources.csv is maintained by hand with its own columns; the export schema goes to its own file
+    csv_file = output_dir / 'devrel_resources_records.csv'
+    scraper = None
 
-async def update_resources():
-    """Update DevRel resources by running the scraper and saving results."""
     try:
         logger.info("Initializing DevRelScraper...")
         # Initialize scraper
         scraper = DevRelScraper()
+        if profile:
+            scraper.enable_profiling(profile_dir)
 
-        # Run scraping process with detailed progress tracking
-        logger.info("Starting GitHub programs scraping...")
-        try:
-            github_resources = await scraper.get_github_programs_async()
-            logger.info(f"Found {len(github_resources)} GitHub DevRel programs")
-        except Exception as e:
-            logger.error(f"Error fetching GitHub resources: {str(e)}")
-            github_resources = []
-
-        logger.info("Starting blog posts scraping...")
-        try:
-            blog_posts = await scraper.get_blog_posts_async()
-            logger.info(f"Found {len(blog_posts)} blog posts")
-        except Exception as e:
-            logger.error(f"Error fetching blog posts: {str(e)}")
-            blog_posts = []
-
-        logger.info("Starting job listings scraping...")
-        try:
-            job_listings = await scraper.get_job_listings_async()
-            logger.info(f"Found {len(job_listings)} job listings")
-        except Exception as e:
-            logger.error(f"Error fetching job listings: {str(e)}")
-            job_listings = []
-
-        # Combine all resources
-        all_resources = {
-            'github_programs': github_resources,
-            'blog_posts': blog_posts,
-            'job_listings': job_listings,
-            'last_updated': datetime.now().isoformat()
-        }
+        async with aiohttp.ClientSession(headers=scraper.headers, timeout=scraper.timeout) as session:
+            async def github_stage(inputs):
+                logger.info("Starting GitHub programs scraping...")
+                return _log_results('github_programs', await scraper.get_github_programs_async(session))
+
+            async def blog_stage(inputs):
+                logger.info("Starting blog posts scraping...")
+                return _log_results('blog_posts', await scraper.get_blog_posts_async(session))
+
+            async def job_stage(inputs):
+                logger.info("Starting job listings scraping...")
+                return _log_results('job_listings', await scraper.get_job_listings_async())
 
-        # Save to JSON file
-        output_dir = Path(__file__).parent.parent / 'data'
-        output_dir.mkdir(exist_ok=True)
-        output_file = output_dir / 'devrel_resources.json'
+            async def combine_stage(inputs):
+                # Combine all resources without building the documents in memory, off the event loop
+                await asyncio.to_thread(_write_combined, inputs, output_file, csv_file)
 
-        with open(output_file, 'w') as f:
-            json.dump(all_resources, f, indent=2)
+                logger.info(f"Resources saved to {output_file} and {csv_file}")
+                return {key: len(value) for key, value in inputs.items()}
+
+            async def publish_stage(inputs):
+                # Merge this run into stored history and publish the whole of it, as scrape_all and
+                # the CLI publish command do, so the frontend shards never shrink to one run's records.
+                # A failed merge raises, so the stage fails instead of republishing stale data.
+                # Merging stamps and rewrites records in place, and combine serializes the same records
+                # concurrently, so merge a private copy
+                merged = await asyncio.to_thread(scraper.merge_new_resources, copy.deepcopy(inputs))
+                # Saving writes the stored files and snapshots and publishes the shards for the frontend once
+                manifest = await scraper._save_results(merged)
+                if manifest is None:
+                    raise RuntimeError("publishing frontend artifacts failed")
+                return {key: value['count'] for key, value in manifest['types'].items()}
+
+            orchestrator = RunOrchestrator(
+                [
+                    Stage('github_programs', github_stage, timeout=STAGE_TIMEOUTS['github_programs']),
+                    Stage('blog_posts', blog_stage, timeout=STAGE_TIMEOUTS['blog_posts']),
+                    Stage('job_listings', job_stage, timeout=STAGE_TIMEOUTS['job_listings']),
+                    Stage('combine', combine_stage, deps=('github_programs', 'blog_posts', 'job_listings'),
+                          timeout=STAGE_TIMEOUTS['combine']),
+                    Stage('publish', publish_stage, deps=('github_programs', 'blog_posts', 'job_listings'),
+                          timeout=STAGE_TIMEOUTS['publish'])
+                ],
+                checkpoint_dir=str(output_dir / '.checkpoints')
+            )
+            outputs = await orchestrator.run(resume=resume)
 
-        logger.info(f"Resources saved to {output_file}")
         logger.info("Resources updated successfully")
+        counts = outputs['combine']
 
         return {
             "status": "success",
             "message": "Resources updated successfully",
             "data": {
-                "github_programs": len(github_resources),
-                "blog_posts": len(blog_posts),
-                "job_listings": len(job_listings),
-                "output_file": str(output_file)
+                "github_programs": counts['github_programs'],
+                "blog_posts": counts['blog_posts'],
+                "job_listings": counts['job_listings'],
+                "output_file": str(output_file),
+                "csv_file": str(csv_file)
             }
         }
+    except StageError as e:
+        error_msg = f"Error updating resources: {str(e)}. Re-run to resume from the last checkpoint."
+        logger.error(error_msg)
+        return {
+            "status": "error",
+            "message": error_msg,
+            "data": {"run_id": e.run_id, "failed_stages": e.failed}
+        }
     except Exception as e:
         error_msg = f"Error updating resources: {str(e)}"
         logger.error(error_msg)
@@ -89,7 +156,25 @@ async def update_resources():
             "message": error_msg,
             "data": None
         }
+    finally:
+        if scraper is not None:
+            scraper.write_profile()
+
+def main():
+    """Run one resource update from the command line."""
+    parser = argparse.ArgumentParser(description='Scrape DevRel resources and update the combined data files.')
+    parser.add_argument('--fresh', action='store_true', help='Start a new run instead of resuming an unfinished one')
+    parser.add_argument('--profile', nargs='?', const='', default=None, metavar='DIR',
+                        help='Write per-stage CPU and allocation profiles (default: data/profiles/<timestamp>)')
+    parser.add_argument('--watch-loop', nargs='?', type=float, const=100, default=None, metavar='MS',
+                        help='Report event loop stalls longer than MS milliseconds to data/loop_stalls.json')
+    args = parser.parse_args()
+
+    run = update_resources(resume=not args.fresh, profile=args.profile is not None, profile_dir=args.profile or None)
+    if args.watch_loop is not None:
+        run = watch(run, os.path.join(DevRelScraper.default_data_dir(), 'loop_stalls.json'),
+                    threshold=args.watch_loop / 1000)
+    asyncio.run(run)
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(update_resources())
+    main()
@@ -2,12 +2,25 @@ import { NextResponse } from 'next/server'
 
 export const dynamic = 'force-dynamic'
 
+const RESOURCE_SERVICE_URL = process.env.RESOURCE_SERVICE_URL
+
 export async function POST() {
-  return NextResponse.json(
-    {
-      error: 'Resource scraping is not available via the API.',
-      message: 'The scraper needs to be run manually via the Python script. Run: python3 scripts/scraper/devrel_scraper.py',
-    },
-    { status: 501 }
-  )
+  if (!RESOURCE_SERVICE_URL) {
+    return NextResponse.json(
+      {
+        error: 'Resource scraping is not available via the API.',
+        message: 'Set RESOURCE_SERVICE_URL to a running resource service (python -m scraper.service), or run the scraper manually: python3 scripts/scraper/devrel_scraper.py',
+      },
+      { status: 501 }
+    )
+  }
+
+  try {
+    const response = await fetch(`${RESOURCE_SERVICE_URL.replace(/\/$/, '')}/refresh`, { method: 'POST' })
+    const body = await response.json()
+    return NextResponse.json(body, { status: response.status })
+  } catch (error) {
+    console.error('Error queueing resource refresh:', error)
+    return NextResponse.json({ error: 'Resource service unavailable' }, { status: 502 })
+  }
 }
@@ -0,0 +1,6 @@
+"""
+DevRel visualizations rendered from the scraper's stored resources.
+"""
+from .runner import CHARTS, render_all, render_chart
+
+__all__ = ['CHARTS', 'render_all', 'render_chart']
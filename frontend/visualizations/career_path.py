@@ -0,0 +1,77 @@
+"""
+Career path chart: DevRel job openings by seniority level and role family.
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .common import PALETTE, classify_role_family, save_figure
+from .runner import render_chart
+
+CODE_VERSION = 1
+
+INPUTS = {'job_listings': ('title', 'company')}
+
+# Seniority levels from the bottom of the ladder up
+LEVELS = ['Entry', 'Mid', 'Senior', 'Staff / Principal', 'Leadership']
+
+# Title patterns per level, checked from the most senior down so 'Senior Manager' is Leadership
+LEVEL_PATTERNS = [
+    ('Leadership', r'\b(?:manager|head|director|vp|vice president|chief)\b'),
+    ('Staff / Principal', r'\b(?:staff|principal|lead)\b'),
+    ('Senior', r'\b(?:senior|sr)\b'),
+    ('Entry', r'\b(?:junior|jr|associate|intern|graduate)\b')
+]
+
+
+def classify_level(titles: pd.Series) -> pd.Series:
+    """Map job titles to a seniority level, defaulting to 'Mid'."""
+    lowered = titles.fillna('').astype(str).str.lower()
+    conditions = [lowered.str.contains(pattern, regex=True) for _, pattern in LEVEL_PATTERNS]
+    return pd.Series(np.select(conditions, [level for level, _ in LEVEL_PATTERNS], default='Mid'), index=titles.index)
+
+
+def compute(frames: Dict[str, pd.DataFrame]) -> Dict:
+    """Count openings per (level, role family)."""
+    jobs = frames['job_listings']
+    levels = classify_level(jobs['title'])
+    families = classify_role_family(jobs['title'])
+    counts = pd.crosstab(levels, families)
+    family_order = counts.sum(axis=0).sort_values(ascending=False).index.tolist()
+    counts = counts.reindex(index=LEVELS, columns=family_order, fill_value=0)
+    return {
+        'levels': LEVELS,
+        'families': family_order,
+        'counts': counts.to_numpy().tolist(),
+        'level_totals': counts.sum(axis=1).tolist(),
+        'companies_per_level': jobs.groupby(levels)['company'].nunique().reindex(LEVELS, fill_value=0).tolist(),
+        'total': int(len(jobs))
+    }
+
+
+def render(aggregates: Dict, output_dir: str) -> List[str]:
+    """Render the ladder as stacked horizontal bars, entry level at the bottom."""
+    import matplotlib.pyplot as plt
+
+    counts = np.asarray(aggregates['counts'], dtype=float).reshape(len(aggregates['levels']), -1)
+    fig, ax = plt.subplots(figsize=(10, 5))
+    left = np.zeros(len(aggregates['levels']))
+    for index, family in enumerate(aggregates['families']):
+        ax.barh(aggregates['levels'], counts[:, index], left=left, label=family,
+                color=PALETTE[index % len(PALETTE)])
+        left += counts[:, index]
+    for y, (total, companies) in enumerate(zip(aggregates['level_totals'], aggregates['companies_per_level'])):
+        if total:
+            ax.text(left[y] + 0.2, y, f'{total} roles, {companies} companies', va='center', fontsize=8)
+    ax.set_xlabel('Open roles')
+    ax.set_title(f"DevRel career path ({aggregates['total']} job listings)")
+    if aggregates['families']:
+        ax.legend(loc='lower right', fontsize=8, frameon=False)
+    ax.spines[['top', 'right']].set_visible(False)
+    return [save_figure(fig, output_dir, 'career_path')]
+
+
+def generate_career_path(output_dir: Optional[str] = None, data_dir: Optional[str] = None) -> List[str]:
+    """Render the career path chart, returning the written paths."""
+    return render_chart('career_path', output_dir, data_dir)
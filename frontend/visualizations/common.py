@@ -0,0 +1,139 @@
+"""
+Shared data loading and output helpers for the visualizations.
+
+Charts read the resources stored by the scraper, falling back to the data
+committed in ``frontend/data``. When pyarrow is installed and a columnar
+snapshot exists, only the columns a chart needs are read from the
+memory-mapped Arrow file; otherwise the JSON results are loaded.
+"""
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Searched in order when no data directory is given
+DEFAULT_DATA_DIRS = (
+    Path(__file__).parent.parent / 'scripts' / 'data',
+    Path(__file__).parent.parent / 'data'
+)
+DEFAULT_OUTPUT_DIR = Path(__file__).parent.parent / 'static' / 'visualizations'
+
+# JSON results written by the scraper for each resource type
+RESULT_FILES = {
+    'github_programs': 'github_results.json',
+    'blog_posts': 'blog_results.json',
+    'job_listings': 'job_results.json'
+}
+
+# Bump when loading, classification or styling shared by every chart changes
+COMMON_VERSION = 1
+
+# Role families matched against job titles, first match wins
+ROLE_FAMILIES = {
+    'Developer Relations': r'developer relations|devrel|dev rel',
+    'Advocacy': r'advoca',
+    'Evangelism': r'evangel',
+    'Developer Experience': r'developer experience|\bdx\b',
+    'Education': r'educat',
+    'Community': r'community'
+}
+
+PALETTE = ['#6366f1', '#22c55e', '#f59e0b', '#ef4444', '#06b6d4', '#a855f7', '#64748b']
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def input_path(resource_type: str, data_dir: Optional[str] = None) -> Path:
+    """Get the file a resource type is read from: its Arrow snapshot if readable, else its JSON results."""
+    data_dirs = [Path(data_dir)] if data_dir else DEFAULT_DATA_DIRS
+    for directory in data_dirs:
+        snapshot = directory / 'snapshots' / f'{resource_type}.arrow'
+        if snapshot.exists() and _has_pyarrow():
+            return snapshot
+        results = directory / RESULT_FILES[resource_type]
+        if results.exists():
+            return results
+    return data_dirs[0] / RESULT_FILES[resource_type]
+
+
+def file_digest(path: Path) -> str:
+    """Get the SHA-256 of a file's contents, or 'missing' if it does not exist."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return 'missing'
+    return digest.hexdigest()
+
+
+def load_frame(resource_type: str, columns: Sequence[str], data_dir: Optional[str] = None) -> pd.DataFrame:
+    """Load the given columns of a resource type as a DataFrame; absent columns are all-null."""
+    path = input_path(resource_type, data_dir)
+    if not path.exists():
+        logger.warning(f"No stored {resource_type} found at {path}")
+        return pd.DataFrame(columns=list(columns))
+
+    if path.suffix == '.arrow':
+        import pyarrow as pa
+        with pa.memory_map(str(path), 'r') as source:
+            table = pa.ipc.open_file(source).read_all()
+        frame = table.select([column for column in columns if column in table.column_names]).to_pandas()
+        # Arrow list columns arrive as ndarrays; use lists like the JSON path does
+        for column in frame.columns:
+            if frame[column].dtype == object:
+                frame[column] = frame[column].map(lambda v: v.tolist() if isinstance(v, np.ndarray) else v)
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            frame = pd.DataFrame.from_records(json.load(f))
+    return frame.reindex(columns=list(columns))
+
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """Parse the scraper's date strings, mapping unparseable values to NaT."""
+    return pd.to_datetime(values, errors='coerce', format='mixed')
+
+
+def classify_role_family(titles: pd.Series) -> pd.Series:
+    """Map job titles to a role family from ROLE_FAMILIES, or 'Other'."""
+    lowered = titles.fillna('').astype(str).str.lower()
+    conditions = [lowered.str.contains(pattern, regex=True) for pattern in ROLE_FAMILIES.values()]
+    return pd.Series(np.select(conditions, list(ROLE_FAMILIES), default='Other'), index=titles.index)
+
+
+def write_json(data: Dict[str, Any], output_dir: str, name: str) -> str:
+    """Atomically write a chart's aggregates next to its image and return the path."""
+    path = os.path.join(output_dir, f'{name}.json')
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+    return path
+
+
+def save_figure(fig, output_dir: str, name: str) -> str:
+    """Save a figure as PNG, close it and return the path."""
+    import matplotlib.pyplot as plt
+    path = os.path.join(output_dir, f'{name}.png')
+    tmp_path = f"{path}.tmp.png"
+    fig.savefig(tmp_path, dpi=150, bbox_inches='tight')
+    plt.close(fig)
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,87 @@
+"""
+Community graph: co-occurrence network of the topics on DevRel GitHub programs.
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .common import PALETTE, save_figure
+from .runner import render_chart
+
+CODE_VERSION = 1
+
+INPUTS = {'github_programs': ('url', 'topics', 'stars')}
+
+# Number of most frequent topics drawn as nodes
+MAX_TOPICS = 25
+
+# Minimum number of shared repositories for an edge to be drawn
+MIN_EDGE_WEIGHT = 2
+
+
+def compute(frames: Dict[str, pd.DataFrame]) -> Dict:
+    """Build topic nodes and co-occurrence edges from a repository/topic incidence matrix."""
+    programs = frames['github_programs']
+    programs = programs.assign(stars=pd.to_numeric(programs['stars'], errors='coerce').fillna(0))
+    pairs = programs[['url', 'topics', 'stars']].explode('topics').dropna(subset=['topics'])
+    pairs = pairs.drop_duplicates(subset=['url', 'topics']).reset_index(drop=True)
+
+    top_topics = pairs['topics'].value_counts().head(MAX_TOPICS).index
+    pairs = pairs[pairs['topics'].isin(top_topics)]
+    if pairs.empty:
+        return {'nodes': [], 'edges': [], 'repositories': int(len(programs))}
+
+    # Incidence matrix (repositories x topics); its Gram matrix counts shared repositories
+    incidence = pd.crosstab(pairs['url'], pairs['topics']).clip(upper=1).reindex(columns=top_topics, fill_value=0)
+    matrix = incidence.to_numpy(dtype=np.int64)
+    cooccurrence = matrix.T @ matrix
+    stars = pairs.groupby('topics')['stars'].sum().reindex(top_topics, fill_value=0)
+
+    upper = np.triu(cooccurrence, k=1)
+    sources, targets = np.nonzero(upper >= MIN_EDGE_WEIGHT)
+    return {
+        'nodes': [
+            {'topic': topic, 'repositories': int(cooccurrence[i, i]), 'stars': int(stars.iloc[i])}
+            for i, topic in enumerate(top_topics)
+        ],
+        'edges': [
+            {'source': top_topics[s], 'target': top_topics[t], 'weight': int(upper[s, t])}
+            for s, t in zip(sources, targets)
+        ],
+        'repositories': int(len(programs))
+    }
+
+
+def render(aggregates: Dict, output_dir: str) -> List[str]:
+    """Draw the topics on a circle, sized by repositories, with edges weighted by co-occurrence."""
+    import matplotlib.pyplot as plt
+
+    nodes = aggregates['nodes']
+    fig, ax = plt.subplots(figsize=(9, 9))
+    ax.set_axis_off()
+    ax.set_title(f"Topic community graph ({aggregates['repositories']} repositories)")
+    if not nodes:
+        return [save_figure(fig, output_dir, 'community_graph')]
+
+    angles = np.linspace(0, 2 * np.pi, len(nodes), endpoint=False)
+    positions = {node['topic']: (np.cos(a), np.sin(a)) for node, a in zip(nodes, angles)}
+    max_weight = max((edge['weight'] for edge in aggregates['edges']), default=1)
+    for edge in aggregates['edges']:
+        (x0, y0), (x1, y1) = positions[edge['source']], positions[edge['target']]
+        ax.plot([x0, x1], [y0, y1], color=PALETTE[-1], alpha=0.25 + 0.5 * edge['weight'] / max_weight,
+                linewidth=0.5 + 3 * edge['weight'] / max_weight, zorder=1)
+
+    sizes = np.array([node['repositories'] for node in nodes], dtype=float)
+    xs, ys = zip(*(positions[node['topic']] for node in nodes))
+    ax.scatter(xs, ys, s=80 + 900 * sizes / sizes.max(), color=PALETTE[0], zorder=2)
+    for node, x, y in zip(nodes, xs, ys):
+        ax.annotate(node['topic'], (x * 1.12, y * 1.12), ha='center', va='center', fontsize=8)
+    ax.set_xlim(-1.35, 1.35)
+    ax.set_ylim(-1.35, 1.35)
+    return [save_figure(fig, output_dir, 'community_graph')]
+
+
+def generate_community_graph(output_dir: Optional[str] = None, data_dir: Optional[str] = None) -> List[str]:
+    """Render the community graph, returning the written paths."""
+    return render_chart('community_graph', output_dir, data_dir)
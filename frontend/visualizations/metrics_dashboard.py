@@ -0,0 +1,106 @@
+"""
+Metrics dashboard: headline counts and distributions across all stored resources.
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .common import PALETTE, parse_dates, save_figure
+from .runner import render_chart
+
+CODE_VERSION = 1
+
+INPUTS = {
+    'github_programs': ('stars', 'language'),
+    'blog_posts': ('date',),
+    'job_listings': ('date', 'company')
+}
+
+TOP_N = 10
+
+
+def _monthly_counts(dates: pd.Series) -> Dict[str, int]:
+    months = parse_dates(dates).dropna().dt.strftime('%Y-%m')
+    return {month: int(count) for month, count in months.value_counts().sort_index().items()}
+
+
+def compute(frames: Dict[str, pd.DataFrame]) -> Dict:
+    """Aggregate star, language, publishing and hiring metrics."""
+    programs = frames['github_programs']
+    stars = pd.to_numeric(programs['stars'], errors='coerce').fillna(0).to_numpy(dtype=np.int64)
+    languages = (
+        pd.Series(stars, index=programs.index).groupby(programs['language'].fillna('Unknown').replace('', 'Unknown'))
+        .sum().sort_values(ascending=False).head(TOP_N)
+    )
+    # Star counts span orders of magnitude, so bin them on a log scale
+    edges = np.unique(np.concatenate([[0], np.logspace(0, np.log10(max(stars.max(initial=0), 10)) + 0.5, 8).round()]))
+    histogram, _ = np.histogram(stars, bins=edges)
+
+    jobs = frames['job_listings']
+    companies = jobs['company'].fillna('').replace('', np.nan).dropna().value_counts().head(TOP_N)
+
+    return {
+        'totals': {
+            'github_programs': int(len(programs)),
+            'blog_posts': int(len(frames['blog_posts'])),
+            'job_listings': int(len(jobs)),
+            'stars': int(stars.sum()),
+            'median_stars': float(np.median(stars)) if len(stars) else 0.0,
+            'hiring_companies': int(jobs['company'].nunique())
+        },
+        'stars_by_language': {language: int(total) for language, total in languages.items()},
+        'stars_histogram': {'edges': edges.astype(int).tolist(), 'counts': histogram.tolist()},
+        'blog_posts_per_month': _monthly_counts(frames['blog_posts']['date']),
+        'jobs_per_month': _monthly_counts(jobs['date']),
+        'top_hiring_companies': {company: int(count) for company, count in companies.items()}
+    }
+
+
+def render(aggregates: Dict, output_dir: str) -> List[str]:
+    """Render a 2x2 dashboard with the headline totals in the title."""
+    import matplotlib.pyplot as plt
+
+    totals = aggregates['totals']
+    fig, axes = plt.subplots(2, 2, figsize=(14, 9))
+    fig.suptitle(
+        f"{totals['github_programs']} programs ({totals['stars']:,} stars) - "
+        f"{totals['blog_posts']} blog posts - {totals['job_listings']} jobs at {totals['hiring_companies']} companies"
+    )
+
+    ax = axes[0, 0]
+    languages = aggregates['stars_by_language']
+    ax.barh(list(languages)[::-1], list(languages.values())[::-1], color=PALETTE[0])
+    ax.set_title('Stars by language')
+
+    ax = axes[0, 1]
+    edges, counts = aggregates['stars_histogram']['edges'], aggregates['stars_histogram']['counts']
+    labels = [f'{low:,}-{high:,}' for low, high in zip(edges[:-1], edges[1:])]
+    ax.bar(labels, counts, color=PALETTE[1])
+    ax.set_title('Repositories by star count')
+    ax.tick_params(axis='x', rotation=45, labelsize=7)
+
+    ax = axes[1, 0]
+    blogs, jobs = aggregates['blog_posts_per_month'], aggregates['jobs_per_month']
+    months = sorted(set(blogs) | set(jobs))
+    positions = np.arange(len(months))
+    ax.bar(positions - 0.2, [blogs.get(month, 0) for month in months], width=0.4, label='Blog posts', color=PALETTE[2])
+    ax.bar(positions + 0.2, [jobs.get(month, 0) for month in months], width=0.4, label='Job listings', color=PALETTE[3])
+    ax.set_xticks(positions, months, rotation=45, fontsize=7)
+    ax.set_title('Published per month')
+    ax.legend(frameon=False, fontsize=8)
+
+    ax = axes[1, 1]
+    companies = aggregates['top_hiring_companies']
+    ax.barh(list(companies)[::-1], list(companies.values())[::-1], color=PALETTE[4])
+    ax.set_title('Top hiring companies')
+
+    for ax in axes.flat:
+        ax.spines[['top', 'right']].set_visible(False)
+    fig.tight_layout()
+    return [save_figure(fig, output_dir, 'metrics_dashboard')]
+
+
+def generate_metrics_dashboard(output_dir: Optional[str] = None, data_dir: Optional[str] = None) -> List[str]:
+    """Render the metrics dashboard, returning the written paths."""
+    return render_chart('metrics_dashboard', output_dir, data_dir)
@@ -0,0 +1,130 @@
+"""
+Parallel, cached rendering of the visualizations.
+
+Each chart module declares the resource columns it reads (``INPUTS``), a
+``CODE_VERSION``, a vectorized ``compute`` step and a ``render`` step. Charts
+whose input digest and code versions match the last render are skipped; the
+rest are rendered in parallel, one process per chart.
+"""
+import hashlib
+import importlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from .common import COMMON_VERSION, DEFAULT_OUTPUT_DIR, file_digest, input_path, load_frame, write_json
+
+logger = logging.getLogger(__name__)
+
+CHARTS = ('career_path', 'community_graph', 'metrics_dashboard', 'skills_matrix')
+
+CACHE_FILE = '.render_cache.json'
+
+
+def chart_module(name: str):
+    return importlib.import_module(f'{__package__}.{name}')
+
+
+def chart_digest(name: str, input_digests: Dict[str, str]) -> str:
+    """Hash a chart's code versions and the digests of the inputs it reads."""
+    module = chart_module(name)
+    parts = [name, f'code:{module.CODE_VERSION}', f'common:{COMMON_VERSION}']
+    parts += [f'{resource_type}:{input_digests[resource_type]}' for resource_type in sorted(module.INPUTS)]
+    return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+
+def render_chart(name: str, output_dir: Optional[str] = None, data_dir: Optional[str] = None) -> List[str]:
+    """Load a chart's inputs, compute its aggregates and render it.
+
+    Returns:
+        Paths of the written aggregates JSON and image files
+    """
+    output_dir = str(output_dir or DEFAULT_OUTPUT_DIR)
+    os.makedirs(output_dir, exist_ok=True)
+    module = chart_module(name)
+    frames = {
+        resource_type: load_frame(resource_type, columns, data_dir)
+        for resource_type, columns in module.INPUTS.items()
+    }
+    aggregates = module.compute(frames)
+    return [write_json(aggregates, output_dir, name)] + module.render(aggregates, output_dir)
+
+
+def _load_cache(path: str) -> Dict[str, Dict]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.error(f"Error reading render cache {path}: {str(e)}")
+        return {}
+
+
+def _save_cache(path: str, cache: Dict[str, Dict]):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def render_all(output_dir: Optional[str] = None, data_dir: Optional[str] = None,
+               charts: Iterable[str] = CHARTS, workers: Optional[int] = None,
+               force: bool = False) -> Dict[str, str]:
+    """Render every stale chart in parallel.
+
+    Args:
+        output_dir: Directory for chart images and aggregates
+        data_dir: Directory holding the scraper's stored resources
+        charts: Names of the charts to consider
+        workers: Maximum number of render processes (defaults to one per stale chart)
+        force: Render even when the cache says a chart is up to date
+
+    Returns:
+        Dictionary mapping chart names to 'rendered', 'cached' or 'failed'
+    """
+    output_dir = str(output_dir or DEFAULT_OUTPUT_DIR)
+    os.makedirs(output_dir, exist_ok=True)
+    cache_path = os.path.join(output_dir, CACHE_FILE)
+    cache = _load_cache(cache_path)
+
+    charts = list(charts)
+    resource_types = {resource_type for name in charts for resource_type in chart_module(name).INPUTS}
+    input_digests = {resource_type: file_digest(input_path(resource_type, data_dir)) for resource_type in resource_types}
+
+    status = {}
+    stale = {}
+    for name in charts:
+        digest = chart_digest(name, input_digests)
+        entry = cache.get(name, {})
+        outputs = entry.get('outputs', [])
+        if not force and entry.get('digest') == digest and outputs and all(os.path.exists(path) for path in outputs):
+            status[name] = 'cached'
+            logger.info(f"Skipping {name}: inputs and code unchanged since {entry.get('rendered_at')}")
+        else:
+            stale[name] = digest
+
+    if stale:
+        with ProcessPoolExecutor(max_workers=workers or len(stale)) as executor:
+            futures = {name: executor.submit(render_chart, name, output_dir, data_dir) for name in stale}
+            for name, future in futures.items():
+                try:
+                    outputs = future.result()
+                except Exception as e:
+                    logger.error(f"Error rendering {name}: {str(e)}")
+                    status[name] = 'failed'
+                    cache.pop(name, None)
+                    continue
+                cache[name] = {
+                    'digest': stale[name],
+                    'outputs': outputs,
+                    'rendered_at': datetime.now().isoformat()
+                }
+                status[name] = 'rendered'
+                logger.info(f"Rendered {name}: {', '.join(os.path.basename(path) for path in outputs)}")
+
+    _save_cache(cache_path, cache)
+    return status
@@ -0,0 +1,77 @@
+"""
+Skills matrix: share of DevRel job listings in each role family that mention a skill.
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .common import classify_role_family, save_figure
+from .runner import render_chart
+
+CODE_VERSION = 1
+
+INPUTS = {'job_listings': ('title', 'description', 'tags')}
+
+# Skill name and the pattern matched against title, description and tags
+SKILLS = {
+    'Public speaking': r'public speaking|conference|talks?\b|speaker|present',
+    'Technical writing': r'technical writing|blog|documentation|docs\b|tutorial',
+    'Video / streaming': r'video|youtube|livestream|streaming|podcast',
+    'Community building': r'community|meetup|ambassador|forum|discord',
+    'APIs / SDKs': r'\bapis?\b|\bsdks?\b|rest\b|graphql',
+    'Cloud / DevOps': r'cloud|aws|azure|gcp|kubernetes|docker|devops',
+    'AI / ML': r'\bai\b|machine learning|\bml\b|\bllms?\b|generative',
+    'JavaScript / TypeScript': r'javascript|typescript|node\.?js|react',
+    'Python': r'python',
+    'Go / Rust / Java': r'\bgolang\b|\bgo\b|rust|java\b',
+    'Product feedback': r'product feedback|roadmap|voice of the developer|feedback loop',
+    'Metrics / analytics': r'metrics|kpis?\b|analytics|measure'
+}
+
+
+def compute(frames: Dict[str, pd.DataFrame]) -> Dict:
+    """Compute the percentage of listings per role family mentioning each skill."""
+    jobs = frames['job_listings']
+    tags = jobs['tags'].map(lambda value: ' '.join(value) if isinstance(value, list) else '')
+    text = (jobs['title'].fillna('') + ' ' + jobs['description'].fillna('') + ' ' + tags).str.lower()
+    mentions = pd.DataFrame({skill: text.str.contains(pattern, regex=True) for skill, pattern in SKILLS.items()})
+    families = classify_role_family(jobs['title'])
+
+    share = mentions.groupby(families).mean().mul(100).round(1)
+    listings = families.value_counts()
+    share = share.loc[listings.index]
+    overall = mentions.mean().mul(100).round(1) if len(jobs) else pd.Series(0.0, index=list(SKILLS))
+    return {
+        'skills': list(SKILLS),
+        'families': share.index.tolist(),
+        'listings_per_family': [int(listings[family]) for family in share.index],
+        'percent': share.to_numpy().tolist(),
+        'overall_percent': overall.tolist()
+    }
+
+
+def render(aggregates: Dict, output_dir: str) -> List[str]:
+    """Render the matrix as an annotated heatmap with an 'All listings' row."""
+    import matplotlib.pyplot as plt
+
+    rows = [f'{family} ({count})' for family, count in
+            zip(aggregates['families'], aggregates['listings_per_family'])] + ['All listings']
+    values = np.vstack([np.asarray(aggregates['percent'], dtype=float).reshape(-1, len(aggregates['skills'])),
+                        np.asarray(aggregates['overall_percent'], dtype=float)])
+
+    fig, ax = plt.subplots(figsize=(13, 1.2 + 0.5 * len(rows)))
+    image = ax.imshow(values, cmap='Purples', vmin=0, vmax=100, aspect='auto')
+    ax.set_xticks(np.arange(len(aggregates['skills'])), aggregates['skills'], rotation=35, ha='right', fontsize=8)
+    ax.set_yticks(np.arange(len(rows)), rows, fontsize=8)
+    for (y, x), value in np.ndenumerate(values):
+        ax.text(x, y, f'{value:.0f}%', ha='center', va='center', fontsize=7,
+                color='white' if value > 60 else 'black')
+    ax.set_title('Skills mentioned in DevRel job listings')
+    fig.colorbar(image, ax=ax, label='% of listings')
+    return [save_figure(fig, output_dir, 'skills_matrix')]
+
+
+def generate_skills_matrix(output_dir: Optional[str] = None, data_dir: Optional[str] = None) -> List[str]:
+    """Render the skills matrix, returning the written paths."""
+    return render_chart('skills_matrix', output_dir, data_dir)